@@ -0,0 +1,386 @@
+"""
+Benchmarks de desempenho dos operadores, da fitness e de gerações completas.
+
+Uso::
+
+    python -m src.benchmark                                   # N = 10, 100, 1000, 5000
+    python -m src.benchmark --sizes 10 100 --only crossover -o out/bench/atual.json
+    python -m src.benchmark --baseline out/bench/base.json --threshold 0.25
+
+Cada caso roda sobre uma instância sorteada com semente fixa (pontos com
+coordenadas reais, produtos e depósito central) e mede:
+
+- ``ns_per_op``: mediana de ``--repeats`` lotes cronometrados (o tamanho do
+  lote é calibrado para ``--min-time`` segundos no total) e ``ns_per_op_min``;
+- ``peak_bytes``: pico de memória alocada (tracemalloc) durante uma chamada;
+- ``retained_bytes``: memória que continua alocada após a chamada.
+
+A medição de memória é feita em uma chamada separada, porque o tracemalloc
+deixa o código várias vezes mais lento. Os resultados vão para um JSON (com
+versões, plataforma e semente). Com ``--baseline``, cada caso é comparado ao
+mesmo ``(nome, N)`` do arquivo de referência e é marcado como regressão se o
+tempo (ou o pico de memória, acima de ``MIN_PEAK_BYTES``) passar de
+``1 + threshold`` vezes o de referência; nesse caso o código de saída é 1.
+
+Nos casos de seleção, N é o tamanho da população; nos lotes
+(``crossover_batch``, ``fitness.evaluate_population``) cada operação processa
+``BATCH`` cromossomos; nos de geração, a população é ``GENERATION_POPULATION``.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows: sem pico de RSS do processo
+    resource = None
+
+# adiciona 'src' e subpastas para imports relativos (domain/functions)
+src_dir = os.path.dirname(os.path.abspath(__file__))
+for _path in (src_dir, os.path.join(src_dir, "domain"), os.path.join(src_dir, "functions")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from delivery_point import DeliveryPoint
+from distance_provider import DistanceProvider
+from population import Population
+from product import Product
+from route import Route
+from vehicle import default_fleet
+from crossover_function import Crossover
+from index_crossover import IndexCrossover
+from mutation_function import Mutation
+from selection_functions import Selection
+from fitness_function import FitnessFunction
+from main.solver_engine import GAConfig, GeneticEngine
+
+SIZES = (10, 100, 1000, 5000)
+BATCH = 32
+GENERATION_POPULATION = 50
+MIN_PEAK_BYTES = 64 * 1024
+
+
+@dataclass
+class BenchResult:
+    """Medidas de um caso em um tamanho de instância."""
+    name: str
+    group: str
+    n: int
+    ns_per_op: float
+    ns_per_op_min: float
+    number: int
+    repeats: int
+    peak_bytes: int
+    retained_bytes: int
+
+
+# ---------------------------
+# Instâncias
+# ---------------------------
+
+def make_instance(n: int, seed: int = 0) -> Tuple[List[DeliveryPoint], DeliveryPoint]:
+    """``n`` pontos em um mapa 800 x 600 com produtos variados e depósito central."""
+    rng = np.random.default_rng(seed)
+    xy = rng.uniform((0, 0), (800, 600), size=(n, 2))
+    weights = rng.integers(100, 2000, n)
+    dims = rng.integers(5, 30, (n, 3))
+    priorities = np.where(rng.random(n) < 0.2, 0.5, 0.0)
+    points = [DeliveryPoint(float(x), float(y), Product(f"P{i}", int(w), *map(int, d), priority=float(p)))
+              for i, ((x, y), w, d, p) in enumerate(zip(xy, weights, dims, priorities))]
+    return points, DeliveryPoint(400.0, 300.0, None)
+
+
+class Fixture:
+    """Dados compartilhados pelos casos de um tamanho (instância, pais, população)."""
+
+    def __init__(self, n: int, seed: int):
+        self.n = n
+        self.seed = seed
+        self.points, self.depot = make_instance(n, seed)
+        self.provider = DistanceProvider(self.points, self.depot)
+        self.fleet = default_fleet()
+        self.np_rng = np.random.default_rng(seed)
+        self.py_rng = random.Random(seed)
+        self.genes = Population.random(self.points, 2 * BATCH, rng=self.np_rng).genes
+        self.parent1 = Route([self.points[i] for i in self.genes[0].tolist()])
+        self.parent2 = Route([self.points[i] for i in self.genes[1].tolist()])
+        self.aptitudes = self.np_rng.random(n) + 1e-3
+        self.routes = [Route(self.points[:3]) for _ in range(n)]
+
+    def engine(self, **config) -> GeneticEngine:
+        engine = GeneticEngine(self.points, self.depot, self.fleet,
+                               GAConfig(population_size=GENERATION_POPULATION, seed=self.seed, **config),
+                               provider=self.provider)
+        engine.run_generation()
+        return engine
+
+
+# ---------------------------
+# Casos
+# ---------------------------
+
+CaseFactory = Callable[[Fixture], Callable[[], object]]
+
+
+def _route_crossover(method: Callable) -> CaseFactory:
+    return lambda f: lambda: method(f.parent1, f.parent2, rng=f.py_rng)
+
+
+def _batch_crossover(method: Callable, seeded: bool = False, **kwargs) -> CaseFactory:
+    def factory(f: Fixture):
+        A, B = f.genes[:BATCH], f.genes[BATCH:2 * BATCH]
+        call_kwargs = dict(kwargs, rng=f.np_rng) if seeded else kwargs
+        return lambda: method(A, B, **call_kwargs)
+    return factory
+
+
+def _mutation(method: Callable) -> CaseFactory:
+    return lambda f: lambda: method(f.parent1, rng=f.py_rng)
+
+
+def _route_selection(method: Callable, *args) -> CaseFactory:
+    return lambda f: lambda: method(f.routes, f.aptitudes.tolist(), *args, rng=f.py_rng)
+
+
+def _batch_selection(method: Callable, *args) -> CaseFactory:
+    return lambda f: lambda: method(f.aptitudes, f.n, *args, rng=f.np_rng)
+
+
+def _generation(**config) -> CaseFactory:
+    def factory(f: Fixture):
+        # cada operação parte da mesma população: o custo do split depende da
+        # qualidade dos tours, então uma população que evolui entre as chamadas
+        # tornaria as medições incomparáveis entre execuções
+        engine = f.engine(**config)
+        template = engine.population
+        rows = np.arange(len(template))
+        best_row = engine._best_row
+
+        def step():
+            engine.population = template.take(rows)
+            engine._best_row = best_row
+            engine.run_generation()
+        return step
+    return factory
+
+
+def _evaluate_population(f: Fixture):
+    genes = f.genes[:BATCH]
+    return lambda: FitnessFunction.evaluate_population(genes, f.provider, f.fleet)
+
+
+CASES: Dict[str, Tuple[str, CaseFactory]] = {
+    "crossover.pmx": ("crossover", _route_crossover(Crossover.crossover_parcialmente_mapeado_pmx)),
+    "crossover.ox1": ("crossover", _route_crossover(Crossover.crossover_ordenado_ox1)),
+    "crossover.ox": ("crossover", _route_crossover(Crossover.order_crossover)),
+    "crossover.ox_v2": ("crossover", _route_crossover(Crossover.order_crossover_v2)),
+    "crossover.cx": ("crossover", lambda f: lambda: Crossover.crossover_de_ciclo_cx(f.parent1, f.parent2)),
+    "crossover.kpoint": ("crossover", _route_crossover(Crossover.crossover_multiplos_pontos_kpoint)),
+    "crossover.erx": ("crossover", _route_crossover(Crossover.erx_crossover)),
+    "crossover.erx_pair": ("crossover", _route_crossover(Crossover.erx_crossover_pair)),
+    "crossover_batch.pmx": ("crossover_batch", _batch_crossover(IndexCrossover.pmx_batch, seeded=True)),
+    "crossover_batch.ox1": ("crossover_batch", _batch_crossover(IndexCrossover.ox1_batch, seeded=True)),
+    "crossover_batch.cx": ("crossover_batch", _batch_crossover(IndexCrossover.cycle_crossover_batch)),
+    "crossover_batch.kpoint": ("crossover_batch", _batch_crossover(IndexCrossover.kpoint_batch, seeded=True, k=2)),
+    "crossover_batch.erx": ("crossover_batch", _batch_crossover(IndexCrossover.erx_batch, seeded=True)),
+    "mutation.swap": ("mutation", _mutation(Mutation.mutacao_por_troca)),
+    "mutation.inverse": ("mutation", _mutation(Mutation.mutacao_por_inversao)),
+    "mutation.shuffle": ("mutation", _mutation(Mutation.mutacao_por_embaralhamento)),
+    "selection.tournament": ("selection", _route_selection(Selection.tournament, 3)),
+    "selection.roulette": ("selection", _route_selection(Selection.roulette)),
+    "selection.rank": ("selection", _route_selection(Selection.rank)),
+    "selection.roulette_batch": ("selection", _batch_selection(Selection.roulette_batch)),
+    "selection.rank_batch": ("selection", _batch_selection(Selection.rank_batch)),
+    "selection.sus": ("selection", _batch_selection(Selection.sus)),
+    "selection.tournament_batch": ("selection", _batch_selection(Selection.tournament_batch, 3)),
+    "fitness.constraints": ("fitness", lambda f: lambda: FitnessFunction.calculate_fitness_with_constraints(f.parent1)),
+    "fitness.fleet": ("fitness", lambda f: lambda: FitnessFunction.calculate_fitness_with_fleet(f.parent1, f.depot,
+                                                                                                   f.fleet, f.provider)),
+    "fitness.evaluate_population": ("fitness", _evaluate_population),
+    "generation.generational": ("generation", _generation(cache_size=0)),
+    "generation.steady_state": ("generation", _generation(cache_size=0, replacement="steady_state",
+                                                          steady_state_offspring=10)),
+}
+
+
+# ---------------------------
+# Medição
+# ---------------------------
+
+def measure(fn: Callable[[], object], min_time: float = 0.2, repeats: int = 5) -> Tuple[float, float, int, int, int]:
+    """Cronometra ``fn`` e mede sua memória.
+
+    Returns:
+        ``(ns_mediana, ns_mínimo, chamadas_por_lote, pico_bytes, retidos_bytes)``.
+    """
+    start = time.perf_counter_ns()
+    fn()                                      # aquecimento e calibração
+    single = max(time.perf_counter_ns() - start, 1)
+    number = max(1, int(min_time * 1e9 / repeats / single))
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter_ns() - start) / number)
+
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    after, peak = tracemalloc.get_traced_memory()
+    del result
+    if not tracing:
+        tracemalloc.stop()
+    return statistics.median(samples), min(samples), number, max(0, peak - before), max(0, after - before)
+
+
+def run_benchmarks(sizes: Sequence[int] = SIZES, only: Optional[str] = None, seed: int = 0,
+                   min_time: float = 0.2, repeats: int = 5,
+                   progress: Optional[Callable[[BenchResult], None]] = None) -> List[BenchResult]:
+    """Executa os casos de :data:`CASES` (filtrados pela regex ``only``) em cada tamanho."""
+    pattern = re.compile(only) if only else None
+    names = [name for name in CASES if pattern is None or pattern.search(name)]
+    results: List[BenchResult] = []
+    for n in sizes:
+        fixture = Fixture(n, seed)
+        for name in names:
+            group, factory = CASES[name]
+            ns, ns_min, number, peak, retained = measure(factory(fixture), min_time, repeats)
+            result = BenchResult(name, group, n, round(ns, 1), round(ns_min, 1), number, repeats, peak, retained)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def environment(seed: int) -> Dict:
+    """Metadados da máquina e das versões (para comparar resultados entre si)."""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+    }
+
+
+def max_rss_bytes() -> Optional[int]:
+    """Pico de memória residente do processo (``ru_maxrss``), se disponível."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+# ---------------------------
+# Comparação
+# ---------------------------
+
+def compare(results: Sequence[Dict], baseline: Sequence[Dict], threshold: float = 0.2) -> List[Dict]:
+    """Compara ``results`` com ``baseline`` (listas de :class:`BenchResult` como dict).
+
+    Returns:
+        Uma entrada por caso presente nos dois, com as razões de tempo e de
+        pico de memória e ``regression`` quando alguma passa de ``1 + threshold``
+        (o pico só conta acima de ``MIN_PEAK_BYTES`` na referência).
+    """
+    reference = {(r["name"], r["n"]): r for r in baseline}
+    rows = []
+    for r in results:
+        base = reference.get((r["name"], r["n"]))
+        if base is None:
+            continue
+        time_ratio = r["ns_per_op"] / base["ns_per_op"] if base["ns_per_op"] > 0 else 1.0
+        peak_ratio = r["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] >= MIN_PEAK_BYTES else 1.0
+        rows.append({
+            "name": r["name"],
+            "n": r["n"],
+            "time_ratio": round(time_ratio, 3),
+            "peak_ratio": round(peak_ratio, 3),
+            "regression": time_ratio > 1.0 + threshold or peak_ratio > 1.0 + threshold,
+        })
+    return rows
+
+
+def _format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:8.2f} {unit}"
+    return f"{ns:8.0f} ns"
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="python -m src.benchmark",
+                                 description="Benchmarks dos operadores, da fitness e de gerações do AG")
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Números de pontos (N)")
+    ap.add_argument("--only", help="Regex sobre os nomes dos casos (ex.: 'crossover|fitness')")
+    ap.add_argument("--seed", type=int, default=0, help="Semente das instâncias e operadores")
+    ap.add_argument("--min-time", type=float, default=0.2, help="Tempo cronometrado por caso (s)")
+    ap.add_argument("--repeats", type=int, default=5, help="Lotes cronometrados por caso")
+    ap.add_argument("-o", "--output", default=os.path.join("out", "bench", "benchmark.json"),
+                    help="Arquivo JSON com os resultados")
+    ap.add_argument("--baseline", help="JSON de uma execução anterior para comparação")
+    ap.add_argument("--threshold", type=float, default=0.2,
+                    help="Piora relativa tolerada antes de acusar regressão (0.2 = 20%%)")
+    ap.add_argument("--list", action="store_true", help="Lista os casos e sai")
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.list:
+        for name, (group, _) in CASES.items():
+            print(f"{group:16s} {name}")
+        return 0
+    logging.disable(logging.WARNING)          # avisos de inviabilidade poluem a saída e o tempo
+
+    def show(r: BenchResult) -> None:
+        print(f"{r.name:30s} N={r.n:<6d} {_format_ns(r.ns_per_op)}/op  pico={r.peak_bytes / 1024:10.1f} KiB")
+
+    results = run_benchmarks(args.sizes, args.only, args.seed, args.min_time, args.repeats, progress=show)
+    data = {"environment": environment(args.seed), "max_rss_bytes": max_rss_bytes(),
+            "results": [asdict(r) for r in results]}
+
+    status = 0
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        rows = compare(data["results"], baseline["results"], args.threshold)
+        data["comparison"] = {"baseline": args.baseline, "threshold": args.threshold, "cases": rows}
+        regressions = [row for row in rows if row["regression"]]
+        for row in regressions:
+            print(f"REGRESSÃO {row['name']} N={row['n']}: tempo x{row['time_ratio']}, pico x{row['peak_ratio']}")
+        print(f"{len(rows)} casos comparados com {args.baseline}; {len(regressions)} regressões")
+        status = 1 if regressions else 0
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Resultados em {args.output}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
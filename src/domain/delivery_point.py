@@ -1,7 +1,7 @@
 import numpy as np
-from scipy.spatial.distance import euclidean
+from scipy.spatial.distance import euclidean, cdist, pdist
 import math
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # Import only for type checking to avoid any potential circular imports at runtime
@@ -30,19 +30,47 @@ class DeliveryPoint:
         return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
 
     @staticmethod
-    def compute_distance_matrix(points: List["DeliveryPoint"]) -> "np.ndarray":
+    def compute_distance_matrix(
+        points: List["DeliveryPoint"],
+        dtype: "np.typing.DTypeLike" = np.float64,
+        condensed: bool = False,
+        depot: Optional["DeliveryPoint"] = None,
+    ) -> "np.ndarray":
         """
-        Compute an NxN distance matrix for the given delivery points.
-        Uses distancia_pura for stability (avoids scipy dependency in hot loops).
+        Calcula a matriz de distâncias euclidianas entre os pontos de entrega.
+
+        Usa ``scipy.spatial.distance.cdist``/``pdist`` sobre um único array de
+        coordenadas (N x 2), sem laços em Python.
+
+        Args:
+            points: pontos de entrega.
+            dtype: tipo do resultado (``np.float32`` reduz a memória pela metade).
+            condensed: se True, retorna apenas o triângulo superior como vetor de
+                tamanho N*(N-1)/2 (formato de ``pdist``; use ``squareform`` para
+                expandir). A matriz é simétrica, então nada se perde.
+            depot: se informado, o depósito é incluído como índice 0 e os pontos
+                passam a ocupar os índices 1..N.
+
+        Returns:
+            Matriz NxN (ou (N+1)x(N+1) com depósito) ou o vetor condensado.
         """
-        n = len(points)
-        mat = np.zeros((n, n), dtype=float)
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    continue
-                mat[i, j] = points[i].distancia_euclidean(points[j])
-        return mat
+        coords = DeliveryPoint.coordinates(points)
+        if depot is not None:
+            coords = np.vstack(([depot.x, depot.y], coords))
+        if condensed:
+            return pdist(coords).astype(dtype, copy=False)
+        if len(coords) == 0:
+            return np.zeros((0, 0), dtype=dtype)
+        return cdist(coords, coords).astype(dtype, copy=False)
+
+    @staticmethod
+    def coordinates(points: List["DeliveryPoint"]) -> "np.ndarray":
+        """Retorna as coordenadas dos pontos como array (N x 2) de float64."""
+        coords = np.empty((len(points), 2), dtype=np.float64)
+        for i, p in enumerate(points):
+            coords[i, 0] = p.x
+            coords[i, 1] = p.y
+        return coords
 
     def __repr__(self):
         pname = getattr(self.product, "name", None)
@@ -0,0 +1,141 @@
+"""Kernel único de distâncias para uma instância do problema.
+
+O :class:`DistanceProvider` é construído uma vez por instância (pontos de
+entrega + depósito) e concentra todas as consultas de distância do projeto:
+lookups na matriz por índice de ponto, comprimento vetorizado de tours
+(``mat[perm, roll(perm)]``) e a conversão de pixels para km.
+
+O provider não altera os pontos: o índice de cada :class:`DeliveryPoint` fica
+em um mapa interno (``id(ponto) -> índice``). :class:`Route`,
+``FitnessFunction`` e a camada de desenho usam a matriz quando recebem o
+provider (parâmetro opcional ``provider``) e, sem ele, calculam as distâncias
+euclidianas diretamente. Vários providers podem coexistir sobre os mesmos
+pontos, e serializar os pontos não arrasta a matriz.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from delivery_point import DeliveryPoint
+
+
+class DistanceProvider:
+    """Matriz de distâncias (em pixels) compartilhada por uma instância.
+
+    Args:
+        points: pontos de entrega; o índice de cada ponto é sua posição na lista.
+        depot: depósito (opcional). Quando presente, ``depot_legs[i]`` guarda a
+            distância do depósito ao ponto ``i``.
+        dtype: tipo da matriz (``np.float32`` reduz a memória pela metade).
+        scale: fator de conversão pixels -> km.
+    """
+
+    KM_PER_PIXEL = 0.1
+
+    def __init__(
+        self,
+        points: List[DeliveryPoint],
+        depot: Optional[DeliveryPoint] = None,
+        dtype: "np.typing.DTypeLike" = np.float64,
+        scale: float = KM_PER_PIXEL,
+    ):
+        self.points: List[DeliveryPoint] = list(points)
+        self.depot = depot
+        self.scale = float(scale)
+
+        full = DeliveryPoint.compute_distance_matrix(self.points, dtype=dtype, depot=depot)
+        self.full_matrix: np.ndarray = full
+        if depot is not None:
+            self.matrix: np.ndarray = full[1:, 1:]
+            self.depot_legs: Optional[np.ndarray] = full[0, 1:]
+        else:
+            self.matrix = full
+            self.depot_legs = None
+
+        self._index: Dict[int, int] = {id(p): i for i, p in enumerate(self.points)}
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    # ---------------------------
+    # Lookups
+    # ---------------------------
+
+    @staticmethod
+    def lookup(points: Sequence[DeliveryPoint],
+               provider: Optional["DistanceProvider"]) -> Tuple[Optional["DistanceProvider"], Optional[np.ndarray]]:
+        """``(provider, índices)`` se ``provider`` cobrir todos os ``points``.
+
+        Retorna ``(None, None)`` sem provider, com a lista vazia ou se algum
+        ponto não pertencer a ele (por exemplo, pontos criados depois dele).
+        """
+        if provider is None or not points:
+            return None, None
+        idx = provider.indices(points)
+        if idx is None:
+            return None, None
+        return provider, idx
+
+    def indices(self, points: Sequence[DeliveryPoint]) -> Optional[np.ndarray]:
+        """Converte pontos em índices (int32); None se algum não pertence a este provider."""
+        idx = np.empty(len(points), dtype=np.int32)
+        index, own = self._index, self.points
+        for k, p in enumerate(points):
+            i = index.get(id(p))
+            if i is None or own[i] is not p:
+                return None
+            idx[k] = i
+        return idx
+
+    def covers_depot(self, depot: Optional[DeliveryPoint]) -> bool:
+        """Indica se ``depot`` é o depósito desta instância."""
+        return depot is not None and depot is self.depot and self.depot_legs is not None
+
+    def distance(self, i: int, j: int) -> float:
+        """Distância (pixels) entre os pontos de índices ``i`` e ``j``."""
+        return float(self.matrix[i, j])
+
+    def to_km(self, value):
+        """Converte distância(s) em pixels para km."""
+        return value * self.scale
+
+    # ---------------------------
+    # Tours
+    # ---------------------------
+
+    def tour_length(self, perm) -> "float | np.ndarray":
+        """Comprimento do ciclo fechado (pixels).
+
+        Aceita uma permutação (1D) ou um lote de permutações (2D, uma por linha),
+        caso em que devolve um vetor com um comprimento por linha.
+        """
+        perm = np.asarray(perm)
+        if perm.shape[-1] == 0:
+            return 0.0 if perm.ndim == 1 else np.zeros(perm.shape[0])
+        lengths = self.matrix[perm, np.roll(perm, -1, axis=-1)].sum(axis=-1, dtype=np.float64)
+        return float(lengths) if perm.ndim == 1 else lengths
+
+    def roundtrip_length(self, perm) -> "float | np.ndarray":
+        """Comprimento depósito -> pontos na ordem -> depósito (pixels).
+
+        Assim como :meth:`tour_length`, aceita 1D ou um lote 2D.
+        """
+        perm = np.asarray(perm)
+        if perm.shape[-1] == 0:
+            return 0.0 if perm.ndim == 1 else np.zeros(perm.shape[0])
+        legs = self.depot_legs
+        inner = self.matrix[perm[..., :-1], perm[..., 1:]].sum(axis=-1, dtype=np.float64)
+        lengths = inner + legs[perm[..., 0]] + legs[perm[..., -1]]
+        return float(lengths) if perm.ndim == 1 else lengths
+
+    def route_legs(self, perm) -> Tuple[List[float], List[float]]:
+        """Pernas de uma sequência em km, no formato usado pelo split de frota.
+
+        Retorna ``(edges, depot_legs)`` com ``edges[k] = d(perm[k], perm[k+1])``
+        e ``depot_legs[k] = d(depósito, perm[k])``.
+        """
+        perm = np.asarray(perm)
+        edges = self.matrix[perm[:-1], perm[1:]] * self.scale
+        legs = self.depot_legs[perm] * self.scale
+        return edges.tolist(), legs.tolist()
@@ -0,0 +1,112 @@
+"""Representação da população do AG baseada em arrays NumPy.
+
+Cada indivíduo é uma linha de uma matriz ``(pop_size x N)`` de ``int32`` com
+uma permutação dos índices dos pontos de entrega. Fitness e custo ficam em
+vetores paralelos de ``float64``. Objetos :class:`Route` só são materializados
+quando necessário (melhor indivíduo, desenho ou operadores baseados em Route).
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from delivery_point import DeliveryPoint
+from route import Route
+
+
+class Population:
+    """População como matriz de permutações int32.
+
+    Args:
+        genes: matriz ``(pop_size x N)``; ``genes[k, j]`` é o índice em ``points``
+            do j-ésimo ponto visitado pelo indivíduo ``k``.
+        points: pontos de entrega da instância (índice = posição na lista).
+    """
+
+    def __init__(self, genes: np.ndarray, points: Sequence[DeliveryPoint]):
+        self.genes: np.ndarray = np.ascontiguousarray(genes, dtype=np.int32)
+        if self.genes.ndim != 2:
+            raise ValueError("genes deve ser uma matriz (pop_size x N)")
+        self.points: List[DeliveryPoint] = list(points)
+        if self.genes.shape[1] != len(self.points):
+            raise ValueError("número de colunas de genes difere do número de pontos")
+        size = self.genes.shape[0]
+        self.fitness: np.ndarray = np.zeros(size, dtype=np.float64)
+        self.cost: np.ndarray = np.full(size, np.inf, dtype=np.float64)
+        self._position: Optional[Dict[DeliveryPoint, int]] = None
+
+    # ---------------------------
+    # Construção
+    # ---------------------------
+
+    @classmethod
+    def random(cls, points: Sequence[DeliveryPoint], size: int,
+               rng: Optional[np.random.Generator] = None) -> "Population":
+        """Cria ``size`` permutações aleatórias dos pontos."""
+        rng = rng if rng is not None else np.random.default_rng()
+        n = len(points)
+        genes = np.tile(np.arange(n, dtype=np.int32), (size, 1))
+        genes = rng.permuted(genes, axis=1)
+        return cls(genes, points)
+
+    @classmethod
+    def from_routes(cls, routes: Sequence[Route], points: Sequence[DeliveryPoint]) -> "Population":
+        """Codifica uma lista de :class:`Route` como matriz de índices."""
+        pop = cls(np.empty((0, len(points)), dtype=np.int32), points)
+        genes = np.empty((len(routes), len(points)), dtype=np.int32)
+        for k, r in enumerate(routes):
+            genes[k] = pop.encode(r)
+        return cls(genes, pop.points)
+
+    def encode(self, route: Route) -> np.ndarray:
+        """Converte uma Route (sobre os mesmos pontos) em vetor de índices int32."""
+        if self._position is None:
+            self._position = {p: i for i, p in enumerate(self.points)}
+        pos = self._position
+        return np.fromiter((pos[p] for p in route.delivery_points), dtype=np.int32,
+                           count=len(route.delivery_points))
+
+    def take(self, rows: Sequence[int]) -> "Population":
+        """Nova população com as linhas indicadas (cópia), incluindo fitness e custo."""
+        rows = np.asarray(rows, dtype=np.intp)
+        new = Population(self.genes[rows], self.points)
+        new.fitness[:] = self.fitness[rows]
+        new.cost[:] = self.cost[rows]
+        return new
+
+    # ---------------------------
+    # Acesso
+    # ---------------------------
+
+    def __len__(self) -> int:
+        return self.genes.shape[0]
+
+    @property
+    def n_points(self) -> int:
+        return self.genes.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelos arrays da população."""
+        return self.genes.nbytes + self.fitness.nbytes + self.cost.nbytes
+
+    def route(self, k: int) -> Route:
+        """Materializa o indivíduo ``k`` como :class:`Route`."""
+        pts = self.points
+        return Route([pts[i] for i in self.genes[k].tolist()])
+
+    def __getitem__(self, k: int) -> Route:
+        return self.route(k)
+
+    def __iter__(self) -> Iterator[Route]:
+        """Itera materializando cada indivíduo (uso em desenho/compatibilidade)."""
+        for k in range(len(self)):
+            yield self.route(k)
+
+    def best_index(self) -> int:
+        """Índice do indivíduo de maior fitness."""
+        return int(np.argmax(self.fitness))
+
+    def best_route(self) -> Route:
+        """Materializa o melhor indivíduo."""
+        return self.route(self.best_index())
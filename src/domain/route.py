@@ -11,6 +11,7 @@ a list holding the ordered delivery points.
 
 from typing import List, Iterator, Optional
 from delivery_point import DeliveryPoint
+from distance_provider import DistanceProvider
 import random
 
 
@@ -44,14 +45,18 @@ class Route:
     # Distâncias
     # ---------------------------
 
-    def distancia_total(self) -> float:
+    def distancia_total(self, provider: Optional[DistanceProvider] = None) -> float:
         """Calcula a distância total do ciclo da Route.
 
-        Usa o método ``distancia_euclidean`` de :class:`PontoDeEntrega`.
-        Retorna 0.0 se a Route não contém pontos.
+        Se ``provider`` cobre os pontos, usa a matriz compartilhada; caso
+        contrário, usa ``distancia_euclidean``. Retorna 0.0 se a Route não
+        contém pontos.
         """
         if not self.delivery_points:
             return 0.0
+        provider, idx = DistanceProvider.lookup(self.delivery_points, provider)
+        if provider is not None:
+            return provider.tour_length(idx)
         total = 0.0
         n = len(self.delivery_points)
         for i in range(n):
@@ -60,13 +65,17 @@ class Route:
             total += ponto_a.distancia_euclidean(ponto_b)
         return total
 
-    def distancia_roundtrip(self, deposito: DeliveryPoint) -> float:
+    def distancia_roundtrip(self, deposito: DeliveryPoint, provider: Optional[DistanceProvider] = None) -> float:
         """(VRP) Distância depósito -> pontos na ordem -> depósito.
 
-        Se a rota estiver vazia, retorna 0.0.
+        Usa a matriz de ``provider`` se ele cobrir os pontos e o depósito. Se a
+        rota estiver vazia, retorna 0.0.
         """
         if not self.delivery_points:
             return 0.0
+        provider, idx = DistanceProvider.lookup(self.delivery_points, provider)
+        if provider is not None and provider.covers_depot(deposito):
+            return provider.roundtrip_length(idx)
         total = 0.0
         # depósito -> primeiro
         total += deposito.distancia_euclidean(self.delivery_points[0])
@@ -77,9 +86,10 @@ class Route:
         total += self.delivery_points[-1].distancia_euclidean(deposito)
         return total
 
-    def cost_roundtrip(self, deposito: DeliveryPoint, cost_per_km: float) -> float:
+    def cost_roundtrip(self, deposito: DeliveryPoint, cost_per_km: float,
+                       provider: Optional[DistanceProvider] = None) -> float:
         """(VRP) Custo da rota considerando o custo por km do veículo."""
-        return self.distancia_roundtrip(deposito) * float(cost_per_km)
+        return self.distancia_roundtrip(deposito, provider) * float(cost_per_km)
 
     # ---------------------------
     # Utilidades de VRP
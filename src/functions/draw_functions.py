@@ -1,6 +1,7 @@
 import pygame
 from typing import Any, Tuple, List, Dict
 from ui_layout import UILayout
+from render_model import RenderModel, route_distance_km
 
 WHITE = UILayout.get_color('white')
 BLACK = UILayout.get_color('black')
@@ -276,26 +277,8 @@ class DrawFunctions:
 
     @staticmethod
     def _route_distance(app: Any, r: Any, deposito: Any) -> float:
-        if hasattr(r, "distancia_roundtrip"):
-            return r.distancia_roundtrip(deposito)
-        seq = getattr(r, "delivery_points", None) or []
-        if not seq: return 0.0
-        d = 0.0
-        d += ((deposito.x - seq[0].x)**2 + (deposito.y - seq[0].y)**2) ** 0.5
-        for i in range(len(seq) - 1):
-            d += ((seq[i].x - seq[i+1].x)**2 + (seq[i].y - seq[i+1].y)**2) ** 0.5
-        d += ((seq[-1].x - deposito.x)**2 + (seq[-1].y - deposito.y)**2) ** 0.5
-        return d
-
-    @staticmethod
-    def _fleet_cost_map(app: Any) -> Dict[str, float]:
-        m: Dict[str, float] = {}
-        for v in getattr(app, "fleet", None) or []:
-            name = getattr(v, "name", None)
-            cpk  = getattr(v, "cost_per_km", None)
-            if name is not None and cpk is not None:
-                m[str(name)] = float(cpk)
-        return m
+        """Distância depósito -> rota -> depósito em km (mesma escala da fitness)."""
+        return route_distance_km(r, deposito)
 
     @staticmethod
     def draw_vrp_summary(
@@ -310,26 +293,13 @@ class DrawFunctions:
         """Box com Rotas / Custo total / Uso por tipo, alinhado ao que for passado."""
         if not routes:
             return
+        model = RenderModel.for_routes(routes, deposito, getattr(app, "fleet", None), usage=usage)
+        DrawFunctions._draw_summary_box(app, model, left, top, width)
 
-        # Totais e uso
-        total_dist = 0.0
-        total_cost = 0.0
-        cost_map: Dict[str, float] = DrawFunctions._fleet_cost_map(app)
-        use: Dict[str, int] = {}
-
-        for r in routes:
-            dist = DrawFunctions._route_distance(app, r, deposito)
-            total_dist += dist
-            vname = getattr(r, "vehicle_type", None)
-            if vname:
-                use[vname] = use.get(vname, 0) + 1
-                if vname in cost_map:
-                    total_cost += dist * cost_map[vname]
-
-        if usage:
-            use = dict(usage)
-
-        usage_txt = ", ".join(f"{k}×{v}" for k, v in use.items()) if use else "—"
+    @staticmethod
+    def _draw_summary_box(app: Any, model: RenderModel, left: int = None, top: int = None,
+                          width: int = None) -> None:
+        usage_txt = ", ".join(f"{k}×{v}" for k, v in model.usage.items()) if model.usage else "—"
 
         # Posição/medidas
         ma = UILayout.MapArea
@@ -348,9 +318,10 @@ class DrawFunctions:
         pygame.draw.rect(app.screen, WHITE, rect, border_radius=6)
         pygame.draw.rect(app.screen, DGRAY, rect, 1, border_radius=6)
 
-        line1 = app.small_font.render(f"Rotas: {len(routes)}", True, BLACK)
+        line1 = app.small_font.render(f"Rotas: {len(model.layers)}", True, BLACK)
         line2 = app.small_font.render(
-            f"Custo total: {total_cost:.1f}" if total_cost > 0 else f"Distância total: {total_dist:.1f}",
+            f"Custo total: {model.total_cost:.1f}" if model.total_cost > 0
+            else f"Distância total: {model.total_distance_km:.1f}",
             True, BLACK
         )
         line3 = app.small_font.render(f"Uso por tipo: {usage_txt}", True, BLACK)
@@ -368,6 +339,17 @@ class DrawFunctions:
         """
         if not routes:
             return
+        usage = None
+        if hasattr(app, "best_route") and getattr(app.best_route, "vehicle_usage", None):
+            usage = app.best_route.vehicle_usage
+        model = RenderModel.for_routes(routes, deposito, getattr(app, "fleet", None), usage=usage)
+        DrawFunctions.draw_route_layers(app, model, deposito, show_legend)
+
+    @staticmethod
+    def draw_route_layers(app: Any, model: RenderModel, deposito: Any, show_legend: bool = True) -> None:
+        """Desenha as subrotas pré-calculadas de um :class:`RenderModel` (sem recalcular distâncias)."""
+        if not model.layers:
+            return
 
         # desenha os clientes como pontos
         for i, c in enumerate(app.delivery_points):
@@ -379,18 +361,10 @@ class DrawFunctions:
         # desenha cada rota com uma cor
         pal = DrawFunctions._palette()
         legends = []
-        for idx, r in enumerate(routes):
+        for idx, layer in enumerate(model.layers):
             color = pal[idx % len(pal)]
-            seq = getattr(r, "delivery_points", None) or []
-            if not seq:
-                continue
-
-            pts = [(deposito.x, deposito.y)] + [(p.x, p.y) for p in seq] + [(deposito.x, deposito.y)]
-            pygame.draw.lines(app.screen, color, False, pts, 3)
-
-            vname = getattr(r, "vehicle_type", None) or "Vehicle"
-            dist = DrawFunctions._route_distance(app, r, deposito)
-            legends.append((vname, dist, color))
+            pygame.draw.lines(app.screen, color, False, layer.polyline, 3)
+            legends.append((layer.vehicle, layer.distance_km, color))
 
         # ----- Legenda -----
         ma = UILayout.MapArea
@@ -423,27 +397,30 @@ class DrawFunctions:
         DrawFunctions.draw_depot(app, deposito)
 
         # ----- Resumo -----
-        usage = None
-        if hasattr(app, "best_route") and getattr(app.best_route, "vehicle_usage", None):
-            usage = app.best_route.vehicle_usage
-
         summary_left = LEFT
         summary_top  = TOP + (legend_h if legend_h else 0) + (12 if legend_h else 0)
         summary_w    = legend_w if legend_w else 240
 
-        DrawFunctions.draw_vrp_summary(
-            app, routes, deposito,
-            usage=usage,
-            left=summary_left,
-            top=summary_top,
-            width=summary_w
-        )
+        DrawFunctions._draw_summary_box(app, model, left=summary_left, top=summary_top, width=summary_w)
 
 
     @staticmethod
     def draw_vrp_solution(app: Any, routes: List[Any], deposito: Any, show_legend: bool = True) -> None:
         DrawFunctions.draw_routes_vrp(app, routes, deposito, show_legend)
 
+    @staticmethod
+    def draw_render_model(app: Any, model: RenderModel, deposito: Any = None) -> None:
+        """Desenha cidades, melhor da geração e melhor solução a partir do modelo em cache.
+
+        Com ``deposito`` desenha o modo VRP (depósito e subrotas); sem ele, o TSP.
+        """
+        if app.running_algorithm and len(model.current_tour) > 1:
+            pygame.draw.lines(app.screen, BLUE, False, model.current_tour, 2)
+        DrawFunctions.draw_cities(app)
+        if deposito is not None:
+            DrawFunctions.draw_depot(app, deposito)
+            DrawFunctions.draw_route_layers(app, model, deposito)
+
     # -------------------- Shell principal --------------------
     @staticmethod
     def draw(app: Any) -> None:
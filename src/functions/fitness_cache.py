@@ -0,0 +1,168 @@
+"""
+Cache LRU de fitness indexado pela impressão digital do cromossomo.
+
+Seleção com cópia, elitismo e mutações fracas produzem muitos cromossomos
+idênticos entre (e dentro de) gerações. O cache guarda, por permutação, a
+fitness, o custo total, o uso da frota e as fronteiras do split, evitando
+reavaliar o split VRP.
+
+As entradas valem para uma instância específica. A impressão digital da
+instância é calculada uma vez, ao associar o cache (:meth:`FitnessCache.bind`,
+chamado pelo motor na criação ou, na falta dele, na primeira avaliação); ao
+reassociar com pontos, depósito ou frota diferentes o cache é esvaziado.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CachedFitness:
+    fitness: float
+    cost: float
+    usage: Dict[str, int]
+    bounds: Tuple[int, ...]
+    vehicles: Tuple[int, ...]
+
+
+class FitnessCache:
+    """Cache LRU limitado de resultados de fitness.
+
+    Args:
+        maxsize: número máximo de permutações guardadas.
+    """
+
+    def __init__(self, maxsize: int = 20_000):
+        self.maxsize = int(maxsize)
+        self._entries: "OrderedDict[bytes, CachedFitness]" = OrderedDict()
+        self._fingerprint: Optional[bytes] = None
+        self.hits = 0
+        self.misses = 0
+        self._gen_hits = 0
+        self._gen_misses = 0
+
+    # ---------------------------
+    # Chaves e invalidação
+    # ---------------------------
+
+    @staticmethod
+    def key(row: np.ndarray) -> bytes:
+        """Impressão digital (128 bits) de uma permutação de índices."""
+        return hashlib.blake2b(np.ascontiguousarray(row, dtype=np.int32).tobytes(), digest_size=16).digest()
+
+    @staticmethod
+    def fingerprint(provider, priorities: np.ndarray, fleet: Sequence) -> bytes:
+        """Impressão digital da instância: coordenadas, depósito, prioridades, escala e frota."""
+        h = hashlib.blake2b(digest_size=16)
+        coords = np.array([(p.x, p.y) for p in provider.points], dtype=np.float64)
+        h.update(coords.tobytes())
+        depot = provider.depot
+        if depot is not None:
+            h.update(np.array([depot.x, depot.y], dtype=np.float64).tobytes())
+        h.update(np.ascontiguousarray(priorities, dtype=np.float64).tobytes())
+        h.update(repr(provider.scale).encode())
+        for vt in fleet or ():
+            h.update(repr((vt.name, vt.count, float(vt.autonomy), float(vt.cost_per_km))).encode())
+        return h.digest()
+
+    @property
+    def bound(self) -> bool:
+        """Indica se o cache já foi associado a uma instância."""
+        return self._fingerprint is not None
+
+    def bind(self, fingerprint: bytes) -> None:
+        """Associa o cache a uma instância; esvazia se a instância mudou.
+
+        As avaliações não recalculam a impressão digital: quem troca de
+        instância precisa chamar ``bind`` de novo.
+        """
+        if fingerprint != self._fingerprint:
+            if self._entries:
+                self.clear()
+            self._fingerprint = fingerprint
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    # ---------------------------
+    # Acesso
+    # ---------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, row: np.ndarray) -> Optional[CachedFitness]:
+        """Entrada da permutação ``row`` (sem alterar os contadores)."""
+        return self._entries.get(self.key(row))
+
+    def put(self, key: bytes, entry: CachedFitness) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def lookup_rows(self, genes: np.ndarray, rows: Sequence[int],
+                    costs: np.ndarray) -> Tuple[np.ndarray, Dict[int, bytes], List[Tuple[int, int]]]:
+        """Consulta as linhas ``rows`` de ``genes``, preenchendo ``costs`` nos acertos.
+
+        Linhas repetidas dentro do mesmo lote contam como acerto e são
+        resolvidas a partir da primeira ocorrência.
+
+        Returns:
+            ``(pending, keys, repeats)``: linhas a avaliar (primeira ocorrência de
+            cada permutação ausente), chave de cada linha pendente e pares
+            ``(linha, linha_origem)`` a copiar depois da avaliação.
+        """
+        pending: List[int] = []
+        keys: Dict[int, bytes] = {}
+        repeats: List[Tuple[int, int]] = []
+        first_seen: Dict[bytes, int] = {}
+        entries = self._entries
+        for r in rows:
+            r = int(r)
+            k = self.key(genes[r])
+            entry = entries.get(k)
+            if entry is not None:
+                entries.move_to_end(k)
+                costs[r] = entry.cost
+                self._gen_hits += 1
+            elif k in first_seen:
+                repeats.append((r, first_seen[k]))
+                self._gen_hits += 1
+            else:
+                first_seen[k] = r
+                keys[r] = k
+                pending.append(r)
+                self._gen_misses += 1
+        return np.asarray(pending, dtype=np.intp), keys, repeats
+
+    def store_rows(self, rows: Sequence[int], keys: Dict[int, bytes], fitness: Sequence[float],
+                   costs: Sequence[float], splits: Sequence[Tuple[List[int], List[int]]], fleet: Sequence) -> None:
+        """Guarda os resultados recém-calculados das linhas ``rows``."""
+        for r, fit, cost, (bounds, vehicles) in zip(rows, fitness, costs, splits):
+            usage: Dict[str, int] = {}
+            for v in vehicles:
+                usage[fleet[v].name] = usage.get(fleet[v].name, 0) + 1
+            self.put(keys[int(r)], CachedFitness(float(fit), float(cost), usage, tuple(bounds), tuple(vehicles)))
+
+    # ---------------------------
+    # Estatísticas
+    # ---------------------------
+
+    def generation_stats(self) -> Dict[str, float]:
+        """Acertos/faltas desde a última chamada; acumula nos totais e zera a geração."""
+        hits, misses = self._gen_hits, self._gen_misses
+        self.hits += hits
+        self.misses += misses
+        self._gen_hits = self._gen_misses = 0
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0, "size": len(self)}
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses + self._gen_hits + self._gen_misses
+        return (self.hits + self._gen_hits) / total if total else 0.0
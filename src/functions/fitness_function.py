@@ -1,15 +1,22 @@
 import sys
 import os
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Sequence
 from math import inf
 
+import numpy as np
+
 # Add the src directory to the path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 src_dir = os.path.dirname(current_dir)  # Go up one level to src
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
+domain_dir = os.path.join(src_dir, "domain")
+if domain_dir not in sys.path:
+    sys.path.insert(0, domain_dir)
 
 from domain.route import Route
+from distance_provider import DistanceProvider
+from fitness_cache import FitnessCache
 from app_logging import log_performance, get_logger
 
 # === frota (tipos de veículos) ===
@@ -37,99 +44,371 @@ class FitnessFunction:
     # --- MÉTODOS AUXILIARES ---
     # ===============================
     @staticmethod
-    def _roundtrip_distance(points: List, deposito) -> float:
+    def _roundtrip_distance(points: List, deposito, provider: Optional[DistanceProvider] = None) -> float:
         """Distância depósito -> pontos -> depósito (pixels → km)."""
         if not points:
             return 0.0
-        scale = 0.1
+        provider, idx = DistanceProvider.lookup(points, provider)
+        if provider is not None and provider.covers_depot(deposito):
+            return provider.to_km(provider.roundtrip_length(idx))
+        scale = DistanceProvider.KM_PER_PIXEL
         total = deposito.distancia_euclidean(points[0]) * scale
         for i in range(len(points) - 1):
             total += points[i].distancia_euclidean(points[i + 1]) * scale
         total += points[-1].distancia_euclidean(deposito) * scale
         return total
 
-    # ===============================
-    # --- FITNESS COM FROTA (VRP) ---
-    # ===============================
     @staticmethod
-    def _split_with_vehicle_choice(order: List, deposito, fleet: List[VehicleType]) -> Tuple[float, List[Route], Dict[str, int], float]:
-        """Divide a sequência em subrotas válidas, escolhendo o veículo ideal."""
-        N = len(order)
+    def _order_legs(points: List, deposito,
+                    provider: Optional[DistanceProvider] = None) -> Tuple[List[float], List[float]]:
+        """Pernas da sequência em km: arestas consecutivas e distâncias ao depósito.
+
+        Retorna ``(edges, depot_legs)`` com ``edges[k] = d(p_k, p_k+1)`` e
+        ``depot_legs[k] = d(depósito, p_k)``. Custo O(N), vetorizado; usa a
+        matriz de ``provider`` quando ele cobre os pontos e o depósito.
+        """
+        provider, idx = DistanceProvider.lookup(points, provider)
+        if provider is not None and provider.covers_depot(deposito):
+            return provider.route_legs(idx)
+        scale = DistanceProvider.KM_PER_PIXEL
+        xs = np.fromiter((p.x for p in points), dtype=float, count=len(points))
+        ys = np.fromiter((p.y for p in points), dtype=float, count=len(points))
+        edges = np.hypot(np.diff(xs), np.diff(ys)) * scale
+        depot_legs = np.hypot(xs - deposito.x, ys - deposito.y) * scale
+        return edges.tolist(), depot_legs.tolist()
+
+    @staticmethod
+    def _split_legs(edges: Sequence[float], depot_legs: Sequence[float],
+                    fleet: List[VehicleType]) -> Tuple[float, List[int], List[int]]:
+        """Split ótimo (programação dinâmica) sobre as pernas de uma sequência.
+
+        Usa a soma acumulada das arestas internas, de modo que a distância
+        depósito -> p_i..p_(j-1) -> depósito de cada segmento custa O(1). O laço
+        interno é interrompido assim que o trecho depósito -> p_i..p_(j-1)
+        excede a maior autonomia da frota, pois ele só cresce com ``j``.
+
+        Args:
+            edges: ``edges[k]`` é a distância (km) entre a k-ésima e a (k+1)-ésima parada.
+            depot_legs: ``depot_legs[k]`` é a distância (km) do depósito à k-ésima parada.
+            fleet: tipos de veículos disponíveis.
+
+        Returns:
+            ``(custo, prev, veh_at)``: custo mínimo para atender toda a sequência
+            (``inf`` se inviável), predecessores do split e o índice em ``fleet``
+            do veículo escolhido para o segmento que termina em cada posição.
+        """
+        N = len(depot_legs)
+        cum = [0.0] * N
+        acc = 0.0
+        for k in range(1, N):
+            acc += edges[k - 1]
+            cum[k] = acc
+
+        vehicles = [(v, vt.autonomy, vt.cost_per_km) for v, vt in enumerate(fleet)]
+        max_autonomy = max((vt.autonomy for vt in fleet), default=-inf)
+
         best_cost = [inf] * (N + 1)
         prev = [-1] * (N + 1)
-        veh_at: List[Optional[VehicleType]] = [None] * (N + 1)
+        veh_at = [-1] * (N + 1)
         best_cost[0] = 0.0
 
-        route_splits = [None] * (N + 1)
-
         for i in range(N):
-            if best_cost[i] == inf:
+            base = best_cost[i]
+            if base == inf:
                 continue
+            out_leg = depot_legs[i]
+            cum_i = cum[i]
             for j in range(i + 1, N + 1):
-                seq = order[i:j]
-                dist = FitnessFunction._roundtrip_distance(seq, deposito)
+                # depósito -> p_i .. p_(j-1), sem o retorno
+                partial = out_leg + (cum[j - 1] - cum_i)
+                if partial > max_autonomy:
+                    break
+                dist = partial + depot_legs[j - 1]
 
                 # Veículo mais barato que atende autonomia
-                chosen, chosen_cost = None, inf
-                for vt in fleet:
-                    if dist <= vt.autonomy:
-                        c = vt.cost_per_km * dist
+                chosen, chosen_cost = -1, inf
+                for v, autonomy, cost_per_km in vehicles:
+                    if dist <= autonomy:
+                        c = cost_per_km * dist
                         if c < chosen_cost:
                             chosen_cost = c
-                            chosen = vt
+                            chosen = v
 
-                if chosen is None:
+                if chosen < 0:
                     continue
 
-                cand = best_cost[i] + chosen_cost
+                cand = base + chosen_cost
                 if cand < best_cost[j]:
                     best_cost[j] = cand
                     prev[j] = i
                     veh_at[j] = chosen
-                    route_splits[j] = seq[:]
 
-        if best_cost[N] == inf:
-            return FitnessFunction.BIG_PENALTY, [], {}, 0.0
+        return best_cost[N], prev, veh_at
 
-        # Reconstrói rotas
-        routes: List[Route] = []
-        usage: Dict[str, int] = {}
-        j = N
-        split_sequences = []
+    @staticmethod
+    def split_indices(perm: Sequence[int], distance_matrix: np.ndarray, depot_legs: np.ndarray,
+                      fleet: List[VehicleType]) -> Tuple[float, List[int], List[int]]:
+        """Split sobre uma permutação de índices usando matriz pré-calculada (km).
+
+        Args:
+            perm: ordem de visita como índices de ``distance_matrix``.
+            distance_matrix: matriz NxN de distâncias entre clientes, em km.
+            depot_legs: vetor com a distância do depósito a cada cliente, em km.
+            fleet: tipos de veículos disponíveis.
+
+        Returns:
+            O mesmo que :meth:`_split_legs`.
+        """
+        perm = np.asarray(perm, dtype=np.intp)
+        edges = distance_matrix[perm[:-1], perm[1:]].tolist()
+        legs = depot_legs[perm].tolist()
+        return FitnessFunction._split_legs(edges, legs, fleet)
+
+    @staticmethod
+    def _score_split(total: float, prev: List[int], veh_idx: List[int], prio_cum: Sequence[float],
+                     prio_wcum: Sequence[float], fleet: List[VehicleType]) -> Tuple[float, List[int], List[int]]:
+        """Aplica as penalidades de frota e prioridade a um split já resolvido.
+
+        As penalidades de prioridade usam somas acumuladas de ``p_k`` e
+        ``p_k * k`` da sequência, de modo que cada subrota custa O(1).
+
+        Returns:
+            ``(custo, bounds, vehicles)``: custo total penalizado (``BIG_PENALTY``
+            se inviável), fronteiras das subrotas (``[0, ..., N]``) e o índice em
+            ``fleet`` do veículo de cada subrota.
+        """
+        if total == inf:
+            return FitnessFunction.BIG_PENALTY, [], []
+
+        bounds = []
+        vehicles = []
+        j = len(prev) - 1
         while j > 0:
-            i = prev[j]
-            seq = order[i:j]
-            split_sequences.append(seq)
-            r = Route(seq[:])
-            vt = veh_at[j]
-            if hasattr(r, "assign_vehicle"):
-                r.assign_vehicle(vt.name)
-            else:
-                r.vehicle_type = vt.name
-            routes.append(r)
-            usage[vt.name] = usage.get(vt.name, 0) + 1
-            j = i
-        routes.reverse()
-        split_sequences.reverse()
+            bounds.append(j)
+            vehicles.append(veh_idx[j])
+            j = prev[j]
+        bounds.append(0)
+        bounds.reverse()
+        vehicles.reverse()
 
         # Penalização por excesso de veículos
         penalty = 0.0
+        usage: Dict[str, int] = {}
+        for v in vehicles:
+            name = fleet[v].name
+            usage[name] = usage.get(name, 0) + 1
         caps = {vt.name: vt.count for vt in fleet}
         for t, used in usage.items():
             if used > caps.get(t, 0):
                 penalty += (used - caps.get(t, 0)) * FitnessFunction.BIG_PENALTY * 0.01
 
-        # Penalidade de prioridade (produtos importantes no fim da rota)
+        # Penalidade de prioridade: sum p_k * (k - i) / max(1, n - 1) por subrota [i, j)
         priority_penalty = 0.0
-        for seq in split_sequences:
-            n = len(seq)
-            for idx, dp in enumerate(seq):
-                prod = getattr(dp, "product", None)
-                if prod and hasattr(prod, "priority"):
-                    priority_penalty += prod.priority * (idx / max(1, n - 1))
+        for i, j in zip(bounds, bounds[1:]):
+            weighted = (prio_wcum[j] - prio_wcum[i]) - i * (prio_cum[j] - prio_cum[i])
+            priority_penalty += weighted / max(1, j - i - 1)
         penalty += priority_penalty * 2.0
 
-        return best_cost[N] + penalty, routes, usage, penalty
+        return total + penalty, bounds, vehicles
+
+    @staticmethod
+    def product_arrays(points: Sequence) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Peso (g), volume (cm³) e prioridade de cada ponto como vetores float64.
+
+        Pontos sem produto contribuem com zero.
+        """
+        n = len(points)
+        weights = np.zeros(n, dtype=np.float64)
+        volumes = np.zeros(n, dtype=np.float64)
+        priorities = np.zeros(n, dtype=np.float64)
+        for k, point in enumerate(points):
+            prod = getattr(point, "product", None)
+            if not prod:
+                continue
+            try:
+                weights[k] = float(prod.weight)
+                volumes[k] = float(getattr(prod, "volume", prod.length * prod.width * prod.height))
+            except Exception:
+                weights[k] = volumes[k] = 0.0
+            priorities[k] = float(getattr(prod, "priority", 0.0) or 0.0)
+        return weights, volumes, priorities
+
+    @staticmethod
+    def _fleet_costs(genes: np.ndarray, provider: DistanceProvider, priorities: np.ndarray,
+                     fleet: List[VehicleType], with_splits: bool = False):
+        """Custo VRP penalizado de cada linha de ``genes`` (permutações válidas).
+
+        Pernas e prioridades de toda a população são extraídas em lote; o laço
+        por indivíduo só percorre listas já prontas.
+
+        Returns:
+            Vetor de custos; com ``with_splits=True``, ``(custos, splits)`` onde
+            ``splits[k] = (bounds, vehicles)`` como em :meth:`_score_split`.
+        """
+        size, n = genes.shape
+        costs = np.empty(size, dtype=np.float64)
+        splits = []
+        if n == 0:
+            costs.fill(0.0)
+            splits = [([0], [])] * size
+            return (costs, splits) if with_splits else costs
+        scale = provider.scale
+        edges_all = (provider.matrix[genes[:, :-1], genes[:, 1:]] * scale).tolist()
+        legs_all = (provider.depot_legs[genes] * scale).tolist()
+        prio = priorities[genes]
+        zeros = np.zeros((size, 1))
+        prio_cum = np.hstack((zeros, np.cumsum(prio, axis=1))).tolist()
+        prio_wcum = np.hstack((zeros, np.cumsum(prio * np.arange(n), axis=1))).tolist()
+        for k in range(size):
+            total, prev, veh = FitnessFunction._split_legs(edges_all[k], legs_all[k], fleet)
+            cost, bounds, vehicles = FitnessFunction._score_split(total, prev, veh, prio_cum[k], prio_wcum[k], fleet)
+            costs[k] = cost
+            if with_splits:
+                splits.append((bounds, vehicles))
+        return (costs, splits) if with_splits else costs
+
+    @staticmethod
+    @log_performance
+    def evaluate_population(genes: np.ndarray, provider: DistanceProvider,
+                            fleet: Optional[List[VehicleType]] = None,
+                            evaluator=None, cache=None,
+                            arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+                            ) -> Tuple[np.ndarray, np.ndarray]:
+        """Avalia uma população inteira dada como matriz de índices.
+
+        - Sem frota (TSP): comprimento dos ciclos e penalidades de peso/volume
+          calculados numa única passada NumPy.
+        - Com frota (VRP): split por indivíduo sobre arrays compartilhados.
+          Linhas com cidades repetidas caem no cálculo por :class:`Route`.
+
+        Args:
+            genes: matriz ``(pop_size x N)`` de índices dos pontos de ``provider``.
+            provider: distâncias da instância (com depósito no modo VRP).
+            fleet: frota; se None ou sem depósito no provider, usa o modo TSP.
+            evaluator: opcional, objeto com ``fleet_costs(genes)`` (por exemplo
+                ``ParallelFitnessEvaluator``) usado no lugar do laço serial do VRP.
+            cache: opcional, :class:`FitnessCache` consultado antes de avaliar cada
+                permutação (VRP); cromossomos repetidos são avaliados uma vez só.
+                Um cache ainda não associado é associado a esta instância;
+                para trocar de instância, use ``cache.bind``.
+            arrays: ``(pesos, volumes, prioridades)`` da instância, como em
+                :meth:`product_arrays`; quem avalia muitas vezes a mesma
+                instância (o motor) os calcula uma vez e repassa. ``None``
+                recalcula a partir de ``provider.points``.
+
+        Returns:
+            ``(fitness, costs)``: vetores com a fitness (a maximizar) e o custo
+            penalizado de cada indivíduo, na mesma ordem das linhas.
+        """
+        genes = np.asarray(genes)
+        weights, volumes, priorities = arrays if arrays is not None else FitnessFunction.product_arrays(provider.points)
+
+        if fleet is None or provider.depot_legs is None:
+            lengths = provider.tour_length(genes)
+            weight_overshoot = np.maximum(0.0, weights[genes].sum(axis=1) - FitnessFunction.MAX_WEIGHT)
+            volume_overshoot = np.maximum(0.0, volumes[genes].sum(axis=1) - FitnessFunction.MAX_VOLUME)
+            penalty = weight_overshoot * FitnessFunction.PENALTY_WEIGHT_FACTOR \
+                      + volume_overshoot * FitnessFunction.PENALTY_VOLUME_FACTOR
+            costs = lengths + penalty + 1e-6
+            fitness = np.where(lengths > 0, 1.0 / costs, 0.0)
+            return fitness, costs
+
+        # ---- (1) Linhas com duplicatas são avaliadas pelo caminho via Route ----
+        n = genes.shape[1]
+        if n > 1:
+            ordered = np.sort(genes, axis=1)
+            has_dup = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        else:
+            has_dup = np.zeros(genes.shape[0], dtype=bool)
+
+        # ---- (2) Cache: só as permutações ainda não vistas são avaliadas ----
+        costs = np.empty(genes.shape[0], dtype=np.float64)
+        pending = np.flatnonzero(~has_dup)
+        splits = None
+        if cache is not None:
+            if not cache.bound:
+                cache.bind(FitnessCache.fingerprint(provider, priorities, fleet))
+            pending, keys, repeats = cache.lookup_rows(genes, pending, costs)
+
+        if pending.size:
+            with_splits = cache is not None
+            if evaluator is not None:
+                result = evaluator.fleet_costs(genes[pending], with_splits=with_splits)
+            else:
+                result = FitnessFunction._fleet_costs(genes[pending], provider, priorities, fleet,
+                                                      with_splits=with_splits)
+            if with_splits:
+                result, splits = result
+            costs[pending] = result
+
+        if cache is not None:
+            for row, source in repeats:
+                costs[row] = costs[source]
+
+        valid = ~has_dup
+        fitness = np.zeros_like(costs)
+        ok = valid & (costs < FitnessFunction.BIG_PENALTY) & (costs > 0)
+        fitness[ok] = 1.0 / costs[ok]
+
+        if splits is not None:
+            cache.store_rows(pending, keys, fitness[pending], costs[pending], splits, fleet)
+
+        for k in np.flatnonzero(has_dup):
+            route = Route([provider.points[i] for i in genes[k].tolist()])
+            fit, _, _ = FitnessFunction.calculate_fitness_with_fleet(route, provider.depot, fleet, provider)
+            fitness[k] = fit
+            costs[k] = 1.0 / fit if fit > 0 else inf
+
+        costs[valid & (costs >= FitnessFunction.BIG_PENALTY)] = inf
+        return fitness, costs
+
+    @staticmethod
+    def routes_from_split(points: Sequence, perm: Sequence[int], bounds: Sequence[int],
+                          vehicles: Sequence[int], fleet: List[VehicleType]) -> Tuple[List[Route], Dict[str, int]]:
+        """Monta as subrotas (:class:`Route`) e o uso da frota a partir de um split salvo."""
+        perm = list(perm)
+        routes: List[Route] = []
+        usage: Dict[str, int] = {}
+        for i, j, v in zip(bounds, bounds[1:], vehicles):
+            r = Route([points[k] for k in perm[i:j]])
+            r.assign_vehicle(fleet[v].name)
+            routes.append(r)
+            usage[fleet[v].name] = usage.get(fleet[v].name, 0) + 1
+        return routes, usage
+
+    # ===============================
+    # --- FITNESS COM FROTA (VRP) ---
+    # ===============================
+    @staticmethod
+    def _split_with_vehicle_choice(order: List, deposito, fleet: List[VehicleType],
+                                   provider: Optional[DistanceProvider] = None
+                                   ) -> Tuple[float, List[Route], Dict[str, int], float]:
+        """Divide a sequência em subrotas válidas, escolhendo o veículo ideal."""
+        edges, depot_legs = FitnessFunction._order_legs(order, deposito, provider)
+        total, prev, veh_idx = FitnessFunction._split_legs(edges, depot_legs, fleet)
+
+        if total == inf:
+            return FitnessFunction.BIG_PENALTY, [], {}, 0.0
+
+        _, _, priorities = FitnessFunction.product_arrays(order)
+        prio_cum = np.concatenate(([0.0], np.cumsum(priorities))).tolist()
+        prio_wcum = np.concatenate(([0.0], np.cumsum(priorities * np.arange(len(order))))).tolist()
+        cost, bounds, vehicles = FitnessFunction._score_split(total, prev, veh_idx, prio_cum, prio_wcum, fleet)
+
+        # Reconstrói rotas
+        routes: List[Route] = []
+        usage: Dict[str, int] = {}
+        for i, j, v in zip(bounds, bounds[1:], vehicles):
+            r = Route(order[i:j])
+            vt = fleet[v]
+            if hasattr(r, "assign_vehicle"):
+                r.assign_vehicle(vt.name)
+            else:
+                r.vehicle_type = vt.name
+            routes.append(r)
+            usage[vt.name] = usage.get(vt.name, 0) + 1
+
+        return cost, routes, usage, cost - total
 
     # ===============================
     # --- FITNESS PRINCIPAL (VRP) ---
@@ -174,8 +453,14 @@ class FitnessFunction:
 
     @staticmethod
     @log_performance
-    def calculate_fitness_with_fleet(route: Route, deposito, fleet: List[VehicleType]) -> Tuple[float, List[Route], Dict[str, int]]:
-        """Calcula o fitness considerando frota e restrições de unicidade."""
+    def calculate_fitness_with_fleet(route: Route, deposito, fleet: List[VehicleType],
+                                     provider: Optional[DistanceProvider] = None
+                                     ) -> Tuple[float, List[Route], Dict[str, int]]:
+        """Calcula o fitness considerando frota e restrições de unicidade.
+
+        ``provider`` (opcional) fornece a matriz de distâncias da instância;
+        sem ele, as distâncias são calculadas a partir das coordenadas.
+        """
         order = getattr(route, "delivery_points", None)
         if not order:
             FitnessFunction.logger.warning("Rota vazia para cálculo com frota.")
@@ -193,7 +478,8 @@ class FitnessFunction:
         missing = len(order) - len(filtered_order)
 
         # ---- (2) Avaliação principal ----
-        total_cost, routes, usage, penalty = FitnessFunction._split_with_vehicle_choice(filtered_order, deposito, fleet)
+        total_cost, routes, usage, penalty = FitnessFunction._split_with_vehicle_choice(
+            filtered_order, deposito, fleet, provider)
 
         # ---- (3) Penalização se houver duplicatas ou cidades omitidas ----
         extra_penalty = 0.0
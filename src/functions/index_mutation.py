@@ -0,0 +1,69 @@
+"""
+Operadores de mutação sobre permutações de índices (NumPy).
+
+Equivalentes a :class:`Mutation` (troca, inversão e embaralhamento), mas
+aplicados in-place a uma matriz ``(M x N)`` de genes — a mesma codificação de
+:class:`Population` — sem materializar :class:`Route`. Cada linha recebe
+posições aleatórias próprias; com ``priorities``, as linhas são reordenadas
+por prioridade decrescente (estável) depois da mutação, como em
+``Mutation._prioritize``.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from index_crossover import IndexCrossover, _cuts
+
+
+class IndexMutation:
+
+    @staticmethod
+    def _prioritize(genes: np.ndarray, priorities: Optional[np.ndarray]) -> np.ndarray:
+        if priorities is not None:
+            genes[:] = IndexCrossover.prioritize(genes, priorities)
+        return genes
+
+    @staticmethod
+    def swap(genes: np.ndarray, rng: Optional[np.random.Generator] = None,
+             priorities: Optional[np.ndarray] = None) -> np.ndarray:
+        """Troca dois genes em posições distintas de cada linha."""
+        m, n = genes.shape
+        if n >= 2:
+            pos = _cuts(rng, m, n, 2)
+            rows = np.arange(m)
+            first, second = genes[rows, pos[:, 0]], genes[rows, pos[:, 1]]
+            genes[rows, pos[:, 0]], genes[rows, pos[:, 1]] = second, first
+        return IndexMutation._prioritize(genes, priorities)
+
+    @staticmethod
+    def inversion(genes: np.ndarray, rng: Optional[np.random.Generator] = None,
+                  priorities: Optional[np.ndarray] = None) -> np.ndarray:
+        """Inverte o trecho ``[start:end)`` de cada linha."""
+        m, n = genes.shape
+        if n >= 2:
+            cuts = _cuts(rng, m, n, 2)
+            pos = np.arange(n)
+            inside = IndexCrossover._segment_mask(cuts, n)
+            source = np.where(inside, cuts[:, :1] + cuts[:, 1:2] - 1 - pos, pos)
+            genes[:] = np.take_along_axis(genes, source, axis=1)
+        return IndexMutation._prioritize(genes, priorities)
+
+    @staticmethod
+    def shuffle(genes: np.ndarray, rng: Optional[np.random.Generator] = None,
+                priorities: Optional[np.ndarray] = None) -> np.ndarray:
+        """Embaralha o trecho ``[start:end)`` de cada linha.
+
+        As posições fora do trecho mantêm a própria posição como chave de
+        ordenação; as de dentro recebem chaves aleatórias em ``[start, end)``.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        m, n = genes.shape
+        if n >= 2:
+            cuts = _cuts(rng, m, n, 2)
+            pos = np.arange(n)
+            start, end = cuts[:, :1], cuts[:, 1:2]
+            inside = IndexCrossover._segment_mask(cuts, n)
+            keys = np.where(inside, start + rng.random((m, n)) * (end - start), pos)
+            genes[:] = np.take_along_axis(genes, np.argsort(keys, axis=1, kind="stable"), axis=1)
+        return IndexMutation._prioritize(genes, priorities)
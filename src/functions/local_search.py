@@ -0,0 +1,122 @@
+"""
+Busca local para o AG memético.
+
+:class:`TwoOpt` melhora um ciclo (permutação de índices) com movimentos 2-opt.
+Em vez de testar todos os pares de arestas (O(N²) por passada), cada cidade só
+tenta ligar-se aos seus ``k`` vizinhos mais próximos (listas pré-calculadas a
+partir da matriz de distâncias), e *don't-look bits* evitam reexaminar cidades
+cujas vizinhanças não mudaram. O ganho de cada movimento é calculado em O(1)
+com quatro consultas à matriz.
+"""
+
+import time
+from collections import deque
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class TwoOpt:
+    """2-opt com listas de vizinhos e don't-look bits.
+
+    Args:
+        matrix: matriz de distâncias ``N x N`` (por exemplo ``DistanceProvider.matrix``).
+        neighbours: tamanho das listas de candidatos de cada cidade.
+    """
+
+    EPS = 1e-9
+
+    def __init__(self, matrix: np.ndarray, neighbours: int = 8):
+        self.matrix = np.asarray(matrix)
+        self.neighbours: List[List[int]] = self.neighbour_lists(self.matrix, neighbours).tolist()
+
+    @staticmethod
+    def neighbour_lists(matrix: np.ndarray, k: int) -> np.ndarray:
+        """Índices dos ``k`` vizinhos mais próximos de cada cidade, do mais próximo
+        ao mais distante (a própria cidade é excluída)."""
+        n = matrix.shape[0]
+        k = max(0, min(k, n - 1))
+        if k == 0:
+            return np.empty((n, 0), dtype=np.intp)
+        d = np.array(matrix, dtype=np.float64)
+        np.fill_diagonal(d, np.inf)
+        nearest = np.argpartition(d, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(d, nearest, axis=1), axis=1, kind="stable")
+        return np.take_along_axis(nearest, order, axis=1)
+
+    def improve(self, tour: np.ndarray, deadline: Optional[float] = None) -> Tuple[np.ndarray, float]:
+        """Aplica 2-opt até um ótimo local (ou até ``deadline``, em ``perf_counter``).
+
+        Returns:
+            ``(novo_tour, ganho)``: o ciclo melhorado (mesmo dtype) e a redução
+            do comprimento do ciclo fechado.
+        """
+        tour = np.asarray(tour)
+        n = len(tour)
+        if n < 4:
+            return tour.copy(), 0.0
+        dist = self.matrix.item
+        neighbours = self.neighbours
+        order = tour.tolist()
+        pos = [0] * n
+        for i, city in enumerate(order):
+            pos[city] = i
+
+        active = deque(order)
+        queued = [True] * n          # don't-look bit desligado = cidade na fila
+        gain = 0.0
+        checks = 0
+        while active:
+            checks += 1
+            if deadline is not None and checks % 64 == 0 and time.perf_counter() >= deadline:
+                break
+            a = active.popleft()
+            queued[a] = False
+            moved = False
+            for forward in (True, False):
+                i = pos[a]
+                b = order[(i + 1) % n] if forward else order[i - 1]
+                d_ab = dist(a, b)
+                for c in neighbours[a]:
+                    d_ac = dist(a, c)
+                    if d_ac >= d_ab:
+                        break            # listas ordenadas: nenhum candidato melhor adiante
+                    j = pos[c]
+                    d = order[(j + 1) % n] if forward else order[j - 1]
+                    if c == b or d == a:
+                        continue
+                    delta = d_ac + dist(b, d) - d_ab - dist(c, d)
+                    if delta < -self.EPS:
+                        if forward:
+                            self._reverse(order, pos, (i + 1) % n, j)
+                        else:
+                            self._reverse(order, pos, i, (j - 1) % n)
+                        gain -= delta
+                        for city in (a, b, c, d):
+                            if not queued[city]:
+                                queued[city] = True
+                                active.append(city)
+                        moved = True
+                        break
+                if moved:
+                    break
+        return np.asarray(order, dtype=tour.dtype), gain
+
+    @staticmethod
+    def _reverse(order: List[int], pos: List[int], start: int, end: int) -> None:
+        """Inverte o trecho circular ``order[start..end]`` (inclusive).
+
+        Inverter o complemento produz o mesmo ciclo, então inverte-se o trecho
+        mais curto dos dois.
+        """
+        n = len(order)
+        length = (end - start) % n + 1
+        if 2 * length > n:
+            start, end = (end + 1) % n, (start - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            a, b = order[start], order[end]
+            order[start], order[end] = b, a
+            pos[b], pos[a] = start, end
+            start = (start + 1) % n
+            end = (end - 1) % n
@@ -1,11 +1,15 @@
 # === ETAPA 2: IMPLEMENTAÇÃO DOS OPERADORES DE MUTAÇÃO ===
 import random
+from typing import Optional
+
 from route import Route
+from random_source import resolve_rng
 from app_logging import log_performance, get_logger
 
 # Logger para este módulo
 logger = get_logger(__name__)
 
+
 class Mutation:
     
     @staticmethod
@@ -15,13 +19,13 @@ class Mutation:
 
     @staticmethod
     @log_performance
-    def mutacao_por_troca(route: Route) -> Route:
+    def mutacao_por_troca(route: Route, rng: Optional[random.Random] = None) -> Route:
         """
         Troca a posição de duas cidades aleatórias na rota.
         """
         logger.debug(f"Mutação por troca: rota com {len(route.delivery_points)} cidades")
         mutated_individual = route.delivery_points[:]
-        idx1, idx2 = random.sample(range(len(mutated_individual)), 2)
+        idx1, idx2 = resolve_rng(rng).sample(range(len(mutated_individual)), 2)
         logger.debug(f"Trocando posições {idx1} e {idx2}")
         mutated_individual[idx1], mutated_individual[idx2] = mutated_individual[idx2], mutated_individual[idx1]
         # Priorizar após mutação
@@ -30,13 +34,13 @@ class Mutation:
 
     @staticmethod
     @log_performance
-    def mutacao_por_inversao(route: Route) -> Route:
+    def mutacao_por_inversao(route: Route, rng: Optional[random.Random] = None) -> Route:
         """
         Inverte uma subsequência aleatória da rota.
         """
         logger.debug(f"Mutação por inversão: rota com {len(route.delivery_points)} cidades")
         mutated_individual = route.delivery_points[:]
-        start, end = sorted(random.sample(range(len(mutated_individual)), 2))
+        start, end = sorted(resolve_rng(rng).sample(range(len(mutated_individual)), 2))
         logger.debug(f"Invertendo subsequência [{start}:{end}]")
         sub_sequence = mutated_individual[start:end]
         sub_sequence.reverse()
@@ -46,16 +50,16 @@ class Mutation:
 
     @staticmethod
     @log_performance
-    def mutacao_por_embaralhamento(route: Route) -> Route:
+    def mutacao_por_embaralhamento(route: Route, rng: Optional[random.Random] = None) -> Route:
         """
         Embaralha uma subsequência aleatória da rota.
         """
         logger.debug(f"Mutação por embaralhamento: rota com {len(route.delivery_points)} cidades")
         mutated_individual = route.delivery_points[:]
-        start, end = sorted(random.sample(range(len(mutated_individual)), 2))
+        start, end = sorted(resolve_rng(rng).sample(range(len(mutated_individual)), 2))
         logger.debug(f"Embaralhando subsequência [{start}:{end}]")
         sub_sequence = mutated_individual[start:end]
-        random.shuffle(sub_sequence)
+        resolve_rng(rng).shuffle(sub_sequence)
         mutated_individual[start:end] = sub_sequence
         mutated_individual = Mutation._prioritize(mutated_individual)
         return Route(mutated_individual)
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Avaliação paralela da fitness VRP com ``ProcessPoolExecutor``.
+
+A matriz de distâncias, as pernas do depósito, as prioridades e os parâmetros
+da frota são publicados uma única vez em blocos de
+``multiprocessing.shared_memory``; os workers se conectam a eles no
+``initializer``. A cada geração só trafegam fatias ``int32`` da população e
+os vetores de custo de volta — nada de ``Route``/``DeliveryPoint`` serializado.
+
+Os workers executam o mesmo kernel do modo serial
+(``FitnessFunction._fleet_costs``) e cada linha é independente, então o
+resultado é bit a bit idêntico ao serial, qualquer que seja o particionamento.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from fitness_function import FitnessFunction, VehicleType
+from app_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _SharedDistances:
+    """Visão mínima de um DistanceProvider usada pelo kernel de custo."""
+
+    def __init__(self, matrix: np.ndarray, depot_legs: np.ndarray, scale: float):
+        self.matrix = matrix
+        self.depot_legs = depot_legs
+        self.scale = scale
+
+
+# Estado do processo worker (preenchido por _attach_worker)
+_WORKER: Dict[str, object] = {}
+
+
+def _fleet_from_array(params: np.ndarray) -> List[VehicleType]:
+    """Reconstrói a frota a partir de linhas ``[grupo, count, autonomy, cost_per_km]``.
+
+    O nome vira o id do grupo: tipos com o mesmo nome compartilham o limite de
+    veículos, como no cálculo serial.
+    """
+    return [VehicleType(name=str(int(g)), count=int(c), autonomy=float(a), cost_per_km=float(k))
+            for g, c, a, k in params.tolist()]
+
+
+def _attach_worker(specs: Dict[str, Tuple[str, Tuple[int, ...], str]], scale: float) -> None:
+    """Initializer do worker: conecta aos blocos compartilhados (sem cópia)."""
+    blocks = {}
+    arrays = {}
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        blocks[key] = shm
+        arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    _WORKER["blocks"] = blocks
+    _WORKER["distances"] = _SharedDistances(arrays["matrix"], arrays["depot_legs"], scale)
+    _WORKER["priorities"] = arrays["priorities"]
+    _WORKER["fleet"] = _fleet_from_array(arrays["fleet"])
+
+
+def _worker_fleet_costs(genes: np.ndarray, with_splits: bool = False):
+    """Custo VRP de uma fatia da população, executado no worker."""
+    return FitnessFunction._fleet_costs(genes, _WORKER["distances"], _WORKER["priorities"], _WORKER["fleet"],
+                                        with_splits=with_splits)
+
+
+class ParallelFitnessEvaluator:
+    """Avaliador VRP multiprocesso com dados da instância em memória compartilhada.
+
+    Uso típico::
+
+        with ParallelFitnessEvaluator(provider, fleet, workers=8) as ev:
+            fitness, costs = FitnessFunction.evaluate_population(genes, provider, fleet, evaluator=ev)
+
+    Args:
+        provider: ``DistanceProvider`` da instância (precisa ter depósito).
+        fleet: tipos de veículos.
+        workers: número de processos; ``None`` usa ``os.cpu_count()``. Com
+            ``workers <= 1`` não cria processos e avalia em série.
+        chunk_size: linhas por tarefa; ``None`` divide a população em
+            ~4 tarefas por worker.
+    """
+
+    def __init__(self, provider, fleet: List[VehicleType], workers: Optional[int] = None,
+                 chunk_size: Optional[int] = None, priorities: Optional[np.ndarray] = None):
+        if provider.depot_legs is None:
+            raise ValueError("ParallelFitnessEvaluator requer um provider com depósito")
+        self.provider = provider
+        self.fleet = list(fleet)
+        self.workers = int(workers if workers is not None else (os.cpu_count() or 1))
+        self.chunk_size = chunk_size
+        if priorities is None:
+            _, _, priorities = FitnessFunction.product_arrays(provider.points)
+        self.priorities = priorities
+
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+        if self.workers > 1:
+            self._start()
+
+    # ---------------------------
+    # Ciclo de vida
+    # ---------------------------
+
+    def _share(self, array: np.ndarray) -> Tuple[str, Tuple[int, ...], str]:
+        """Copia ``array`` para um novo bloco compartilhado e devolve sua especificação."""
+        array = np.ascontiguousarray(array)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        self._blocks.append(shm)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        return shm.name, array.shape, array.dtype.str
+
+    def _start(self) -> None:
+        groups: Dict[str, int] = {}
+        caps = {vt.name: vt.count for vt in self.fleet}
+        fleet_params = np.array(
+            [[groups.setdefault(vt.name, len(groups)), caps[vt.name], vt.autonomy, vt.cost_per_km]
+             for vt in self.fleet],
+            dtype=np.float64,
+        ).reshape(-1, 4)
+        specs = {
+            "matrix": self._share(self.provider.matrix),
+            "depot_legs": self._share(self.provider.depot_legs),
+            "priorities": self._share(self.priorities),
+            "fleet": self._share(fleet_params),
+        }
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_attach_worker,
+            initargs=(specs, self.provider.scale),
+        )
+        logger.info(f"Avaliação paralela ativa: {self.workers} workers, matriz {self.provider.matrix.shape}")
+
+    def close(self) -> None:
+        """Encerra os workers e libera a memória compartilhada."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> "ParallelFitnessEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------------------------
+    # Avaliação
+    # ---------------------------
+
+    def fleet_costs(self, genes: np.ndarray, with_splits: bool = False):
+        """Custo VRP penalizado de cada linha de ``genes`` (mesmo contrato do kernel serial)."""
+        genes = np.ascontiguousarray(genes, dtype=np.int32)
+        size = genes.shape[0]
+        if self._executor is None or size == 0:
+            return FitnessFunction._fleet_costs(genes, self.provider, self.priorities, self.fleet,
+                                                with_splits=with_splits)
+
+        chunk = self.chunk_size or max(1, -(-size // (self.workers * 4)))
+        chunks = [genes[i:i + chunk] for i in range(0, size, chunk)]
+        results = list(self._executor.map(_worker_fleet_costs, chunks, [with_splits] * len(chunks)))
+        if not with_splits:
+            return np.concatenate(results)
+        costs = np.concatenate([c for c, _ in results])
+        splits = [sp for _, part in results for sp in part]
+        return costs, splits
@@ -0,0 +1,15 @@
+"""
+Fonte de aleatoriedade dos operadores sobre ``Route``.
+
+Crossover, mutação e seleção recebem um ``random.Random`` opcional: o motor
+passa o seu (``GeneticEngine.py_rng``, derivado da semente da execução) e
+chamadas avulsas continuam usando o módulo ``random``.
+"""
+
+import random
+from typing import Optional
+
+
+def resolve_rng(rng: Optional[random.Random]):
+    """``rng`` (execução reprodutível) ou, sem ele, o módulo ``random``."""
+    return rng if rng is not None else random
@@ -0,0 +1,135 @@
+"""
+Modelo de desenho pré-calculado (sem pygame).
+
+O laço de renderização roda a 60 FPS, mas a solução só muda quando uma geração
+termina. :class:`RenderModel` guarda tudo o que o desenho precisa — polilinhas,
+distâncias por rota, uso da frota e totais — e é reconstruído apenas quando
+chega um novo snapshot do solver; os frames só leem esses valores.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from distance_provider import DistanceProvider
+
+Polyline = Tuple[Tuple[float, float], ...]
+
+
+def route_distance_km(route: Any, deposito: Any, provider: Optional[DistanceProvider] = None) -> float:
+    """Distância depósito -> rota -> depósito em km (mesma escala da fitness)."""
+    seq = getattr(route, "delivery_points", None) or []
+    if not seq:
+        return 0.0
+    provider, idx = DistanceProvider.lookup(seq, provider)
+    if provider is not None and provider.covers_depot(deposito):
+        return float(provider.to_km(provider.roundtrip_length(idx)))
+    if hasattr(route, "distancia_roundtrip"):
+        return route.distancia_roundtrip(deposito) * DistanceProvider.KM_PER_PIXEL
+    d = 0.0
+    d += ((deposito.x - seq[0].x) ** 2 + (deposito.y - seq[0].y) ** 2) ** 0.5
+    for i in range(len(seq) - 1):
+        d += ((seq[i].x - seq[i + 1].x) ** 2 + (seq[i].y - seq[i + 1].y) ** 2) ** 0.5
+    d += ((seq[-1].x - deposito.x) ** 2 + (seq[-1].y - deposito.y) ** 2) ** 0.5
+    return d * DistanceProvider.KM_PER_PIXEL
+
+
+@dataclass(frozen=True)
+class RouteLayer:
+    """Uma subrota pronta para desenhar (depósito -> pontos -> depósito)."""
+    vehicle: str
+    polyline: Polyline
+    distance_km: float
+
+
+@dataclass(frozen=True)
+class RenderModel:
+    """Dados de desenho de uma geração.
+
+    Attributes:
+        generation: geração a que o modelo se refere.
+        current_tour: ciclo fechado do melhor indivíduo da geração (vazio se não houver).
+        layers: subrotas da melhor solução encontrada (modo VRP).
+        usage: uso da frota por tipo de veículo.
+        total_distance_km: soma das distâncias das subrotas.
+        total_cost: soma de distância x custo/km dos veículos conhecidos.
+    """
+    generation: int = 0
+    current_tour: Polyline = ()
+    layers: Tuple[RouteLayer, ...] = ()
+    usage: Dict[str, int] = field(default_factory=dict)
+    total_distance_km: float = 0.0
+    total_cost: float = 0.0
+
+    @staticmethod
+    def closed_polyline(route: Any) -> Polyline:
+        """Coordenadas do ciclo fechado de uma Route."""
+        pts = list(getattr(route, "delivery_points", None) or [])
+        if len(pts) < 2:
+            return ()
+        return tuple((p.x, p.y) for p in pts) + ((pts[0].x, pts[0].y),)
+
+    @staticmethod
+    def route_layers(routes: Sequence[Any], deposito: Any) -> Tuple[RouteLayer, ...]:
+        """Converte subrotas em camadas (polilinha + distância), ignorando rotas vazias."""
+        layers: List[RouteLayer] = []
+        depot_xy = (deposito.x, deposito.y)
+        for r in routes or []:
+            seq = getattr(r, "delivery_points", None) or []
+            if not seq:
+                continue
+            polyline = (depot_xy,) + tuple((p.x, p.y) for p in seq) + (depot_xy,)
+            vname = getattr(r, "vehicle_type", None) or "Vehicle"
+            layers.append(RouteLayer(vname, polyline, route_distance_km(r, deposito)))
+        return tuple(layers)
+
+    @classmethod
+    def for_routes(
+        cls,
+        routes: Sequence[Any],
+        deposito: Any,
+        fleet: Optional[Sequence[Any]] = None,
+        usage: Optional[Dict[str, int]] = None,
+        generation: int = 0,
+        current_tour: Polyline = (),
+    ) -> "RenderModel":
+        """Modelo para um conjunto de subrotas; ``usage`` substitui a contagem por rota."""
+        layers = cls.route_layers(routes, deposito) if deposito is not None else ()
+        cost_map = {str(v.name): float(v.cost_per_km) for v in fleet or []}
+        use: Dict[str, int] = {}
+        total_cost = 0.0
+        for layer in layers:
+            if layer.vehicle != "Vehicle":
+                use[layer.vehicle] = use.get(layer.vehicle, 0) + 1
+            if layer.vehicle in cost_map:
+                total_cost += layer.distance_km * cost_map[layer.vehicle]
+        return cls(
+            generation=generation,
+            current_tour=current_tour,
+            layers=layers,
+            usage=dict(usage) if usage else use,
+            total_distance_km=sum(layer.distance_km for layer in layers),
+            total_cost=total_cost,
+        )
+
+    @classmethod
+    def build(
+        cls,
+        generation: int,
+        best_route: Any,
+        generation_best: Any,
+        deposito: Any = None,
+        fleet: Optional[Sequence[Any]] = None,
+    ) -> "RenderModel":
+        """Modelo a partir do melhor global (subrotas) e do melhor da geração (linha).
+
+        Sem ``deposito`` (modo TSP) as subrotas são ignoradas.
+        """
+        routes = (getattr(best_route, "routes", None) or []) if deposito is not None else []
+        return cls.for_routes(
+            routes,
+            deposito,
+            fleet,
+            usage=getattr(best_route, "vehicle_usage", None),
+            generation=generation,
+            current_tour=cls.closed_polyline(generation_best),
+        )
@@ -0,0 +1,208 @@
+"""
+Heurísticas construtivas para semear a população inicial.
+
+Tours aleatórios obrigam o AG a gastar as primeiras dezenas de gerações
+saindo de soluções muito ruins. :class:`Seeding` gera cromossomos (permutações
+de índices, como em :class:`Population`) por três heurísticas clássicas:
+
+- vizinho mais próximo a partir de uma cidade inicial (KD-tree, O(N log N)
+  na prática; sem SciPy, busca na matriz de distâncias);
+- economias de Clarke–Wright restritas aos pares de vizinhos próximos
+  (listas de k vizinhos, O(N·k log(N·k)) após as listas), respeitando a
+  autonomia máxima da frota; as rotas são concatenadas no cromossomo e o
+  split as recupera;
+- varredura polar em torno do depósito (O(N log N)).
+
+:meth:`Seeding.seed_population` preenche uma fração da população com esses
+tours e deixa o restante aleatório, para manter a diversidade.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from delivery_point import DeliveryPoint
+from distance_provider import DistanceProvider
+from local_search import TwoOpt
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # SciPy é opcional: o vizinho mais próximo usa a matriz
+    cKDTree = None
+
+METHODS = ("nn", "savings", "sweep")
+SAVINGS_NEIGHBOURS = 16   # vizinhos por cidade considerados nas economias
+
+
+class Seeding:
+
+    # ---------------------------
+    # Heurísticas
+    # ---------------------------
+
+    @staticmethod
+    def nearest_neighbour(xy: np.ndarray, start: int = 0, matrix: Optional[np.ndarray] = None) -> np.ndarray:
+        """Tour do vizinho mais próximo a partir de ``start``.
+
+        Com SciPy, consulta uma KD-tree pedindo cada vez mais vizinhos até achar
+        um não visitado; sem ela, faz ``argmin`` na linha de ``matrix`` (ou da
+        matriz calculada das coordenadas) restrita aos não visitados.
+        """
+        n = len(xy)
+        tour = np.empty(n, dtype=np.int32)
+        if n == 0:
+            return tour
+        unvisited = np.ones(n, dtype=bool)
+        current = int(start)
+        tree = cKDTree(xy) if cKDTree is not None else None
+        if tree is None and matrix is None:
+            matrix = np.sqrt(((xy[:, None, :] - xy[None, :, :]) ** 2).sum(axis=2))
+        for step in range(n):
+            tour[step] = current
+            unvisited[current] = False
+            if step == n - 1:
+                break
+            if tree is None:
+                current = int(np.argmin(np.where(unvisited, matrix[current], np.inf)))
+                continue
+            # termina: com k >= n a consulta devolve todos os pontos, e ainda há livres
+            k = 8
+            while True:
+                _, idx = tree.query(xy[current], k=min(k, n))
+                idx = np.atleast_1d(idx)
+                free = idx[unvisited[idx]]
+                if free.size:
+                    break
+                k *= 4
+            current = int(free[0])
+        return tour
+
+    @staticmethod
+    def savings_candidates(matrix: np.ndarray, depot_legs: np.ndarray,
+                           neighbours: int = SAVINGS_NEIGHBOURS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pares ``(i, j)`` com ``j`` entre os ``neighbours`` vizinhos mais próximos
+        de ``i`` (ou vice-versa) e economia positiva, como ``(s, i, j)``.
+
+        Economias grandes só aparecem entre cidades próximas; calcular os pares
+        uma vez e reutilizá-los em cada variação evita os N²/2 pares completos.
+        """
+        n = len(depot_legs)
+        near = TwoOpt.neighbour_lists(matrix, neighbours)
+        rows = np.repeat(np.arange(n), near.shape[1])
+        cols = near.ravel()
+        i, j = np.minimum(rows, cols), np.maximum(rows, cols)
+        pairs = np.unique(i.astype(np.int64) * n + j)
+        i, j = pairs // n, pairs % n
+        s = depot_legs[i] + depot_legs[j] - matrix[i, j]
+        keep = s > 0
+        return s[keep], i[keep], j[keep]
+
+    @staticmethod
+    def savings(matrix: np.ndarray, depot_legs: np.ndarray, max_route_length: float = np.inf,
+                noise: float = 0.0, rng: Optional[np.random.Generator] = None,
+                candidates: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> np.ndarray:
+        """Economias de Clarke–Wright; devolve as rotas concatenadas.
+
+        ``s(i, j) = d(0, i) + d(0, j) - d(i, j)`` para os pares de
+        :meth:`savings_candidates` (ou ``candidates``, já calculados), na ordem
+        da maior economia. Duas rotas são unidas pelas pontas ``i`` e ``j`` se
+        o comprimento resultante não passar de ``max_route_length`` (mesma
+        unidade da matriz). ``noise`` perturba as economias multiplicativamente
+        para gerar variações do mesmo método.
+        """
+        n = len(depot_legs)
+        if n == 0:
+            return np.empty(0, dtype=np.int32)
+        s, iu, ju = candidates if candidates is not None else Seeding.savings_candidates(matrix, depot_legs)
+        if noise > 0:
+            rng = rng if rng is not None else np.random.default_rng()
+            s = s * (1.0 + noise * rng.standard_normal(s.shape))
+        order = np.argsort(-s, kind="stable")
+
+        routes: List[List[int]] = [[i] for i in range(n)]
+        route_of = list(range(n))
+        length = (2.0 * depot_legs).tolist()
+        legs = depot_legs.tolist()
+        remaining = n
+        for i, j in zip(iu[order].tolist(), ju[order].tolist()):
+            if remaining == 1:
+                break
+            a, b = route_of[i], route_of[j]
+            if a == b:
+                continue
+            ra, rb = routes[a], routes[b]
+            # i precisa ser ponta de ra e j ponta de rb
+            if ra[-1] != i:
+                if ra[0] != i:
+                    continue
+                ra.reverse()
+            if rb[0] != j:
+                if rb[-1] != j:
+                    continue
+                rb.reverse()
+            merged = length[a] + length[b] - legs[i] - legs[j] + float(matrix[i, j])
+            if merged > max_route_length:
+                continue
+            ra.extend(rb)
+            for c in rb:
+                route_of[c] = a
+            routes[b] = []
+            length[a] = merged
+            remaining -= 1
+        return np.asarray([c for r in routes for c in r], dtype=np.int32)
+
+    @staticmethod
+    def sweep(xy: np.ndarray, center: Sequence[float], offset: float = 0.0) -> np.ndarray:
+        """Pontos ordenados pelo ângulo em torno de ``center``, começando em ``offset`` (rad)."""
+        angles = np.arctan2(xy[:, 1] - center[1], xy[:, 0] - center[0])
+        return np.argsort((angles - offset) % (2 * np.pi), kind="stable").astype(np.int32)
+
+    # ---------------------------
+    # População
+    # ---------------------------
+
+    @staticmethod
+    def seed_population(genes: np.ndarray, provider: DistanceProvider, fraction: float,
+                        methods: Sequence[str] = METHODS, max_route_length: float = np.inf,
+                        rng: Optional[np.random.Generator] = None) -> int:
+        """Substitui as primeiras ``round(fraction * len(genes))`` linhas por tours construtivos.
+
+        Os métodos se alternam linha a linha; cada repetição varia a cidade
+        inicial (``nn``), o ângulo inicial (``sweep``) ou perturba as economias
+        (``savings``). Sem depósito, a varredura usa o centróide e as economias
+        são calculadas em relação a ele.
+
+        Args:
+            max_route_length: limite das rotas do Clarke–Wright, em pixels
+                (tipicamente a maior autonomia da frota convertida).
+
+        Returns:
+            Número de linhas semeadas.
+        """
+        if not methods:
+            raise ValueError("nenhum método de semeadura informado")
+        unknown = set(methods) - set(METHODS)
+        if unknown:
+            raise ValueError(f"métodos de semeadura desconhecidos: {sorted(unknown)}")
+        rng = rng if rng is not None else np.random.default_rng()
+        size, n = genes.shape
+        count = min(size, int(round(fraction * size)))
+        if count <= 0 or n < 2:
+            return 0
+
+        xy = DeliveryPoint.coordinates(provider.points)
+        depot = provider.depot
+        center = (depot.x, depot.y) if depot is not None else tuple(xy.mean(axis=0))
+        legs = provider.depot_legs if provider.depot_legs is not None else np.hypot(*(xy - center).T)
+        candidates = Seeding.savings_candidates(provider.matrix, legs) if "savings" in methods else None
+        for row in range(count):
+            method = methods[row % len(methods)]
+            repeat = row // len(methods)
+            if method == "nn":
+                genes[row] = Seeding.nearest_neighbour(xy, int(rng.integers(n)), provider.matrix)
+            elif method == "savings":
+                genes[row] = Seeding.savings(provider.matrix, legs, max_route_length,
+                                             noise=0.1 if repeat else 0.0, rng=rng, candidates=candidates)
+            else:
+                genes[row] = Seeding.sweep(xy, center, float(rng.uniform(0, 2 * np.pi)))
+        return count
@@ -1,7 +1,10 @@
 import random
-from typing import List
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from route import Route
+from random_source import resolve_rng
 from app_logging import log_performance, get_logger
 
 # Logger para este módulo
@@ -12,7 +15,8 @@ logger = get_logger(__name__)
 def tournament_selection(
     population: List[Route],
     aptitudes: List[float],
-    tournament_size: int
+    tournament_size: int,
+    rng: Optional[random.Random] = None
 ) -> Route:
     """
     Seleciona uma Rota da população usando o método de seleção por torneio.
@@ -20,7 +24,7 @@ def tournament_selection(
     logger.debug(f"Seleção por torneio: população={len(population)}, tamanho_torneio={tournament_size}")
     
     population_with_aptitude = list(zip(population, aptitudes))
-    tournament = random.sample(population_with_aptitude, tournament_size)
+    tournament = resolve_rng(rng).sample(population_with_aptitude, tournament_size)
     winner = min(tournament, key=lambda item: item[1])
     
     logger.debug(f"Vencedor do torneio com fitness: {winner[1]:.6f}")
@@ -31,7 +35,8 @@ def tournament_selection(
 def tournament_selection_refined(
     population: List[Route],
     distances: List[float],
-    tournament_size: int
+    tournament_size: int,
+    rng: Optional[random.Random] = None
 ) -> Route:
     """
     Versão refinada da seleção por torneio.
@@ -45,7 +50,7 @@ def tournament_selection_refined(
     assert 1 <= tournament_size <= population_size, "O tamanho do torneio deve ser válido."
 
     # Seleciona 'tournament_size' índices aleatórios
-    competitor_indices = random.sample(range(population_size), tournament_size)
+    competitor_indices = resolve_rng(rng).sample(range(population_size), tournament_size)
     
     # Encontra o índice do vencedor (aquele com a menor distância)
     winner_index = min(competitor_indices, key=lambda index: distances[index])
@@ -57,7 +62,8 @@ def tournament_selection_refined(
 @log_performance
 def roulette_wheel_selection(
     population: List[Route],
-    aptitudes: List[float] # Fitness here MUST be a value to be maximized (e.g., 1/distance)
+    aptitudes: List[float], # Fitness here MUST be a value to be maximized (e.g., 1/distance)
+    rng: Optional[random.Random] = None
 ) -> Route:
     """
     Seleciona uma Rota da população usando o método da Roleta.
@@ -69,10 +75,10 @@ def roulette_wheel_selection(
     # Se todas as aptidões forem zero (caso extremo), retorna um indivíduo aleatório
     if total_fitness == 0:
         logger.warning("Todas as aptidões são zero - seleção aleatória")
-        return random.choice(population)
+        return resolve_rng(rng).choice(population)
         
     # Gera um ponto aleatório na "roleta"
-    pick = random.uniform(0, total_fitness)
+    pick = resolve_rng(rng).uniform(0, total_fitness)
     logger.debug(f"Ponto da roleta: {pick:.6f}")
     
     current = 0
@@ -90,7 +96,8 @@ def roulette_wheel_selection(
 @log_performance
 def rank_selection(
     population: List[Route],
-    aptitudes: List[float] # Aptidão aqui DEVE ser um valor a ser maximizado
+    aptitudes: List[float], # Aptidão aqui DEVE ser um valor a ser maximizado
+    rng: Optional[random.Random] = None
 ) -> Route:
     """
     Seleciona uma Rota usando Seleção por Rank.
@@ -109,7 +116,7 @@ def rank_selection(
     
     # 4. A lógica da Roleta é aplicada sobre os ranks
     total_rank = sum(ranks)
-    pick = random.uniform(0, total_rank)
+    pick = resolve_rng(rng).uniform(0, total_rank)
     logger.debug(f"Rank total: {total_rank}, ponto selecionado: {pick:.2f}")
     
     current = 0
@@ -129,6 +136,144 @@ def rank_selection(
     return population[last_index]
 
 
+# ---------------------------
+# Seleção em lote (índices)
+# ---------------------------
+# As funções abaixo preparam a tabela de pesos uma vez por geração e devolvem
+# todos os índices escolhidos de uma só vez, em vez de uma varredura linear
+# (e, no rank, uma ordenação) por indivíduo selecionado.
+
+def _generator(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    return rng if rng is not None else np.random.default_rng()
+
+
+def sample_cumulative(weights: Sequence[float], count: int,
+                      rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Sorteia ``count`` índices com probabilidade proporcional a ``weights``
+    (soma acumulada + ``searchsorted``: O(N + count log N))."""
+    rng = _generator(rng)
+    cumulative = np.cumsum(np.asarray(weights, dtype=float))
+    total = cumulative[-1]
+    if total <= 0:
+        return rng.integers(len(cumulative), size=count)
+    picks = np.searchsorted(cumulative, rng.random(count) * total, side="right")
+    return np.minimum(picks, len(cumulative) - 1)
+
+
+def alias_table(weights: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Tabela de alias de Walker (método de Vose) em O(N).
+
+    Retorna ``(prob, alias)``: a célula ``i`` devolve ``i`` com probabilidade
+    ``prob[i]`` e ``alias[i]`` caso contrário.
+    """
+    w = np.asarray(weights, dtype=float)
+    n = len(w)
+    scaled = (w * n / w.sum()).tolist()
+    prob = np.ones(n)
+    alias = np.arange(n)
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    return prob, alias
+
+
+def sample_alias(prob: np.ndarray, alias: np.ndarray, count: int,
+                 rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Sorteia ``count`` índices de uma tabela de :func:`alias_table` (O(1) cada)."""
+    rng = _generator(rng)
+    cells = rng.integers(len(prob), size=count)
+    return np.where(rng.random(count) < prob[cells], cells, alias[cells])
+
+
+def roulette_wheel_selection_batch(
+    aptitudes: Sequence[float],
+    count: int,
+    rng: Optional[np.random.Generator] = None,
+    use_alias: bool = False,
+) -> np.ndarray:
+    """Roleta em lote: ``count`` índices proporcionais à aptidão (a maximizar).
+
+    Com ``use_alias`` usa a tabela de Walker (sorteio O(1)); caso contrário,
+    a soma acumulada com ``searchsorted``.
+    """
+    rng = _generator(rng)
+    w = np.asarray(aptitudes, dtype=float)
+    if w.sum() <= 0:
+        logger.warning("Todas as aptidões são zero - seleção aleatória")
+        return rng.integers(len(w), size=count)
+    if use_alias:
+        return sample_alias(*alias_table(w), count, rng)
+    return sample_cumulative(w, count, rng)
+
+
+def rank_weights(aptitudes: Sequence[float]) -> np.ndarray:
+    """Peso de cada indivíduo pelo seu rank (1 para o pior, N para o melhor);
+    empates mantêm a ordem original, como em :func:`rank_selection`."""
+    order = np.argsort(np.asarray(aptitudes, dtype=float), kind="stable")
+    ranks = np.empty(len(order), dtype=float)
+    ranks[order] = np.arange(1, len(order) + 1)
+    return ranks
+
+
+def rank_selection_batch(
+    aptitudes: Sequence[float],
+    count: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Seleção por rank em lote: uma ordenação por geração, não por sorteio."""
+    return sample_cumulative(rank_weights(aptitudes), count, rng)
+
+
+def stochastic_universal_sampling(
+    aptitudes: Sequence[float],
+    count: int,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Amostragem Universal Estocástica (SUS).
+
+    Um único sorteio posiciona ``count`` ponteiros igualmente espaçados sobre a
+    roleta, o que reduz a variância em relação a ``count`` giros independentes.
+    Os índices são embaralhados para que os pares de pais não saiam ordenados.
+    """
+    rng = _generator(rng)
+    cumulative = np.cumsum(np.asarray(aptitudes, dtype=float))
+    total = cumulative[-1]
+    if total <= 0:
+        logger.warning("Todas as aptidões são zero - seleção aleatória")
+        return rng.integers(len(cumulative), size=count)
+    pointers = (rng.random() + np.arange(count)) * (total / count)
+    picks = np.minimum(np.searchsorted(cumulative, pointers, side="right"), len(cumulative) - 1)
+    return rng.permutation(picks)
+
+
+def tournament_selection_batch(
+    aptitudes: Sequence[float],
+    count: int,
+    tournament_size: int = 3,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """Torneio em lote: ``count`` torneios de ``tournament_size`` competidores.
+
+    Sorteia uma matriz ``(count x tournament_size)`` de índices (com reposição)
+    e escolhe, em cada linha, o de maior aptidão (``argmax``; aptidão a
+    maximizar). Quanto maior o torneio, maior a pressão seletiva.
+
+    Raises:
+        ValueError: se ``tournament_size`` < 1.
+    """
+    if tournament_size < 1:
+        raise ValueError(f"O tamanho do torneio deve ser >= 1 (recebido {tournament_size}).")
+    w = np.asarray(aptitudes, dtype=float)
+    competitors = _generator(rng).integers(len(w), size=(count, tournament_size))
+    winners = np.argmax(w[competitors], axis=1)
+    return competitors[np.arange(count), winners]
+
+
 class Selection:
     """Wrapper class that exposes selection functions as static methods.
 
@@ -136,17 +281,39 @@ class Selection:
     """
 
     @staticmethod
-    def tournament(population: List[Route], aptitudes: List[float], tournament_size: int) -> Route:
-        return tournament_selection(population, aptitudes, tournament_size)
+    def tournament(population: List[Route], aptitudes: List[float], tournament_size: int,
+                   rng: Optional[random.Random] = None) -> Route:
+        return tournament_selection(population, aptitudes, tournament_size, rng)
+
+    @staticmethod
+    def tournament_refined(population: List[Route], distances: List[float], tournament_size: int,
+                           rng: Optional[random.Random] = None) -> Route:
+        return tournament_selection_refined(population, distances, tournament_size, rng)
+
+    @staticmethod
+    def roulette(population: List[Route], aptitudes: List[float], rng: Optional[random.Random] = None) -> Route:
+        return roulette_wheel_selection(population, aptitudes, rng)
+
+    @staticmethod
+    def rank(population: List[Route], aptitudes: List[float], rng: Optional[random.Random] = None) -> Route:
+        return rank_selection(population, aptitudes, rng)
+
+    @staticmethod
+    def roulette_batch(aptitudes: Sequence[float], count: int,
+                       rng: Optional[np.random.Generator] = None, use_alias: bool = False) -> np.ndarray:
+        return roulette_wheel_selection_batch(aptitudes, count, rng, use_alias)
 
     @staticmethod
-    def tournament_refined(population: List[Route], distances: List[float], tournament_size: int) -> Route:
-        return tournament_selection_refined(population, distances, tournament_size)
+    def rank_batch(aptitudes: Sequence[float], count: int,
+                   rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        return rank_selection_batch(aptitudes, count, rng)
 
     @staticmethod
-    def roulette(population: List[Route], aptitudes: List[float]) -> Route:
-        return roulette_wheel_selection(population, aptitudes)
+    def sus(aptitudes: Sequence[float], count: int,
+            rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        return stochastic_universal_sampling(aptitudes, count, rng)
 
     @staticmethod
-    def rank(population: List[Route], aptitudes: List[float]) -> Route:
-        return rank_selection(population, aptitudes)
+    def tournament_batch(aptitudes: Sequence[float], count: int, tournament_size: int = 3,
+                         rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        return tournament_selection_batch(aptitudes, count, tournament_size, rng)
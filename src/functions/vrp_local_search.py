@@ -0,0 +1,284 @@
+"""
+Busca local entre rotas para o VRP.
+
+O split (``FitnessFunction._split_legs``) só corta o cromossomo em subrotas: um
+cliente nunca muda de rota nem de posição relativa, então más atribuições de
+veículo sobrevivem até uma mutação de sorte. :class:`InterRouteSearch` aplica
+três movimentos entre pares de subrotas, sobre listas de índices:
+
+- *relocate*: move um cliente para antes/depois de um vizinho em outra rota;
+- *exchange*: troca dois clientes de rotas diferentes;
+- *2-opt\\**: troca as caudas de duas rotas, criando a aresta ``(u, w)``.
+
+Os candidatos vêm das listas de ``k`` vizinhos mais próximos; o ganho em
+distância é O(1) (pernas locais e distâncias acumuladas por rota). Após cada
+movimento os veículos das duas rotas são reescolhidos (o mais barato que cobre
+a autonomia), e o uso acima de ``VehicleType.count`` é penalizado como na
+fitness. No modo lamarckiano o resultado é reescrito no cromossomo como a
+concatenação das subrotas.
+"""
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from distance_provider import DistanceProvider
+from fitness_function import FitnessFunction
+from local_search import TwoOpt
+from route import Route
+from vehicle import VehicleType
+
+DEPOT = -1
+
+
+class InterRouteSearch:
+    """Relocate, exchange e 2-opt* entre subrotas de uma solução VRP.
+
+    Args:
+        provider: distâncias da instância (com depósito).
+        fleet: tipos de veículos disponíveis.
+        neighbours: tamanho das listas de candidatos de cada cliente.
+    """
+
+    EPS = 1e-9
+    OVERUSE_PENALTY = FitnessFunction.BIG_PENALTY * 0.01
+
+    def __init__(self, provider: DistanceProvider, fleet: Sequence[VehicleType], neighbours: int = 8):
+        if provider.depot_legs is None:
+            raise ValueError("InterRouteSearch requer um DistanceProvider com depósito")
+        self.provider = provider
+        self.fleet = list(fleet)
+        self.matrix_km = provider.matrix * provider.scale
+        self.legs: List[float] = (provider.depot_legs * provider.scale).tolist()
+        self.neighbours: List[List[int]] = TwoOpt.neighbour_lists(provider.matrix, neighbours).tolist()
+        self.autonomy = [float(vt.autonomy) for vt in self.fleet]
+        self.cost_per_km = [float(vt.cost_per_km) for vt in self.fleet]
+        self.counts = [int(vt.count) for vt in self.fleet]
+
+    # ---------------------------
+    # Entradas e saídas
+    # ---------------------------
+
+    def improve(self, tour: np.ndarray, bounds: Sequence[int], vehicles: Sequence[int],
+                deadline: Optional[float] = None) -> Tuple[np.ndarray, float]:
+        """Melhora o split ``(bounds, vehicles)`` de ``tour`` e reescreve o cromossomo.
+
+        Returns:
+            ``(novo_tour, ganho)``: subrotas melhoradas concatenadas (mesmo dtype)
+            e a redução do custo (distância x custo/km + penalidade de frota).
+        """
+        tour = np.asarray(tour)
+        order = tour.tolist()
+        routes = [order[i:j] for i, j in zip(bounds, bounds[1:])]
+        routes, _, gain = self.search(routes, list(vehicles), deadline)
+        return np.asarray([c for r in routes for c in r], dtype=tour.dtype), gain
+
+    def improve_routes(self, routes: Sequence[Route],
+                       deadline: Optional[float] = None) -> Tuple[List[Route], Dict[str, int]]:
+        """Versão sobre as subrotas devolvidas por ``calculate_fitness_with_fleet``.
+
+        As rotas devem usar os pontos de ``provider``; devolve novas :class:`Route`
+        com o veículo atribuído e o uso da frota.
+        """
+        names = {vt.name: v for v, vt in enumerate(self.fleet)}
+        index_routes, vehicles = [], []
+        for r in routes:
+            idx = self.provider.indices(r.delivery_points)
+            if idx is None:
+                raise ValueError("rota com pontos fora do DistanceProvider")
+            index_routes.append(idx.tolist())
+            vehicles.append(names.get(r.vehicle_type, self._cheapest(self._length(idx.tolist()))))
+        index_routes, vehicles, _ = self.search(index_routes, vehicles, deadline)
+
+        points = self.provider.points
+        out: List[Route] = []
+        usage: Dict[str, int] = {}
+        for seq, v in zip(index_routes, vehicles):
+            r = Route([points[k] for k in seq])
+            r.assign_vehicle(self.fleet[v].name)
+            out.append(r)
+            usage[self.fleet[v].name] = usage.get(self.fleet[v].name, 0) + 1
+        return out, usage
+
+    # ---------------------------
+    # Custos
+    # ---------------------------
+
+    def _d(self, a: int, b: int) -> float:
+        """Distância (km) entre clientes ou o depósito (``DEPOT``)."""
+        if a == DEPOT:
+            return 0.0 if b == DEPOT else self.legs[b]
+        if b == DEPOT:
+            return self.legs[a]
+        return self.matrix_km.item(a, b)
+
+    def _length(self, seq: List[int]) -> float:
+        if not seq:
+            return 0.0
+        m = self.matrix_km
+        inner = float(m[seq[:-1], seq[1:]].sum()) if len(seq) > 1 else 0.0
+        return self.legs[seq[0]] + inner + self.legs[seq[-1]]
+
+    def _cheapest(self, length: float) -> int:
+        """Veículo mais barato que cobre ``length`` (ou o de maior autonomia)."""
+        feasible = [v for v in range(len(self.fleet)) if length <= self.autonomy[v]]
+        if not feasible:
+            return max(range(len(self.fleet)), key=lambda v: self.autonomy[v])
+        return min(feasible, key=lambda v: self.cost_per_km[v])
+
+    def _overuse(self, usage: List[int]) -> int:
+        return sum(max(0, u - c) for u, c in zip(usage, self.counts))
+
+    def _reassign(self, lengths: Tuple[float, float], freed: Tuple[int, int],
+                  usage: List[int]) -> Tuple[float, List[int], List[int]]:
+        """Escolhe veículos para duas rotas alteradas.
+
+        ``freed`` são os veículos atuais delas (devolvidos à frota antes da
+        escolha). A rota mais longa escolhe primeiro; cada uma fica com o tipo
+        de menor custo + penalidade marginal de uso acima de ``count``.
+
+        Returns:
+            ``(custo, veículos, uso)`` com custo ``inf`` se alguma rota não
+            couber na autonomia de nenhum veículo.
+        """
+        usage = list(usage)
+        for v in freed:
+            if v >= 0:
+                usage[v] -= 1
+        chosen = [-1, -1]
+        total = 0.0
+        for k in sorted((0, 1), key=lambda k: -lengths[k]):
+            length = lengths[k]
+            if length == 0.0:
+                continue
+            best, best_cost = -1, float("inf")
+            for v in range(len(self.fleet)):
+                if length > self.autonomy[v]:
+                    continue
+                c = length * self.cost_per_km[v]
+                if usage[v] >= self.counts[v]:
+                    c += self.OVERUSE_PENALTY
+                if c < best_cost:
+                    best, best_cost = v, c
+            if best < 0:
+                return float("inf"), chosen, usage
+            chosen[k] = best
+            usage[best] += 1
+            total += length * self.cost_per_km[best]
+        return total, chosen, usage
+
+    # ---------------------------
+    # Busca
+    # ---------------------------
+
+    def search(self, routes: List[List[int]], vehicles: List[int],
+               deadline: Optional[float] = None) -> Tuple[List[List[int]], List[int], float]:
+        """Primeira melhoria sobre todos os clientes até não haver ganho (ou ``deadline``).
+
+        Returns:
+            ``(rotas, veículos, ganho)`` sem as rotas que ficaram vazias.
+        """
+        routes = [list(r) for r in routes]
+        vehicles = list(vehicles)
+        route_of = [0] * len(self.legs)
+        pos_of = [0] * len(self.legs)
+        cum: List[List[float]] = [[] for _ in routes]
+        length = [0.0] * len(routes)
+        usage = [0] * len(self.fleet)
+        for v in vehicles:
+            usage[v] += 1
+
+        def refresh(r: int) -> None:
+            seq = routes[r]
+            acc, prev, c = 0.0, DEPOT, []
+            for k, city in enumerate(seq):
+                acc += self._d(prev, city)
+                c.append(acc)
+                route_of[city], pos_of[city] = r, k
+                prev = city
+            cum[r] = c
+            length[r] = acc + self._d(prev, DEPOT) if seq else 0.0
+
+        for r in range(len(routes)):
+            refresh(r)
+
+        def cost(r: int) -> float:
+            return length[r] * self.cost_per_km[vehicles[r]] if routes[r] else 0.0
+
+        def head(r: int, k: int) -> float:
+            """Distância depósito -> routes[r][k] (0 para k = -1)."""
+            return cum[r][k] if k >= 0 else 0.0
+
+        def tail(r: int, k: int) -> float:
+            """Distância routes[r][k] -> fim -> depósito (0 para k = len)."""
+            return length[r] - cum[r][k] if k < len(routes[r]) else 0.0
+
+        def at(r: int, k: int) -> int:
+            return routes[r][k] if 0 <= k < len(routes[r]) else DEPOT
+
+        d = self._d
+        gain_total = 0.0
+        improved = True
+        checks = 0
+        while improved:
+            improved = False
+            for u in [c for r in routes for c in r]:
+                checks += 1
+                if deadline is not None and checks % 32 == 0 and time.perf_counter() >= deadline:
+                    improved = False
+                    break
+                A, i = route_of[u], pos_of[u]
+                p, nx = at(A, i - 1), at(A, i + 1)
+                removed = d(p, nx) - d(p, u) - d(u, nx)
+                base_over = self._overuse(usage)
+                move = None
+                for w in self.neighbours[u]:
+                    B, j = route_of[w], pos_of[w]
+                    if B == A:
+                        continue
+                    old = cost(A) + cost(B) + self.OVERUSE_PENALTY * base_over
+                    pw, nw = at(B, j - 1), at(B, j + 1)
+                    candidates = (
+                        # relocate u antes / depois de w
+                        ("before", length[A] + removed, length[B] + d(pw, u) + d(u, w) - d(pw, w)),
+                        ("after", length[A] + removed, length[B] + d(w, u) + d(u, nw) - d(w, nw)),
+                        # troca u <-> w
+                        ("swap", length[A] - d(p, u) - d(u, nx) + d(p, w) + d(w, nx),
+                         length[B] - d(pw, w) - d(w, nw) + d(pw, u) + d(u, nw)),
+                        # 2-opt*: A[..u] + B[w..] e B[..pw] + A[nx..]
+                        ("star", head(A, i) + d(u, w) + tail(B, j),
+                         head(B, j - 1) + d(pw, nx) + tail(A, i + 1)),
+                    )
+                    for kind, len_a, len_b in candidates:
+                        if len(routes[A]) == 1 and kind in ("before", "after"):
+                            len_a = 0.0          # A fica vazia (evita resíduo de ponto flutuante)
+                        new, chosen, new_usage = self._reassign((len_a, len_b), (vehicles[A], vehicles[B]), usage)
+                        delta = new + self.OVERUSE_PENALTY * self._overuse(new_usage) - old
+                        if delta < -self.EPS:
+                            move = (kind, A, i, B, j, chosen, new_usage, delta)
+                            break
+                    if move is not None:
+                        break
+                if move is None:
+                    continue
+
+                kind, A, i, B, j, chosen, usage, delta = move
+                ra, rb = routes[A], routes[B]
+                if kind == "before":
+                    rb.insert(j, ra.pop(i))
+                elif kind == "after":
+                    rb.insert(j + 1, ra.pop(i))
+                elif kind == "swap":
+                    ra[i], rb[j] = rb[j], ra[i]
+                else:
+                    routes[A], routes[B] = ra[:i + 1] + rb[j:], rb[:j] + ra[i + 1:]
+                for r, v in ((A, chosen[0]), (B, chosen[1])):
+                    vehicles[r] = v
+                    refresh(r)
+                gain_total -= delta
+                improved = True
+
+        # os movimentos só deslocam clientes entre rotas (nenhum é perdido ou duplicado)
+        kept = [r for r in range(len(routes)) if routes[r]]
+        return [routes[r] for r in kept], [vehicles[r] for r in kept], gain_total
@@ -20,14 +20,14 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../func
 # ---------------- IMPORTS DO PROJETO ----------------
 from delivery_point import DeliveryPoint
 from draw_functions import DrawFunctions
+from render_model import RenderModel
 from route import Route
-from crossover_function import Crossover
-from mutation_function import Mutation
-from selection_functions import Selection
-from fitness_function import FitnessFunction
+from distance_provider import DistanceProvider
 from ui_layout import UILayout
 from app_logging import configurar_logging, get_logger
 from product import Product
+from main.solver_engine import GAConfig, GeneticEngine
+from main.background_solver import BackgroundSolver, SolverSnapshot
 
 # LLM (da branch llm-feature)
 try:
@@ -54,7 +54,6 @@ except Exception:
         ]
 
 # ---------------- PYGAME/CORES ----------------
-pygame.init()
 WINDOW_WIDTH = UILayout.WINDOW_WIDTH
 WINDOW_HEIGHT = UILayout.WINDOW_HEIGHT
 
@@ -135,26 +134,13 @@ def _normalize_first_json(md: str, *, default_obj: dict, list_key: str) -> tuple
 
 
 class TSPGeneticAlgorithm:
-    # --------- Decorator de performance da release ----------
-    @staticmethod
-    def log_performance(func):
-        import time
-        def wrapper(*args, **kwargs):
-            logger = get_logger(func.__module__)
-            start = time.perf_counter()
-            logger.debug(f"[PERF] Iniciando '{func.__name__}'")
-            result = func(*args, **kwargs)
-            elapsed = (time.perf_counter() - start) * 1000
-            logger.info(f"[PERF] '{func.__name__}' executado em {elapsed:.2f} ms")
-            return result
-        return wrapper
-
     def __init__(self):
         # Logger
         self.logger = get_logger(__name__)
         self.logger.info("Inicializando aplicação TSP Genetic Algorithm")
 
         # Pygame
+        pygame.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("TSP - Genetic Algorithm Approach")
         self.clock = pygame.time.Clock()
@@ -168,7 +154,7 @@ class TSPGeneticAlgorithm:
         # Variáveis do algoritmo (release)
         self.delivery_points: List[DeliveryPoint] = []
         self.distance_matrix = None
-        self.population: List[Route] = []
+        self.distance_provider: DistanceProvider | None = None
         self.population_size = 50
         self.max_generations = 100
         self.mutation_method = "swap"
@@ -188,6 +174,16 @@ class TSPGeneticAlgorithm:
         self.fleet: List[VehicleType] = default_fleet()
         self.depot: DeliveryPoint | None = None
 
+        # Avaliação paralela da fitness VRP (0/1 = serial)
+        self.fitness_workers = int(os.getenv("GA_FITNESS_WORKERS", "0"))
+        self.fitness_chunk_size: int | None = None
+        # Motor headless do AG (criado em start_algorithm), executado em thread de fundo
+        self.engine: GeneticEngine | None = None
+        self.solver: BackgroundSolver | None = None
+        self._snapshot: SolverSnapshot | None = None
+        # Dados de desenho em cache (reconstruídos a cada geração, não a cada frame)
+        self.render_model = RenderModel()
+
         # Interface/controles padrão (release)
         self.ui_layout = UILayout()
         self.map_type = "random"  # "random", "circle", "custom"
@@ -274,164 +270,72 @@ class TSPGeneticAlgorithm:
             self.logger.info("Modo customizado ativado - aguardando input do usuário")
 
         if self.delivery_points:
-            self.calculate_distance_matrix()
             self.depot = self._compute_depot()
+            self.calculate_distance_matrix()
             self.logger.info(f"Geradas {len(self.delivery_points)} cidades com sucesso")
 
-    # -------------------- POPULAÇÃO/SELEÇÃO/CROSSOVER/MUTAÇÃO (release) --------------------
-    @log_performance.__func__
-    def initialize_population(self):
-        """Inicializa a população com cromossomos aleatórios"""
-        self.logger.info(f"Inicializando população de tamanho {self.population_size}")
-        self.population = []
-        base = list(self.delivery_points)
-        for _ in range(self.population_size):
-            shuffled = base[:]
-            random.shuffle(shuffled)
-            self.population.append(Route(shuffled))
-        self.logger.debug(f"População inicializada com {len(self.population)} rotas")
-
-    @log_performance.__func__
-    def selection(self, population: List[Route], fitness_scores: List[float]) -> List[Route]:
-        """Seleção usando métodos do selection_functions.py com suporte a diferentes algoritmos e elitismo."""
-        self.logger.debug(f"Iniciando seleção: método={self.selection_method}, elitismo={self.elitism}")
-        total_fitness = sum(fitness_scores)
-        if total_fitness == 0:
-            self.logger.warning("Total de fitness zero, copiando população.")
-            return population.copy()
-
-        new_population = []
-        for _ in range(len(population)):
-            if self.selection_method == "roulette":
-                chosen = Selection.roulette(population, fitness_scores)
-            elif self.selection_method == "tournament":
-                # release chama tournament_refined
-                chosen = Selection.tournament_refined(population, fitness_scores, tournament_size=3)
-            elif self.selection_method == "rank":
-                chosen = Selection.rank(population, fitness_scores)
-            else:
-                chosen = Selection.roulette(population, fitness_scores)
-            new_population.append(chosen.copy())
-
-        if self.elitism and self.best_route:
-            best_idx = fitness_scores.index(max(fitness_scores))
-            self.logger.info(
-                f"Elitismo: substituindo último indivíduo pelo melhor da geração (fitness={fitness_scores[best_idx]:.4f})"
-            )
-            new_population[-1] = population[best_idx].copy()
-
-        self.logger.debug(f"Seleção concluída. Nova população: {len(new_population)} indivíduos.")
-        return new_population
-
-    @log_performance.__func__
-    def crossover(self, parent1: Route, parent2: Route) -> Tuple[Route, Route]:
-        """Wrapper que usa as implementações de Crossover baseado no método selecionado."""
-        self.logger.debug(f"Executando crossover: método={self.crossover_method}")
-        if self.crossover_method == "pmx":
-            return Crossover.crossover_parcialmente_mapeado_pmx(parent1, parent2)
-        elif self.crossover_method == "ox1":
-            return Crossover.crossover_ordenado_ox1(parent1, parent2)
-        elif self.crossover_method == "cx":
-            return Crossover.crossover_de_ciclo_cx(parent1, parent2)
-        elif self.crossover_method == "kpoint":
-            return Crossover.crossover_multiplos_pontos_kpoint(parent1, parent2, k=2)
-        elif self.crossover_method == "erx":
-            child1 = Crossover.erx_crossover(parent1, parent2)
-            child2 = Crossover.erx_crossover(parent2, parent1)
-            return child1, child2
-        else:
-            return Crossover.crossover_parcialmente_mapeado_pmx(parent1, parent2)
-
-    @log_performance.__func__
-    def mutate(self, route: Route) -> Route:
-        """Aplica operador de mutação conforme método selecionado."""
-        self.logger.debug(f"Executando mutação: método={self.mutation_method}")
-        if self.mutation_method == "swap":
-            return Mutation.mutacao_por_troca(route)
-        elif self.mutation_method == "inverse":
-            return Mutation.mutacao_por_inversao(route)
-        elif self.mutation_method == "shuffle":
-            return Mutation.mutacao_por_embaralhamento(route)
-        else:
-            return Mutation.mutacao_por_troca(route)
-
+    # -------------------- DISTÂNCIAS --------------------
     def calculate_distance_matrix(self):
-        """Calcula a matriz de distâncias entre todos os pontos de entrega"""
-        self.distance_matrix = DeliveryPoint.compute_distance_matrix(self.delivery_points)
-
-    # -------------------- EXECUÇÃO DE UMA GERAÇÃO (release com VRP) --------------------
-    @log_performance.__func__
-    def run_generation(self):
-        """Executa uma geração do algoritmo genético"""
-        self.logger.info(f"Executando geração {self.current_generation}")
-        if not self.population:
-            self.logger.warning("População vazia, inicializando...")
-            self.initialize_population()
-
-        # ---- cálculo de fitness ----
-        if self.use_fleet and self.depot is not None:
-            # VRP
-            results = [FitnessFunction.calculate_fitness_with_fleet(ind, self.depot, self.fleet)
-                       for ind in self.population]
-            fitness_scores = [r[0] for r in results]
-            for ind, (fit, routes, usage) in zip(self.population, results):
-                ind.fitness = fit
-                ind.routes = routes
-                ind.vehicle_usage = usage
-                self.logger.debug(f"Fitness: {fit:.4f} | Uso frota: {usage}")
-        else:
-            fitness_scores = [FitnessFunction.calculate_fitness_with_constraints(ind)
-                              for ind in self.population]
-            for ind, fit in zip(self.population, fitness_scores):
-                ind.fitness = fit
-                if hasattr(ind, "routes"):
-                    ind.routes = None
-                if hasattr(ind, "vehicle_usage"):
-                    ind.vehicle_usage = None
-                self.logger.debug(f"Fitness: {fit:.4f}")
-
-        # Atualizar melhor rota
-        max_fitness = max(fitness_scores)
-        if max_fitness > self.best_fitness:
-            old_fitness = self.best_fitness
-            self.best_fitness = max_fitness
-            best_idx = fitness_scores.index(max_fitness)
-            self.best_route = self.population[best_idx].copy()
-
-            if self.use_fleet:
-                best_res = results[best_idx]
-                self.best_route.routes = best_res[1]
-                self.best_route.vehicle_usage = best_res[2]
-
-            if old_fitness == 0 or (old_fitness > 0 and (max_fitness - old_fitness) / old_fitness > 0.1):
-                self.logger.info(
-                    f"Geração {self.current_generation}: Nova melhor fitness {max_fitness:.4f} (+{max_fitness - old_fitness:.4f})"
-                )
-
-        # Histórico
-        self.fitness_history.append(max_fitness)
-        mean_fitness = np.mean(fitness_scores)
-        self.mean_fitness_history.append(mean_fitness)
-        self.logger.info(f"Fitness máximo: {max_fitness:.4f} | Fitness médio: {mean_fitness:.4f}")
-
-        if self.current_generation % 10 == 0:
-            self.logger.info(f"Checkpoint: geração {self.current_generation}")
-
-        # Seleção
-        self.population = self.selection(self.population, fitness_scores)
+        """Calcula a matriz de distâncias e vincula o provider aos pontos e ao depósito."""
+        self.distance_provider = DistanceProvider(self.delivery_points, self.depot)
+        self.distance_matrix = self.distance_provider.matrix
+
+    # -------------------- MOTOR DO AG (headless) --------------------
+    def _engine_config(self) -> GAConfig:
+        """Parâmetros atuais da interface no formato do motor."""
+        return GAConfig(
+            population_size=self.population_size,
+            max_generations=self.max_generations,
+            selection_method=self.selection_method,
+            crossover_method=self.crossover_method,
+            mutation_method=self.mutation_method,
+            elitism=self.elitism,
+            use_fleet=self.use_fleet,
+            fitness_workers=self.fitness_workers,
+            fitness_chunk_size=self.fitness_chunk_size,
+        )
 
-        # Crossover e mutação
-        new_population = []
-        for i in range(0, len(self.population), 2):
-            parent1 = self.population[i]
-            parent2 = self.population[(i + 1) % len(self.population)]
-            child1, child2 = self.crossover(parent1, parent2)
-            child1 = self.mutate(child1)
-            child2 = self.mutate(child2)
-            new_population.extend([child1, child2])
+    def _apply_snapshot(self, snapshot: SolverSnapshot):
+        """Copia o snapshot publicado pelo solver para os atributos usados no desenho/LLM."""
+        self._snapshot = snapshot
+        self.current_generation = snapshot.generation
+        self.best_route = snapshot.best_route
+        self.best_fitness = snapshot.best_fitness
+        self.fitness_history = snapshot.fitness_history
+        self.mean_fitness_history = snapshot.mean_fitness_history
+        self._rebuild_render_model()
+
+    def _rebuild_render_model(self):
+        """Recalcula o que o frame desenha; só roda quando chega um snapshot novo."""
+        depot = self.depot if self.use_fleet else None
+        generation_best = self._snapshot.generation_best if self._snapshot is not None else None
+        self.render_model = RenderModel.build(
+            self.current_generation, self.best_route, generation_best, depot, self.fleet
+        )
 
-        self.population = new_population[: self.population_size]
-        self.current_generation += 1
+    def _poll_solver(self):
+        """Lê o snapshot mais recente (sem bloquear) e detecta o fim da execução."""
+        if self.solver is None:
+            return
+        if self.running_algorithm:
+            # métodos alterados na interface valem a partir da próxima geração
+            config = self.engine.config
+            config.selection_method = self.selection_method
+            config.crossover_method = self.crossover_method
+            config.mutation_method = self.mutation_method
+            config.elitism = self.elitism
+
+        snapshot = self.solver.latest()
+        if snapshot is not self._snapshot:
+            self._apply_snapshot(snapshot)
+
+        if self.running_algorithm and not snapshot.running:
+            self.running_algorithm = False
+            if snapshot.error:
+                self.logger.error(f"Solver interrompido por erro: {snapshot.error}")
+            else:
+                self.logger.info(f"Algoritmo finalizado após {snapshot.generation} gerações")
+                self.logger.info(f"Melhor fitness final: {snapshot.best_fitness:.4f}")
 
     # -------------------- INPUT CUSTOM (release) --------------------
     def handle_custom_input(self, pos):
@@ -443,36 +347,32 @@ class TSPGeneticAlgorithm:
             ):
                 prod = self._make_random_product(len(self.delivery_points))
                 self.delivery_points.append(DeliveryPoint(pos[0], pos[1], product=prod))
+                self.depot = self._compute_depot()
                 if len(self.delivery_points) > 1:
                     self.calculate_distance_matrix()
-                self.depot = self._compute_depot()
 
     # -------------------- LLM: Snapshot/QA/Relatório (llm-feature, sem botões) --------------------
     def _build_route_snapshot(self) -> dict:
         """
-        Monta um snapshot detalhado da rota para o LLM.
+        Monta um snapshot enxuto da rota para o LLM.
         Regras:
           - Se existir best_route, usa ela.
-          - Senão, usa o melhor indivíduo da população (se houver).
+          - Senão, usa o melhor indivíduo da última geração (se houver).
           - Senão, usa a ordem dos delivery_points (mapa gerado).
-        Sempre devolve 'stops' quando houver pontos disponíveis.
         """
         try:
+            # Escolher sequência de pontos
             points = []
             route_source = "none"
-            if getattr(self, "best_route", None) and getattr(self.best_route, "points", None):
-                points = list(self.best_route.points)
+
+            generation_best = self._snapshot.generation_best if self._snapshot is not None else None
+            if getattr(self, "best_route", None) and self.best_route.delivery_points:
+                points = list(self.best_route.delivery_points)
                 route_source = "best_route"
-            elif getattr(self, "population", None):
-                try:
-                    fitness_scores = [FitnessFunction.calculate_fitness_with_constraints(ch) for ch in self.population]
-                    if fitness_scores:
-                        best_idx = fitness_scores.index(max(fitness_scores))
-                        points = list(self.population[best_idx].points)
-                        route_source = "population_best"
-                except Exception:
-                    route_source = "population_error"
-                    points = []
+            elif generation_best is not None and generation_best.delivery_points:
+                points = list(generation_best.delivery_points)
+                route_source = "population_best"
+
             if not points and self.delivery_points:
                 points = list(self.delivery_points)
                 route_source = "delivery_points"
@@ -492,6 +392,7 @@ class TSPGeneticAlgorithm:
                     "notes": "Sem pontos para gerar snapshot.",
                 }
 
+            # Construir stops enxutos
             stops = []
             for i, p in enumerate(points):
                 prod = getattr(p, "product", None)
@@ -503,15 +404,13 @@ class TSPGeneticAlgorithm:
                         "cold_chain": False,
                     }
 
-                stops.append(
-                    {
-                        "order": i + 1,
-                        "coords": {"x": int(p.x), "y": int(p.y)},
-                        "priority": "Media",  # sem acento e termos que acionem filtros
-                        "time_window": "08:00-18:00",
-                        "items": [prod_dict] if prod_dict else [],
-                    }
-                )
+                stops.append({
+                    "order": i + 1,
+                    "coords": {"x": int(p.x), "y": int(p.y)},
+                    "priority": "Media",
+                    "time_window": "08:00-18:00",
+                    "items": [prod_dict] if prod_dict else [],
+                })
 
             max_stops = int(os.getenv("LLM_MAX_STOPS", "6"))
             stops = stops[:max_stops]
@@ -749,13 +648,23 @@ class TSPGeneticAlgorithm:
         if self.use_fleet:
             self.logger.info(f"VRP ativado | tipos de veículos: {[ (v.name, v.count, v.autonomy) for v in self.fleet ]}")
 
+        self.calculate_distance_matrix()
+        self._cancel_solver()
+        self.engine = GeneticEngine(
+            self.delivery_points, self.depot, self.fleet, self._engine_config(), provider=self.distance_provider
+        )
+        self.engine.open()
+        self.solver = BackgroundSolver(self.engine, self.max_generations)
+        self.solver.start()
+        self._apply_snapshot(self.solver.latest())
         self.running_algorithm = True
-        self.current_generation = 0
-        self.best_fitness = 0.0
-        self.best_route = None
-        self.fitness_history = []
-        self.mean_fitness_history = []
-        self.initialize_population()
+
+    def _cancel_solver(self, wait: float | None = None):
+        """Pede o cancelamento cooperativo do solver; ``wait`` segundos para aguardar o término."""
+        if self.solver is not None:
+            self.solver.cancel()
+            if wait is not None:
+                self.solver.join(wait)
 
     def stop_algorithm(self):
         """Para o algoritmo genético"""
@@ -763,119 +672,26 @@ class TSPGeneticAlgorithm:
         if self.best_fitness > 0:
             self.logger.info(f"Melhor fitness alcançado: {self.best_fitness:.4f}")
         self.running_algorithm = False
+        self._cancel_solver()
 
     def reset_algorithm(self):
         """Reseta o algoritmo e limpa os dados."""
         self.logger.info("Resetando algoritmo e limpando dados")
         self.running_algorithm = False
+        self._cancel_solver()
         self.delivery_points = []
-        self.population = []
+        self.distance_provider = None
+        self.distance_matrix = None
+        self.engine = None
+        self.solver = None
+        self._snapshot = None
+        self.render_model = RenderModel()
         self.current_generation = 0
         self.best_fitness = 0.0
         self.best_route = None
         self.fitness_history = []
         self.mean_fitness_history = []
 
-    def _build_route_snapshot(self) -> dict:
-        """
-        Monta um snapshot enxuto da rota para o LLM.
-        Regras:
-          - Se existir best_route, usa ela.
-          - Senão, usa o melhor indivíduo da população (se houver).
-          - Senão, usa a ordem dos delivery_points (mapa gerado).
-        """
-        try:
-            # Escolher sequência de pontos
-            points = []
-            route_source = "none"
-
-            if getattr(self, "best_route", None) and getattr(self.best_route, "points", None):
-                points = list(self.best_route.points)
-                route_source = "best_route"
-            elif getattr(self, "population", None):
-                try:
-                    fitness_scores = [FitnessFunction.calculate_fitness_with_constraints(ch) for ch in self.population]
-                    if fitness_scores:
-                        best_idx = fitness_scores.index(max(fitness_scores))
-                        points = list(self.population[best_idx].points)
-                        route_source = "population_best"
-                except Exception:
-                    route_source = "population_error"
-                    points = []
-
-            if not points and self.delivery_points:
-                points = list(self.delivery_points)
-                route_source = "delivery_points"
-
-            if not points:
-                return {
-                    "date": datetime.now().strftime("%Y-%m-%d"),
-                    "map_type": getattr(self, "map_type", "unknown"),
-                    "num_cities": 0,
-                    "best_fitness": 0.0,
-                    "stops": [],
-                    "constraints": {
-                        "vehicle_capacity_kg": 100,
-                        "vehicle_range_km": 200,
-                        "priority_policy": "Critica > Alta > Media > Baixa",
-                    },
-                    "notes": "Sem pontos para gerar snapshot.",
-                }
-
-            # Construir stops enxutos
-            stops = []
-            for i, p in enumerate(points):
-                prod = getattr(p, "product", None)
-                prod_dict = {}
-                if prod:
-                    prod_dict = {
-                        "name": getattr(prod, "name", f"Item-{i+1}"),
-                        "weight_g": int(getattr(prod, "weight", 0) or 0),
-                        "cold_chain": False,
-                    }
-
-                stops.append({
-                    "order": i + 1,
-                    "coords": {"x": int(p.x), "y": int(p.y)},
-                    "priority": "Media",
-                    "time_window": "08:00-18:00",
-                    "items": [prod_dict] if prod_dict else [],
-                })
-
-            max_stops = int(os.getenv("LLM_MAX_STOPS", "6"))
-            stops = stops[:max_stops]
-
-            snapshot = {
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "map_type": getattr(self, "map_type", "unknown"),
-                "num_cities": len(self.delivery_points),
-                "best_fitness": float(getattr(self, "best_fitness", 0.0) or 0.0),
-                "stops": stops,
-                "constraints": {
-                    "vehicle_capacity_kg": 100,
-                    "vehicle_range_km": 200,
-                    "priority_policy": "Critica > Alta > Media > Baixa",
-                },
-                "notes": f"Snapshot gerado automaticamente (fonte da rota: {route_source}).",
-            }
-            return snapshot
-
-        except Exception as e:
-            self.logger.error(f"Erro ao montar snapshot de rota: {e}")
-            return {
-                "date": datetime.now().strftime("%Y-%m-%d"),
-                "map_type": getattr(self, "map_type", "unknown"),
-                "num_cities": len(self.delivery_points),
-                "best_fitness": float(getattr(self, "best_fitness", 0.0) or 0.0),
-                "stops": [],
-                "constraints": {
-                    "vehicle_capacity_kg": 100,
-                    "vehicle_range_km": 200,
-                    "priority_policy": "Critica > Alta > Media > Baixa",
-                },
-                "notes": "Falha ao montar snapshot.",
-            }
-
     def _draw_ask_button(self):
         """Desenha o botão 'Perguntar à IA'."""
         pygame.draw.rect(self.screen, LIGHT_GRAY, self.ask_btn_rect, border_radius=8)
@@ -891,12 +707,8 @@ class TSPGeneticAlgorithm:
         while running:
             running = self.handle_events()
 
-            if self.running_algorithm and self.current_generation < self.max_generations:
-                self.run_generation()
-                if self.current_generation >= self.max_generations:
-                    self.logger.info(f"Algoritmo finalizado após {self.max_generations} gerações")
-                    self.logger.info(f"Melhor fitness final: {self.best_fitness:.4f}")
-                    self.running_algorithm = False
+            # o AG roda na thread do solver; aqui só se lê o snapshot mais recente
+            self._poll_solver()
 
             self.screen.fill(WHITE)
 
@@ -911,44 +723,10 @@ class TSPGeneticAlgorithm:
             # Botão "Perguntar à IA"
             self._draw_ask_button()
 
-            # Desenho das rotas/cidades
+            # Desenho das rotas/cidades (a partir do modelo em cache)
             if self.delivery_points:
-                # if self.best_route:
-                #     DrawFunctions.draw_route(self, self.best_route, RED, 3)
-
-                if self.population and self.running_algorithm:
-                    fitness_scores = [
-                        FitnessFunction.calculate_fitness_with_constraints(chrom) for chrom in self.population
-                    ]
-                    if fitness_scores:
-                        best_idx = fitness_scores.index(max(fitness_scores))
-                        current_best = self.population[best_idx]
-                        DrawFunctions.draw_route(self, current_best, BLUE, 2)
-
-                if self.use_fleet and self.depot is not None:
-                    DrawFunctions.draw_cities(self)
-                    DrawFunctions.draw_depot(self, self.depot)
-
-                    if self.best_route and hasattr(self.best_route, "routes") and self.best_route.routes:
-                        DrawFunctions.draw_vrp_solution(self, self.best_route.routes, self.depot)
-
-                    if self.population and self.running_algorithm and hasattr(self.population[0], 'fitness'):
-                        current_best = max(self.population, key=lambda ind: getattr(ind, 'fitness', 0))
-                        if hasattr(current_best, "routes") and current_best.routes:
-                            DrawFunctions.draw_vrp_solution(self, current_best.routes, self.depot, show_legend=False)
-
-                else:
-                    # if self.best_route:
-                    #     DrawFunctions.draw_route(self, self.best_route, RED, 3)
-
-                    if self.population and self.running_algorithm:
-                        fitness_scores = [FitnessFunction.calculate_fitness_with_constraints(chrom) for chrom in self.population]
-                        if fitness_scores:
-                            best_idx = fitness_scores.index(max(fitness_scores))
-                            current_best = self.population[best_idx]
-                            DrawFunctions.draw_route(self, current_best, BLUE, 2)
-
-                    DrawFunctions.draw_cities(self)
+                depot = self.depot if self.use_fleet else None
+                DrawFunctions.draw_render_model(self, self.render_model, depot)
 
             if self.map_type == "custom" and not self.delivery_points and hasattr(UILayout, "SpecialElements"):
 
@@ -965,6 +743,7 @@ class TSPGeneticAlgorithm:
             self.clock.tick(60)
 
         self.logger.info("Encerrando aplicação")
+        self._cancel_solver(wait=5.0)
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,123 @@
+"""
+Execução do :class:`GeneticEngine` em uma thread de fundo.
+
+A thread do solver roda as gerações e, ao fim de cada uma, publica um
+:class:`SolverSnapshot` imutável. A thread de interface só lê o snapshot mais
+recente (:meth:`BackgroundSolver.latest`), sem bloquear durante uma geração.
+O cancelamento é cooperativo: :meth:`BackgroundSolver.cancel` sinaliza um
+``threading.Event`` consultado entre gerações, e a própria thread libera os
+recursos do motor ao terminar.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from main.solver_engine import GeneticEngine
+from route import Route
+from app_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SolverSnapshot:
+    """Estado publicado pelo solver ao fim de uma geração.
+
+    ``best_route`` e ``generation_best`` são referências, não cópias: o motor
+    cria novas ``Route`` a cada melhoria/geração e não altera as já
+    publicadas. Quem lê não deve modificá-las.
+    """
+    generation: int
+    best_fitness: float
+    best_route: Optional[Route]
+    generation_best: Optional[Route]
+    fitness_history: Tuple[float, ...]
+    mean_fitness_history: Tuple[float, ...]
+    running: bool
+    error: Optional[str] = None
+
+    @classmethod
+    def capture(cls, engine: GeneticEngine, running: bool, error: Optional[str] = None) -> "SolverSnapshot":
+        return cls(
+            generation=engine.current_generation,
+            best_fitness=engine.best_fitness,
+            best_route=engine.best_route,
+            generation_best=engine.generation_best,
+            fitness_history=tuple(engine.fitness_history),
+            mean_fitness_history=tuple(engine.mean_fitness_history),
+            running=running,
+            error=error,
+        )
+
+
+class BackgroundSolver:
+    """Roda ``engine.run`` em uma thread daemon, publicando snapshots.
+
+    Args:
+        engine: motor já configurado (com ``open()`` feito, se necessário);
+            a thread chama ``engine.close()`` ao terminar.
+        max_generations: limite de gerações (padrão: ``engine.config``).
+    """
+
+    def __init__(self, engine: GeneticEngine, max_generations: Optional[int] = None):
+        self.engine = engine
+        self.max_generations = max_generations
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._snapshot = SolverSnapshot.capture(engine, running=False)
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------------------------
+    # Controle
+    # ---------------------------
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("BackgroundSolver já iniciado")
+        self._publish(SolverSnapshot.capture(self.engine, running=True))
+        self._thread = threading.Thread(target=self._run, name="ga-solver", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Pede a interrupção após a geração em andamento (não bloqueia)."""
+        self._cancel.set()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Espera a thread terminar; retorna ``True`` se ela terminou."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ---------------------------
+    # Snapshots
+    # ---------------------------
+
+    def latest(self) -> SolverSnapshot:
+        """Snapshot mais recente (seguro para chamar de qualquer thread)."""
+        with self._lock:
+            return self._snapshot
+
+    def _publish(self, snapshot: SolverSnapshot) -> None:
+        with self._lock:
+            self._snapshot = snapshot
+
+    def _run(self) -> None:
+        error = None
+        try:
+            self.engine.run(
+                self.max_generations,
+                on_generation=lambda eng: self._publish(SolverSnapshot.capture(eng, running=True)),
+                should_stop=self._cancel.is_set,
+            )
+        except Exception as e:
+            logger.error(f"Erro na thread do solver: {e}", exc_info=True)
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            self.engine.close()
+            self._publish(SolverSnapshot.capture(self.engine, running=False, error=error))
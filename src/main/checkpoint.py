@@ -0,0 +1,262 @@
+"""
+Checkpoint e retomada de execuções do :class:`GeneticEngine`.
+
+O estado do AG cabe em um único ``.npz``: matriz de genes ``int32``, fitness e
+custo, melhor cromossomo, contadores (geração, reinícios, estagnação),
+históricos, estados dos geradores do motor (``rng`` e ``py_rng``) e uma
+impressão digital da instância. A gravação é atômica (arquivo temporário +
+``os.replace``), então um processo morto no meio da escrita deixa o
+checkpoint anterior intacto.
+
+:class:`CheckpointWriter` é usado como ``on_generation`` de
+``GeneticEngine.run`` (chamado após os critérios de parada da geração, então
+o estado copiado já inclui um eventual reinício): a cada N gerações ou T
+segundos copia o estado na thread do AG (cópia de arrays, barata) e entrega a
+gravação a uma thread de escrita, sem parar o laço. Se a escrita atrasar, só
+o estado mais recente é gravado; uma falha de escrita é levantada em
+:meth:`CheckpointWriter.close`. :meth:`Checkpoint.restore` recusa checkpoints
+de outra instância.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from main.solver_engine import GeneticEngine
+from route import Route
+from app_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CheckpointMismatchError(ValueError):
+    """Checkpoint de outra instância (ou de outro tamanho de população)."""
+
+
+class CheckpointWriteError(OSError):
+    """Falha da thread de escrita ao gravar um checkpoint."""
+
+
+@dataclass
+class CheckpointConfig:
+    """Onde e com que frequência gravar; ``resume`` retoma de ``path`` se existir."""
+    path: str
+    every_generations: int = 10
+    every_seconds: Optional[float] = None
+    resume: bool = False
+
+
+class Checkpoint:
+
+    VERSION = 1
+
+    # ---------------------------
+    # Estado
+    # ---------------------------
+
+    @staticmethod
+    def fingerprint(engine: GeneticEngine) -> str:
+        """SHA-256 dos dados que definem a instância: coordenadas, produtos,
+        depósito, frota e modo (TSP/VRP)."""
+        h = hashlib.sha256()
+        xy = np.array([(p.x, p.y) for p in engine.points], dtype=np.float64)
+        h.update(xy.tobytes())
+        for arr in engine.product_data:
+            h.update(arr.tobytes())
+        depot = engine.depot
+        h.update(repr((depot.x, depot.y) if depot is not None else None).encode("utf-8"))
+        fleet = [(vt.name, int(vt.count), float(vt.autonomy), float(vt.cost_per_km)) for vt in engine.fleet]
+        h.update(repr((fleet, engine.fleet_mode)).encode("utf-8"))
+        return h.hexdigest()
+
+    @staticmethod
+    def capture(engine: GeneticEngine) -> Dict[str, np.ndarray]:
+        """Cópia do estado do motor como arrays (segura para gravar em outra thread)."""
+        pop = engine.population
+        best = engine.best_route
+        best_genes = pop.encode(best) if best is not None else np.empty(0, dtype=np.int32)
+        return {
+            "version": np.array(Checkpoint.VERSION),
+            "fingerprint": np.array(Checkpoint.fingerprint(engine)),
+            "genes": pop.genes.copy(),
+            "fitness": pop.fitness.copy(),
+            "cost": pop.cost.copy(),
+            "best_genes": best_genes,
+            "best_fitness": np.array(engine.best_fitness),
+            "best_cost": np.array(engine.best_cost),
+            "generation": np.array(engine.current_generation),
+            "restarts": np.array(engine.restarts),
+            "elapsed_seconds": np.array(engine.elapsed_seconds),
+            "reference_cost": np.array(engine._reference_cost),
+            "last_improvement": np.array(engine._last_improvement),
+            "fitness_history": np.array(engine.fitness_history, dtype=np.float64),
+            "mean_fitness_history": np.array(engine.mean_fitness_history, dtype=np.float64),
+            "rng_state": np.array(json.dumps(engine.rng.bit_generator.state)),
+            "random_state": np.array(json.dumps(engine.py_rng.getstate())),
+        }
+
+    # ---------------------------
+    # Arquivo
+    # ---------------------------
+
+    @staticmethod
+    def save(path: str, state: Dict[str, np.ndarray]) -> None:
+        """Grava ``state`` em ``path`` atomicamente (temporário no mesmo diretório)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **state)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @staticmethod
+    def load(path: str) -> Dict[str, np.ndarray]:
+        with np.load(path, allow_pickle=False) as data:
+            state = {key: data[key] for key in data.files}
+        if int(state.get("version", -1)) != Checkpoint.VERSION:
+            raise CheckpointMismatchError(f"versão de checkpoint não suportada em {path}")
+        return state
+
+    @staticmethod
+    def restore(engine: GeneticEngine, path: str) -> None:
+        """Carrega ``path`` no motor (população, melhor, históricos, RNGs e contadores).
+
+        Raises:
+            CheckpointMismatchError: se a instância ou o tamanho da população
+                não corresponderem ao motor.
+        """
+        state = Checkpoint.load(path)
+        if str(state["fingerprint"]) != Checkpoint.fingerprint(engine):
+            raise CheckpointMismatchError(f"checkpoint {path} pertence a outra instância")
+        genes = state["genes"]
+        if genes.shape != (engine.config.population_size, len(engine.points)):
+            raise CheckpointMismatchError(
+                f"população do checkpoint {genes.shape} difere de "
+                f"({engine.config.population_size}, {len(engine.points)})"
+            )
+
+        pop = engine.population
+        pop.genes[:] = genes
+        pop.fitness[:] = state["fitness"]
+        pop.cost[:] = state["cost"]
+        engine.invalidate()
+
+        engine.current_generation = int(state["generation"])
+        engine.restarts = int(state["restarts"])
+        engine.elapsed_seconds = float(state["elapsed_seconds"])
+        engine._reference_cost = float(state["reference_cost"])
+        engine._last_improvement = int(state["last_improvement"])
+        engine.fitness_history = state["fitness_history"].tolist()
+        engine.mean_fitness_history = state["mean_fitness_history"].tolist()
+        engine.best_fitness = float(state["best_fitness"])
+        engine.best_cost = float(state["best_cost"])
+        best_genes = state["best_genes"]
+        if len(best_genes):
+            engine.best_route = Route([engine.points[i] for i in best_genes.tolist()])
+            if engine.fleet_mode:
+                engine.best_route.routes, engine.best_route.vehicle_usage = engine.solution_routes(best_genes)
+            engine.generation_best = engine.best_route
+            engine.generation_best_fitness = engine.best_fitness
+
+        engine.rng.bit_generator.state = json.loads(str(state["rng_state"]))
+        version, internal, gauss = json.loads(str(state["random_state"]))
+        engine.py_rng.setstate((version, tuple(internal), gauss))
+        logger.info(f"Execução retomada de {path} na geração {engine.current_generation}")
+
+
+class CheckpointWriter:
+    """Grava checkpoints periódicos em uma thread de escrita (write-behind).
+
+    Chamável como ``on_generation`` de ``GeneticEngine.run``. Grava quando
+    passaram ``every_generations`` gerações ou ``every_seconds`` segundos
+    desde a última gravação; :meth:`submit` força uma gravação. :meth:`close`
+    espera a escrita pendente terminar e levanta :class:`CheckpointWriteError`
+    se alguma gravação falhou.
+    """
+
+    def __init__(self, path: str, every_generations: int = 10, every_seconds: Optional[float] = None):
+        self.path = path
+        self.every_generations = every_generations
+        self.every_seconds = every_seconds
+        self.saved = 0
+        self.error: Optional[BaseException] = None
+        self._last_generation: Optional[int] = None
+        self._last_time = time.monotonic()
+        self._pending: Optional[Dict[str, np.ndarray]] = None
+        self._closing = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._write_loop, name="ga-checkpoint", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, config: CheckpointConfig) -> "CheckpointWriter":
+        return cls(config.path, config.every_generations, config.every_seconds)
+
+    def __call__(self, engine: GeneticEngine) -> None:
+        if self._last_generation is None:
+            self._last_generation = engine.current_generation - 1
+        due = (self.every_generations > 0
+               and engine.current_generation - self._last_generation >= self.every_generations)
+        if self.every_seconds is not None and time.monotonic() - self._last_time >= self.every_seconds:
+            due = True
+        if due:
+            self.submit(engine)
+
+    def submit(self, engine: GeneticEngine) -> None:
+        """Copia o estado agora e agenda a gravação (substitui uma pendente)."""
+        state = Checkpoint.capture(engine)
+        self._last_generation = engine.current_generation
+        self._last_time = time.monotonic()
+        with self._cond:
+            self._pending = state
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Grava o que estiver pendente e encerra a thread de escrita.
+
+        Raises:
+            CheckpointWriteError: se alguma gravação falhou.
+        """
+        self._stop()
+        if self.error is not None:
+            raise CheckpointWriteError(f"falha ao gravar checkpoint em {self.path}: {self.error}") from self.error
+
+    def _stop(self) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join()
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        # com uma exceção em curso, não a substitui pela falha de escrita
+        if exc_type is not None:
+            self._stop()
+        else:
+            self.close()
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closing:
+                    self._cond.wait()
+                state, self._pending = self._pending, None
+                if state is None:
+                    return
+            try:
+                Checkpoint.save(self.path, state)
+                self.saved += 1
+                logger.debug(f"Checkpoint da geração {int(state['generation'])} gravado em {self.path}")
+            except Exception as e:
+                self.error = e
+                logger.error(f"Falha ao gravar checkpoint em {self.path}: {e}")
@@ -0,0 +1,365 @@
+"""
+Modelo de ilhas: várias populações do AG em processos separados.
+
+Cada ilha é um :class:`GeneticEngine` com seus próprios operadores de
+seleção, crossover e mutação, rodando em um processo dedicado (a população
+fica no processo entre as épocas). A cada ``migration_interval`` gerações o
+coordenador recolhe de cada ilha seus melhores cromossomos como permutações
+``int32`` e os entrega à ilha vizinha (anel) ou a uma ilha sorteada
+(aleatória), onde substituem os piores indivíduos. O melhor global é
+agregado pelo coordenador.
+
+Uso típico::
+
+    model = IslandModel(points, depot, fleet, IslandModel.diverse_configs(GAConfig(), 4))
+    result = model.run(max_generations=500, time_limit=30)
+"""
+
+import multiprocessing
+import time
+import traceback
+from dataclasses import dataclass, field, replace
+from typing import Callable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from main.solver_engine import GAConfig, GeneticEngine, SolverResult
+from delivery_point import DeliveryPoint
+from distance_provider import DistanceProvider
+from fitness_function import FitnessFunction
+from route import Route
+from vehicle import VehicleType, default_fleet
+from app_logging import get_logger
+
+logger = get_logger(__name__)
+
+SELECTION_METHODS = ("roulette", "tournament", "rank", "sus")
+CROSSOVER_METHODS = ("pmx", "ox1", "cx", "kpoint", "erx")
+MUTATION_METHODS = ("swap", "inverse", "shuffle")
+
+
+@dataclass
+class IslandConfig:
+    """Parâmetros do modelo de ilhas."""
+    islands: int = 4
+    migration_interval: int = 10         # gerações entre migrações
+    migrants: int = 2                    # cromossomos enviados por ilha a cada migração
+    topology: str = "ring"               # ring | random
+    vary_operators: bool = True          # operadores diferentes por ilha
+    parallel: bool = True                # False roda as ilhas em série no processo atual
+
+
+@dataclass
+class IslandReport:
+    """Estado de uma ilha ao fim de uma época."""
+    index: int
+    generation: int
+    best_genes: Optional[np.ndarray]
+    best_fitness: float
+    best_cost: float
+    emigrants: np.ndarray
+    fitness_history: List[float] = field(default_factory=list)
+    mean_fitness_history: List[float] = field(default_factory=list)
+    stop_reason: str = ""
+
+
+class Island:
+    """Uma população e a lógica de migração dela (usada dentro do processo da ilha)."""
+
+    def __init__(self, index: int, points: List[DeliveryPoint], depot: Optional[DeliveryPoint],
+                 fleet: List[VehicleType], config: GAConfig,
+                 seed: Union[int, np.random.SeedSequence, None] = None,
+                 provider: Optional[DistanceProvider] = None):
+        self.index = index
+        self.engine = GeneticEngine(points, depot, fleet, config, provider=provider, seed=seed)
+
+    def immigrate(self, migrants: np.ndarray) -> None:
+        """Substitui os piores indivíduos (pela última avaliação) pelos imigrantes."""
+        if migrants is None or len(migrants) == 0:
+            return
+        pop = self.engine.population
+        count = min(len(migrants), len(pop))
+        worst = np.argsort(pop.fitness, kind="stable")[:count]
+        pop.genes[worst] = migrants[:count]
+        self.engine.invalidate()
+
+    def epoch(self, generations: int, immigrants: Optional[np.ndarray], migrants: int,
+              time_limit: Optional[float] = None) -> IslandReport:
+        """Recebe imigrantes, roda ``generations`` gerações e escolhe os emigrantes."""
+        engine = self.engine
+        self.immigrate(immigrants)
+        start = len(engine.fitness_history)
+        engine.run(max_generations=engine.current_generation + generations, time_limit=time_limit)
+
+        engine.evaluate(engine.population)
+        pop = engine.population
+        best_genes = pop.encode(engine.best_route) if engine.best_route is not None else None
+        order = np.argsort(-pop.fitness, kind="stable")[:migrants]
+        emigrants = pop.genes[order].copy()
+        if best_genes is not None and len(emigrants):
+            emigrants[0] = best_genes
+        return IslandReport(
+            index=self.index,
+            generation=engine.current_generation,
+            best_genes=best_genes,
+            best_fitness=engine.best_fitness,
+            best_cost=engine.best_cost,
+            emigrants=emigrants.astype(np.int32),
+            fitness_history=engine.fitness_history[start:],
+            mean_fitness_history=engine.mean_fitness_history[start:],
+            stop_reason=engine.stop_reason,
+        )
+
+
+def _island_process(conn, index: int, points, depot, fleet, config: GAConfig,
+                    seed: np.random.SeedSequence) -> None:
+    """Laço do processo de uma ilha: executa épocas até receber ``None``."""
+    try:
+        island = Island(index, points, depot, fleet, config, seed)
+        with island.engine:
+            while True:
+                msg = conn.recv()
+                if msg is None:
+                    break
+                conn.send(("ok", island.epoch(*msg)))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}\n{traceback.format_exc()}"))
+    finally:
+        conn.close()
+
+
+class IslandModel:
+    """Coordena K ilhas e as migrações entre elas.
+
+    Args:
+        points, depot, fleet: instância (como em :class:`GeneticEngine`).
+        configs: um :class:`GAConfig` por ilha (ver :meth:`diverse_configs`).
+        island_config: intervalo de migração, migrantes, topologia e execução.
+        seed: semente mestre; cada ilha recebe um fluxo independente
+            (``SeedSequence.spawn``) e o coordenador sorteia a topologia
+            aleatória com outro. ``None`` usa ``configs[0].seed``; com a mesma
+            semente, as execuções em série e em paralelo são idênticas.
+    """
+
+    def __init__(self, points: List[DeliveryPoint], depot: Optional[DeliveryPoint] = None,
+                 fleet: Optional[List[VehicleType]] = None, configs: Sequence[GAConfig] = (),
+                 island_config: Optional[IslandConfig] = None, seed: Optional[int] = None):
+        self.points = list(points)
+        self.depot = depot
+        self.fleet = list(fleet) if fleet is not None else default_fleet()
+        self.island_config = island_config or IslandConfig()
+        self.configs = list(configs) or self.diverse_configs(GAConfig(), self.island_config.islands,
+                                                              self.island_config.vary_operators)
+        if self.island_config.topology not in ("ring", "random"):
+            raise ValueError(f"topologia desconhecida: {self.island_config.topology}")
+        self.seed_sequence = GeneticEngine.seed_sequence_from(seed if seed is not None else self.configs[0].seed)
+        self.seeds = self.seed_sequence.spawn(len(self.configs))
+        self.rng = np.random.default_rng(self.seed_sequence)
+
+        self.provider = DistanceProvider(self.points, depot)
+        self.best_genes: Optional[np.ndarray] = None
+        self.best_fitness = 0.0
+        self.best_cost = float("inf")
+        self.fitness_history: List[float] = []
+        self.mean_fitness_history: List[float] = []
+        self.generation = 0
+        self.reports: List[IslandReport] = []
+        # último melhor/média de cada ilha, repetidos enquanto ela não avançar
+        self._island_best = [0.0] * len(self.configs)
+        self._island_mean = [0.0] * len(self.configs)
+
+    @property
+    def fleet_mode(self) -> bool:
+        return self.configs[0].use_fleet and self.depot is not None
+
+    @staticmethod
+    def diverse_configs(base: GAConfig, islands: int, vary_operators: bool = True) -> List[GAConfig]:
+        """``islands`` cópias de ``base``; com ``vary_operators`` cada ilha percorre
+        os menus de seleção, crossover e mutação em fases diferentes."""
+        if not vary_operators:
+            return [replace(base) for _ in range(islands)]
+        return [
+            replace(base,
+                    selection_method=SELECTION_METHODS[i % len(SELECTION_METHODS)],
+                    crossover_method=CROSSOVER_METHODS[i % len(CROSSOVER_METHODS)],
+                    mutation_method=MUTATION_METHODS[i % len(MUTATION_METHODS)])
+            for i in range(islands)
+        ]
+
+    # ---------------------------
+    # Migração
+    # ---------------------------
+
+    def route_migrants(self, reports: Sequence[IslandReport]) -> List[Optional[np.ndarray]]:
+        """Destino dos emigrantes de cada ilha: a próxima no anel ou uma sorteada."""
+        k = len(self.configs)
+        inbox: List[List[np.ndarray]] = [[] for _ in range(k)]
+        for r in reports:
+            if k < 2 or not len(r.emigrants):
+                continue
+            if self.island_config.topology == "ring":
+                target = (r.index + 1) % k
+            else:
+                target = int(self.rng.integers(k - 1))
+                target += target >= r.index
+            inbox[target].append(r.emigrants)
+        return [np.concatenate(m) if m else None for m in inbox]
+
+    def _aggregate(self, reports: Sequence[IslandReport]) -> None:
+        for r in reports:
+            if r.best_genes is not None and r.best_fitness > self.best_fitness:
+                self.best_fitness = r.best_fitness
+                self.best_cost = r.best_cost
+                self.best_genes = r.best_genes.copy()
+        # histórico global: melhor e média entre as ilhas, geração a geração; uma
+        # ilha que parou antes (estagnação, tempo) repete seu último valor
+        span = max(len(r.fitness_history) for r in reports)
+        for g in range(span):
+            for r in reports:
+                if g < len(r.fitness_history):
+                    self._island_best[r.index] = r.fitness_history[g]
+                    self._island_mean[r.index] = r.mean_fitness_history[g]
+            best_here = max(self._island_best)
+            self.fitness_history.append(max(best_here, self.fitness_history[-1] if self.fitness_history else 0.0))
+            self.mean_fitness_history.append(float(np.mean(self._island_mean)))
+        self.generation += span
+        latest = {r.index: r for r in self.reports}
+        latest.update((r.index, r) for r in reports)
+        self.reports = [latest[i] for i in sorted(latest)]
+
+    # ---------------------------
+    # Execução
+    # ---------------------------
+
+    def run(self, max_generations: Optional[int] = None, time_limit: Optional[float] = None,
+            on_epoch: Optional[Callable[["IslandModel"], None]] = None) -> SolverResult:
+        """Executa épocas de ``migration_interval`` gerações em todas as ilhas.
+
+        Para ao atingir ``max_generations`` (padrão: o da primeira ilha), o
+        orçamento de tempo, quando o melhor global atingir ``target_cost`` ou
+        quando todas as ilhas pararem por estagnação.
+        """
+        cfg = self.island_config
+        limit = max_generations if max_generations is not None else self.configs[0].max_generations
+        start = time.perf_counter()
+        deadline = start + time_limit if time_limit is not None else None
+        runner = self._parallel_epochs if cfg.parallel and len(self.configs) > 1 else self._serial_epochs
+        stop_reason = runner(limit, deadline, on_epoch)
+        elapsed = time.perf_counter() - start
+        logger.info(f"Ilhas finalizadas após {self.generation} gerações ({stop_reason}) | "
+                    f"melhor fitness: {self.best_fitness:.6f}")
+        return self.result(stop_reason, elapsed)
+
+    def _epochs(self, limit: int, deadline: Optional[float], on_epoch, step) -> str:
+        """Laço de épocas comum; ``step(generations, inbox, deadline)`` devolve os relatórios."""
+        inbox: List[Optional[np.ndarray]] = [None] * len(self.configs)
+        target = self.configs[0].target_cost
+        while self.generation < limit:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return "time_limit"
+            generations = min(self.island_config.migration_interval, limit - self.generation)
+            reports = step(generations, inbox, deadline)
+            self._aggregate(reports)
+            inbox = self.route_migrants(reports)
+            if on_epoch is not None:
+                on_epoch(self)
+            if target is not None and self.best_cost <= target:
+                return "target_cost"
+            reasons = {r.stop_reason for r in reports}
+            if reasons <= {"stagnation", "target_cost"}:
+                return reasons.pop() if len(reasons) == 1 else "stagnation"
+        if deadline is not None and time.perf_counter() >= deadline:
+            return "time_limit"
+        return "max_generations"
+
+    def _serial_epochs(self, limit: int, deadline: Optional[float], on_epoch) -> str:
+        # em série, todas as ilhas compartilham a matriz do modelo
+        islands = [Island(i, self.points, self.depot, self.fleet, c, s, self.provider)
+                   for i, (c, s) in enumerate(zip(self.configs, self.seeds))]
+        migrants = self.island_config.migrants
+
+        def step(generations, inbox, deadline):
+            # o orçamento é compartilhado: cada ilha usa o que sobrou das anteriores
+            reports = []
+            for isl in islands:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                reports.append(isl.epoch(generations, inbox[isl.index], migrants, remaining))
+            return reports
+
+        try:
+            return self._epochs(limit, deadline, on_epoch, step)
+        finally:
+            for isl in islands:
+                isl.engine.close()
+
+    def _parallel_epochs(self, limit: int, deadline: Optional[float], on_epoch) -> str:
+        ctx = multiprocessing.get_context()
+        pipes, procs = [], []
+        for i, (config, seed) in enumerate(zip(self.configs, self.seeds)):
+            parent, child = ctx.Pipe()
+            # não-daemon: a ilha pode abrir o pool da avaliação paralela (fitness_workers)
+            proc = ctx.Process(target=_island_process, name=f"ga-island-{i}",
+                               args=(child, i, self.points, self.depot, self.fleet, config, seed))
+            proc.start()
+            child.close()
+            pipes.append(parent)
+            procs.append(proc)
+        logger.info(f"Modelo de ilhas: {len(procs)} processos, migração a cada "
+                    f"{self.island_config.migration_interval} gerações ({self.island_config.topology})")
+        migrants = self.island_config.migrants
+
+        def step(generations, inbox, deadline):
+            remaining = deadline - time.perf_counter() if deadline is not None else None
+            for i, conn in enumerate(pipes):
+                conn.send((generations, inbox[i], migrants, remaining))
+            reports = []
+            for i, conn in enumerate(pipes):
+                status, payload = conn.recv()
+                if status != "ok":
+                    raise RuntimeError(f"ilha {i} falhou: {payload}")
+                reports.append(payload)
+            return reports
+
+        try:
+            return self._epochs(limit, deadline, on_epoch, step)
+        finally:
+            for conn in pipes:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+            for proc in procs:
+                proc.join(timeout=5.0)
+                if proc.is_alive():
+                    proc.terminate()
+            for conn in pipes:
+                conn.close()
+
+    def result(self, stop_reason: str = "", elapsed: float = 0.0) -> SolverResult:
+        """Melhor solução global no formato de :class:`SolverResult`."""
+        best_route = None
+        routes: List[Route] = []
+        usage = {}
+        if self.best_genes is not None:
+            best_route = Route([self.points[i] for i in self.best_genes.tolist()])
+            if self.fleet_mode:
+                _, routes, usage = FitnessFunction.calculate_fitness_with_fleet(best_route, self.depot, self.fleet,
+                                                                             self.provider)
+                best_route.routes, best_route.vehicle_usage = routes, usage
+        return SolverResult(
+            best_route=best_route,
+            best_fitness=self.best_fitness,
+            best_cost=self.best_cost,
+            routes=list(routes),
+            vehicle_usage=dict(usage),
+            fitness_history=list(self.fitness_history),
+            mean_fitness_history=list(self.mean_fitness_history),
+            generations=self.generation,
+            elapsed_seconds=elapsed,
+            stop_reason=stop_reason,
+            seed=self.seed_sequence.entropy,
+        )
@@ -0,0 +1,746 @@
+"""
+Motor do algoritmo genético independente de interface (sem pygame).
+
+:class:`GeneticEngine` recebe pontos de entrega (com seus produtos), depósito,
+frota e parâmetros do AG (:class:`GAConfig`) e devolve a melhor solução e o
+histórico de fitness (:class:`SolverResult`). Reutiliza ``Crossover``,
+``Mutation``, ``Selection`` e ``FitnessFunction``; a aplicação pygame é apenas
+um cliente deste motor e servidores sem display podem usá-lo diretamente.
+"""
+
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# adiciona 'src' e subpastas para imports relativos (domain/functions)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.dirname(current_dir)
+for _path in (src_dir, os.path.join(src_dir, "domain"), os.path.join(src_dir, "functions")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from delivery_point import DeliveryPoint
+from distance_provider import DistanceProvider
+from population import Population
+from route import Route
+from vehicle import VehicleType, default_fleet
+from crossover_function import Crossover
+from index_crossover import IndexCrossover
+from index_mutation import IndexMutation
+from mutation_function import Mutation
+from selection_functions import Selection
+from fitness_function import FitnessFunction
+from fitness_cache import FitnessCache
+from parallel_fitness import ParallelFitnessEvaluator
+from local_search import TwoOpt
+from vrp_local_search import InterRouteSearch
+from seeding import Seeding
+from app_logging import get_logger, log_performance
+
+
+@dataclass
+class GAConfig:
+    """Parâmetros de uma execução do AG."""
+    population_size: int = 50
+    max_generations: int = 100
+    selection_method: str = "roulette"   # roulette | tournament | rank | sus
+    tournament_size: int = 3             # competidores por torneio (pressão seletiva)
+    crossover_method: str = "pmx"        # pmx | ox1 | cx | kpoint | erx
+    mutation_method: str = "swap"        # swap | inverse | shuffle
+    elitism: bool = True
+    use_fleet: bool = True
+    seed: Optional[int] = None           # semente mestre; None = entropia do sistema
+    fitness_workers: int = 0             # > 1 ativa ParallelFitnessEvaluator
+    fitness_chunk_size: Optional[int] = None
+    cache_size: int = 20_000             # 0 desativa o cache de fitness
+    local_search: str = "none"           # none | elite | offspring (2-opt memético)
+    local_search_time: float = 0.05      # orçamento da busca local por geração (s)
+    local_search_neighbours: int = 8     # candidatos por cidade no 2-opt
+    inter_route_search: str = "none"     # none | elite | offspring (VRP: relocate/swap/2-opt*)
+    seed_fraction: float = 0.0           # fração da população inicial gerada por heurísticas
+    seed_methods: Tuple[str, ...] = ("nn", "savings", "sweep")
+    # substituição
+    replacement: str = "generational"    # generational | steady_state
+    steady_state_offspring: int = 2      # filhos por passo no modo steady_state
+    steady_state_victim: str = "worst"   # worst | tournament (quem dá lugar aos filhos)
+    # critérios de parada (além de max_generations)
+    time_limit: Optional[float] = None   # orçamento de tempo de run() (s)
+    stagnation_generations: int = 0      # K gerações sem melhora > epsilon; 0 desativa
+    stagnation_epsilon: float = 1e-4     # melhora relativa mínima do custo
+    target_cost: Optional[float] = None  # para ao atingir custo <= alvo
+    max_restarts: int = 0                # reinícios na estagnação antes de parar
+    restart_keep: int = 1                # indivíduos de elite mantidos no reinício
+
+
+@dataclass
+class SolverResult:
+    """Melhor solução encontrada e histórico da execução."""
+    best_route: Optional[Route]
+    best_fitness: float
+    best_cost: float
+    routes: List[Route] = field(default_factory=list)
+    vehicle_usage: Dict[str, int] = field(default_factory=dict)
+    fitness_history: List[float] = field(default_factory=list)
+    mean_fitness_history: List[float] = field(default_factory=list)
+    generations: int = 0
+    elapsed_seconds: float = 0.0
+    stop_reason: str = ""                # max_generations | time_limit | stagnation | target_cost | cancelled
+    restarts: int = 0
+    seed: Optional[int] = None           # entropia da semente mestre (reproduz a execução)
+
+
+class GeneticEngine:
+    """Estado e laço do AG para uma instância.
+
+    Args:
+        points: pontos de entrega (cada um com seu produto).
+        depot: depósito; obrigatório para o modo com frota (VRP).
+        fleet: tipos de veículos; ``None`` usa ``default_fleet()``.
+        config: parâmetros do AG.
+        provider: ``DistanceProvider`` já construído para ``points``/``depot``
+            (opcional; se não cobrir a instância, um novo é criado).
+        seed: semente (ou ``SeedSequence`` derivada de uma semente mestre, como
+            nas ilhas); ``None`` usa ``config.seed``.
+    """
+
+    # até este número de pares de pais, o crossover usa os operadores par a par
+    # (medido com 1 par, N = 100..5000: OX1, k-pontos e CX até ~5x mais rápidos)
+    PAIRWISE_MAX_PAIRS = 2
+
+    def __init__(
+        self,
+        points: List[DeliveryPoint],
+        depot: Optional[DeliveryPoint] = None,
+        fleet: Optional[List[VehicleType]] = None,
+        config: Optional[GAConfig] = None,
+        provider: Optional[DistanceProvider] = None,
+        seed: Union[int, np.random.SeedSequence, None] = None,
+    ):
+        self.logger = get_logger(__name__)
+        self.points: List[DeliveryPoint] = list(points)
+        self.depot = depot
+        self.fleet: List[VehicleType] = list(fleet) if fleet is not None else default_fleet()
+        self.config = config or GAConfig()
+
+        if (provider is None or provider.points != self.points
+                or (depot is not None and not provider.covers_depot(depot))):
+            provider = DistanceProvider(self.points, depot)
+        self.provider = provider
+        # pesos, volumes e prioridades: calculados uma vez por instância
+        self.product_data = FitnessFunction.product_arrays(self.points)
+        self.priorities = self.product_data[2]
+        # reordenar por prioridade só muda o cromossomo se houver prioridades distintas
+        self.order_priorities = self.priorities if np.ptp(self.priorities) > 0 else None
+
+        self.seed_sequence = self.seed_sequence_from(seed if seed is not None else self.config.seed)
+        self.rng, self.py_rng = self.generators(self.seed_sequence)
+        self.fitness_cache: Optional[FitnessCache] = (
+            FitnessCache(self.config.cache_size) if self.config.cache_size > 0 else None
+        )
+        if self.fitness_cache is not None and self.fleet_mode:
+            self.fitness_cache.bind(FitnessCache.fingerprint(self.provider, self.priorities, self.fleet))
+        self.fitness_evaluator: Optional[ParallelFitnessEvaluator] = None
+        self._two_opt: Optional[TwoOpt] = None
+        self._inter_route: Optional[InterRouteSearch] = None
+        self._brood: Optional[Population] = None
+        self.reset()
+
+    # ---------------------------
+    # Ciclo de vida
+    # ---------------------------
+
+    @property
+    def fleet_mode(self) -> bool:
+        return self.config.use_fleet and self.depot is not None
+
+    @staticmethod
+    def seed_sequence_from(seed: Union[int, np.random.SeedSequence, None]) -> np.random.SeedSequence:
+        return seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+    @staticmethod
+    def generators(seed_sequence: np.random.SeedSequence) -> Tuple[np.random.Generator, random.Random]:
+        """Geradores de uma execução: ``Generator`` do NumPy (operadores em lote,
+        seleção, população) e ``random.Random`` (operadores sobre Route), em
+        fluxos independentes (filhos 0 e 1 de ``seed_sequence``, como em
+        ``spawn(2)``, mas sem alterar a sequência: a mesma semente sempre gera
+        os mesmos fluxos). Use ``seed_sequence.spawn`` para workers/ilhas."""
+        np_ss, py_ss = (np.random.SeedSequence(seed_sequence.entropy, spawn_key=seed_sequence.spawn_key + (i,),
+                                               pool_size=seed_sequence.pool_size) for i in range(2))
+        py_seed = int.from_bytes(py_ss.generate_state(4).tobytes(), "little")
+        return np.random.default_rng(np_ss), random.Random(py_seed)
+
+    def reset(self) -> None:
+        """Zera o histórico e cria uma nova população aleatória."""
+        self.current_generation = 0
+        self.best_route: Optional[Route] = None
+        self.best_fitness = 0.0
+        self.best_cost = float("inf")
+        # melhor indivíduo da última geração avaliada (para desenho)
+        self.generation_best: Optional[Route] = None
+        self.generation_best_fitness = 0.0
+        self.fitness_history: List[float] = []
+        self.mean_fitness_history: List[float] = []
+        self.elapsed_seconds = 0.0
+        # critérios de parada
+        self.stop_reason = ""
+        self.restarts = 0
+        self._reference_cost = float("inf")   # custo na última melhora significativa
+        self._last_improvement = 0
+        self._deadline: Optional[float] = None
+        self.initialize_population()
+
+    def open(self) -> None:
+        """Inicia recursos opcionais (avaliação multiprocesso)."""
+        self.close()
+        if self.config.fitness_workers > 1 and self.fleet_mode:
+            self.fitness_evaluator = ParallelFitnessEvaluator(
+                self.provider, self.fleet, workers=self.config.fitness_workers,
+                chunk_size=self.config.fitness_chunk_size, priorities=self.priorities,
+            )
+
+    def close(self) -> None:
+        """Libera os workers da avaliação paralela, se houver."""
+        if self.fitness_evaluator is not None:
+            self.fitness_evaluator.close()
+            self.fitness_evaluator = None
+
+    def __enter__(self) -> "GeneticEngine":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------------------------
+    # Operadores
+    # ---------------------------
+
+    @log_performance
+    def initialize_population(self) -> None:
+        """Inicializa a população com cromossomos aleatórios.
+
+        Uma fração ``config.seed_fraction`` é substituída por tours construtivos
+        (vizinho mais próximo, economias, varredura); o resto segue aleatório.
+        """
+        self.logger.info(f"Inicializando população de tamanho {self.config.population_size}")
+        self.population = Population.random(self.points, self.config.population_size, rng=self.rng)
+        self.invalidate()
+        if self.config.seed_fraction > 0:
+            max_length = np.inf
+            if self.fleet_mode and self.fleet:
+                max_length = max(vt.autonomy for vt in self.fleet) / self.provider.scale
+            seeded = Seeding.seed_population(self.population.genes, self.provider, self.config.seed_fraction,
+                                             self.config.seed_methods, max_length, rng=self.rng)
+            self.logger.info(f"{seeded} indivíduos semeados por heurísticas construtivas")
+
+    @log_performance
+    def selection(self, population: Population, fitness_scores: np.ndarray) -> Population:
+        """Seleção usando métodos do selection_functions.py com suporte a diferentes algoritmos e elitismo.
+
+        Os métodos de seleção operam sobre os índices dos indivíduos; a nova
+        população é montada copiando as linhas escolhidas da matriz de genes.
+        """
+        method = self.config.selection_method
+        self.logger.debug(f"Iniciando seleção: método={method}, elitismo={self.config.elitism}")
+        total_fitness = sum(fitness_scores)
+        if total_fitness == 0:
+            self.logger.warning("Total de fitness zero, copiando população.")
+            return population.take(range(len(population)))
+
+        chosen_rows = self.select_rows(fitness_scores, len(population))
+        if self.config.elitism and self.best_route:
+            best_idx = int(np.argmax(fitness_scores))
+            self.logger.debug(
+                f"Elitismo: substituindo último indivíduo pelo melhor da geração (fitness={fitness_scores[best_idx]:.4f})"
+            )
+            chosen_rows[-1] = best_idx
+
+        return population.take(chosen_rows)
+
+    def select_rows(self, fitness_scores: np.ndarray, count: int) -> np.ndarray:
+        """Índices de ``count`` pais escolhidos pelo método configurado."""
+        method = self.config.selection_method
+        if method == "tournament":
+            k = min(self.config.tournament_size, len(fitness_scores))
+            return Selection.tournament_batch(fitness_scores, count, k, rng=self.rng)
+        elif method == "rank":
+            return Selection.rank_batch(fitness_scores, count, rng=self.rng)
+        elif method == "sus":
+            return Selection.sus(fitness_scores, count, rng=self.rng)
+        else:
+            return Selection.roulette_batch(fitness_scores, count, rng=self.rng)
+
+    def crossover(self, parent1: Route, parent2: Route) -> Tuple[Route, Route]:
+        """Wrapper que usa as implementações de Crossover baseado no método selecionado."""
+        method = self.config.crossover_method
+        rng = self.py_rng
+        if method == "pmx":
+            return Crossover.crossover_parcialmente_mapeado_pmx(parent1, parent2, rng)
+        elif method == "ox1":
+            return Crossover.crossover_ordenado_ox1(parent1, parent2, rng)
+        elif method == "cx":
+            return Crossover.crossover_de_ciclo_cx(parent1, parent2)
+        elif method == "kpoint":
+            return Crossover.crossover_multiplos_pontos_kpoint(parent1, parent2, k=2, rng=rng)
+        elif method == "erx":
+            return Crossover.erx_crossover_pair(parent1, parent2, rng)
+        else:
+            return Crossover.crossover_parcialmente_mapeado_pmx(parent1, parent2, rng)
+
+    def crossover_genes(self, a: np.ndarray, b: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Filhos de um par de pais com os operadores escalares sobre índices;
+        ``None`` se o método só existe sobre Route."""
+        method = self.config.crossover_method
+        if method == "ox1":
+            return IndexCrossover.ox1(a, b, rng=self.rng)
+        elif method == "kpoint":
+            return IndexCrossover.kpoint(a, b, k=2, rng=self.rng)
+        elif method == "cx":
+            return IndexCrossover.cycle_crossover(a, b)
+        elif method == "pmx":
+            return IndexCrossover.pmx(a, b, rng=self.rng)
+        elif method == "erx":
+            return IndexCrossover.erx(a, b, rng=self.rng)
+        return None
+
+    def crossover_population(self, parents: Population) -> Optional[np.ndarray]:
+        """Filhos de todos os pares ``(i, i+1)`` em uma chamada, para os métodos com
+        versão em lote sobre índices; ``None`` se o método só existe sobre Route.
+
+        Com até ``PAIRWISE_MAX_PAIRS`` pares (passos do modo steady-state), os
+        operadores escalares par a par são mais rápidos que as versões em lote.
+        """
+        first, second = IndexCrossover.pair_rows(len(parents))
+        A, B = parents.genes[first], parents.genes[second]
+        method = self.config.crossover_method
+        if len(first) <= self.PAIRWISE_MAX_PAIRS:
+            pairs = [self.crossover_genes(a, b) for a, b in zip(A, B)]
+            if pairs[0] is None:
+                return None
+            C1, C2 = np.array([c1 for c1, _ in pairs]), np.array([c2 for _, c2 in pairs])
+        elif method == "ox1":
+            C1, C2 = IndexCrossover.ox1_batch(A, B, rng=self.rng)
+        elif method == "kpoint":
+            C1, C2 = IndexCrossover.kpoint_batch(A, B, k=2, rng=self.rng)
+        elif method == "cx":
+            C1, C2 = IndexCrossover.cycle_crossover_batch(A, B)
+        elif method == "pmx":
+            C1, C2 = IndexCrossover.pmx_batch(A, B, rng=self.rng)
+        elif method == "erx":
+            C1, C2 = IndexCrossover.erx_batch(A, B, rng=self.rng)
+        else:
+            return None
+        if method == "pmx" and self.order_priorities is not None:
+            # como o PMX sobre Route: filhos reordenados por prioridade decrescente
+            C1 = IndexCrossover.prioritize(C1, self.priorities)
+            C2 = IndexCrossover.prioritize(C2, self.priorities)
+        return IndexCrossover.interleave(C1, C2)
+
+    def mutate(self, route: Route) -> Route:
+        """Aplica operador de mutação conforme método selecionado."""
+        method = self.config.mutation_method
+        if method == "swap":
+            return Mutation.mutacao_por_troca(route, self.py_rng)
+        elif method == "inverse":
+            return Mutation.mutacao_por_inversao(route, self.py_rng)
+        elif method == "shuffle":
+            return Mutation.mutacao_por_embaralhamento(route, self.py_rng)
+        else:
+            return Mutation.mutacao_por_troca(route, self.py_rng)
+
+    def mutate_genes(self, genes: np.ndarray) -> np.ndarray:
+        """Mutação in-place de todas as linhas de ``genes`` (equivalente a :meth:`mutate`)."""
+        method = self.config.mutation_method
+        if method == "inverse":
+            return IndexMutation.inversion(genes, self.rng, self.order_priorities)
+        elif method == "shuffle":
+            return IndexMutation.shuffle(genes, self.rng, self.order_priorities)
+        else:
+            return IndexMutation.swap(genes, self.rng, self.order_priorities)
+
+    # ---------------------------
+    # Avaliação
+    # ---------------------------
+
+    def evaluate(self, population: Population, log_cache: bool = True) -> None:
+        """Preenche fitness e custo da população (em lote)."""
+        fleet = self.fleet if self.fleet_mode else None
+        population.fitness[:], population.cost[:] = self.evaluate_genes(population.genes)
+        if log_cache and self.fitness_cache is not None and fleet is not None:
+            stats = self.fitness_cache.generation_stats()
+            self.logger.debug(
+                f"Cache de fitness: {stats['hits']} acertos, {stats['misses']} avaliações "
+                f"({stats['hit_rate']:.0%}), {stats['size']} entradas"
+            )
+
+    def evaluate_genes(self, genes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """``(fitness, custo)`` das linhas de ``genes`` com os recursos do motor
+        (avaliador paralelo, cache e arrays da instância)."""
+        fleet = self.fleet if self.fleet_mode else None
+        return FitnessFunction.evaluate_population(genes, self.provider, fleet, evaluator=self.fitness_evaluator,
+                                                   cache=self.fitness_cache, arrays=self.product_data)
+
+    def invalidate(self) -> None:
+        """Marca a população para reavaliação completa (após alterar genes por fora,
+        como na migração entre ilhas); o modo steady-state reavalia antes do passo."""
+        self._evaluated = False
+        self._best_row = 0
+
+    def solution_routes(self, genes: np.ndarray) -> Tuple[List[Route], Dict[str, int]]:
+        """Subrotas e uso da frota de um cromossomo (a partir do cache, se possível)."""
+        if not self.fleet_mode:
+            return [], {}
+        entry = self.fitness_cache.get(genes) if self.fitness_cache is not None else None
+        if entry is not None:
+            return FitnessFunction.routes_from_split(self.points, genes.tolist(), entry.bounds, entry.vehicles,
+                                                     self.fleet)
+        route = Route([self.points[i] for i in genes.tolist()])
+        _, routes, usage = FitnessFunction.calculate_fitness_with_fleet(route, self.depot, self.fleet,
+                                                                     self.provider)
+        return routes, usage
+
+    # ---------------------------
+    # Busca local
+    # ---------------------------
+
+    @property
+    def two_opt(self) -> TwoOpt:
+        """2-opt sobre a matriz da instância (listas de vizinhos montadas no primeiro uso)."""
+        if self._two_opt is None:
+            self._two_opt = TwoOpt(self.provider.matrix, self.config.local_search_neighbours)
+        return self._two_opt
+
+    @property
+    def inter_route(self) -> InterRouteSearch:
+        """Movimentos entre subrotas (só no modo VRP)."""
+        if self._inter_route is None:
+            self._inter_route = InterRouteSearch(self.provider, self.fleet, self.config.local_search_neighbours)
+        return self._inter_route
+
+    def local_search_stages(self, phase: str) -> Tuple[bool, bool]:
+        """``(2-opt, entre rotas)`` configurados para a fase ``"elite"`` ou ``"offspring"``."""
+        return (self.config.local_search == phase,
+                self.fleet_mode and self.config.inter_route_search == phase)
+
+    def local_search(self, population: Population, rows: Sequence[int],
+                     two_opt: bool = True, inter_route: bool = False) -> int:
+        """Aplica busca local às linhas indicadas dentro de ``config.local_search_time``.
+
+        ``two_opt`` encurta o ciclo do cromossomo; no modo TSP isso sempre reduz
+        o custo. ``inter_route`` (VRP) melhora as subrotas do split com
+        :class:`InterRouteSearch` e reescreve o cromossomo (lamarckiano). No
+        modo VRP a nova ordem só é mantida se o custo penalizado melhorar.
+        Fitness e custo das linhas mantidas são atualizados.
+
+        Returns:
+            Número de indivíduos melhorados.
+        """
+        deadline = time.perf_counter() + self.config.local_search_time
+        if self._deadline is not None:
+            deadline = min(deadline, self._deadline)
+        changed, originals = [], []
+        for row in rows:
+            if time.perf_counter() >= deadline:
+                break
+            tour, gain = population.genes[row], 0.0
+            if two_opt:
+                tour, gain = self.two_opt.improve(tour, deadline)
+            if inter_route:
+                _, splits = FitnessFunction._fleet_costs(tour[None, :], self.provider, self.priorities,
+                                                         self.fleet, with_splits=True)
+                bounds, vehicles = splits[0]
+                if bounds:
+                    tour, moved = self.inter_route.improve(tour, bounds, vehicles, deadline)
+                    gain += moved
+            if gain > 0:
+                changed.append(row)
+                originals.append(population.genes[row].copy())
+                population.genes[row] = tour
+        if not changed:
+            return 0
+
+        fleet = self.fleet if self.fleet_mode else None
+        fitness, cost = self.evaluate_genes(population.genes[changed])
+        kept = 0
+        if fleet is not None:
+            old_fitness, _ = self.evaluate_genes(np.asarray(originals))
+        for k, row in enumerate(changed):
+            if fleet is not None and fitness[k] <= old_fitness[k]:
+                population.genes[row] = originals[k]
+                continue
+            population.fitness[row], population.cost[row] = fitness[k], cost[k]
+            kept += 1
+        self.logger.debug(f"Busca local: {kept}/{len(changed)} indivíduos melhorados")
+        return kept
+
+    # ---------------------------
+    # Laço
+    # ---------------------------
+
+    def _record_generation(self, pop: Population, best_idx: int) -> None:
+        """Atualiza o melhor global e o histórico a partir da população avaliada."""
+        fitness_scores = pop.fitness
+        max_fitness = float(fitness_scores[best_idx])
+        self.generation_best = pop.route(best_idx)
+        self.generation_best_fitness = max_fitness
+        if max_fitness > self.best_fitness:
+            old_fitness = self.best_fitness
+            self.best_fitness = max_fitness
+            self.best_cost = float(pop.cost[best_idx])
+            self.best_route = self.generation_best.copy()
+            if self.fleet_mode:
+                self.best_route.routes, self.best_route.vehicle_usage = self.solution_routes(pop.genes[best_idx])
+
+            if old_fitness == 0 or (old_fitness > 0 and (max_fitness - old_fitness) / old_fitness > 0.1):
+                self.logger.info(
+                    f"Geração {self.current_generation}: Nova melhor fitness {max_fitness:.4f} (+{max_fitness - old_fitness:.4f})"
+                )
+
+        # Histórico
+        mean_fitness = float(np.mean(fitness_scores))
+        self.fitness_history.append(max_fitness)
+        self.mean_fitness_history.append(mean_fitness)
+        self.logger.debug(f"Fitness máximo: {max_fitness:.4f} | Fitness médio: {mean_fitness:.4f}")
+
+    def _offspring(self, parents: Population) -> np.ndarray:
+        """Crossover (em lote sobre índices quando disponível) e mutação dos pares
+        de ``parents``; os filhos ficam como linhas ``int32`` de genes."""
+        children = self.crossover_population(parents)
+        if children is None:
+            # pais materializados como Route apenas durante o operador
+            children = np.empty((len(parents) + len(parents) % 2, parents.n_points), dtype=np.int32)
+            for i in range(0, len(parents), 2):
+                child1, child2 = self.crossover(parents.route(i), parents.route((i + 1) % len(parents)))
+                children[i], children[i + 1] = parents.encode(child1), parents.encode(child2)
+        return self.mutate_genes(children)
+
+    @log_performance
+    def run_generation(self) -> None:
+        """Executa uma geração do algoritmo genético"""
+        start = time.perf_counter()
+        if not self.population:
+            self.logger.warning("População vazia, inicializando...")
+            self.initialize_population()
+        if self.config.replacement == "steady_state":
+            self.steady_state_generation()
+            self.current_generation += 1
+            self.elapsed_seconds += time.perf_counter() - start
+            return
+
+        pop = self.population
+        self.evaluate(pop)
+        stages = self.local_search_stages("elite")
+        if any(stages):
+            self.local_search(pop, [pop.best_index()], *stages)
+
+        # Atualizar melhor rota (rotas/uso da frota só são montados para o melhor)
+        self._record_generation(pop, pop.best_index())
+
+        # Seleção, crossover e mutação
+        selected = self.selection(pop, pop.fitness)
+        children = self._offspring(selected)
+
+        self.population = Population(children[: self.config.population_size], self.points)
+        self.invalidate()
+        stages = self.local_search_stages("offspring")
+        if any(stages):
+            self.local_search(self.population, range(len(self.population)), *stages)
+        self.current_generation += 1
+        self.elapsed_seconds += time.perf_counter() - start
+
+    # ---------------------------
+    # Steady-state
+    # ---------------------------
+
+    def steady_state_generation(self) -> None:
+        """Uma geração no modo steady-state: passos até gerar ``population_size`` filhos.
+
+        A população não é copiada nem realocada: cada passo escreve seus filhos
+        sobre indivíduos existentes. Só a primeira geração (ou após
+        :meth:`invalidate`) avalia a população inteira; depois, apenas os filhos
+        são avaliados e o índice do melhor é mantido incrementalmente.
+        """
+        pop = self.population
+        if not self._evaluated:
+            self.evaluate(pop)
+            self._evaluated = True
+            self._best_row = pop.best_index()
+        stages = self.local_search_stages("elite")
+        if any(stages) and self.local_search(pop, [self._best_row], *stages):
+            self._best_row = pop.best_index()
+
+        per_step = max(2, self.config.steady_state_offspring)
+        births = 0
+        while births < len(pop):
+            births += self.steady_state_step(per_step)
+        if self.fitness_cache is not None and self.fleet_mode:
+            stats = self.fitness_cache.generation_stats()
+            self.logger.debug(f"Cache de fitness: {stats['hits']} acertos, {stats['misses']} avaliações "
+                              f"({stats['hit_rate']:.0%})")
+        self._record_generation(pop, self._best_row)
+
+    def steady_state_step(self, count: int) -> int:
+        """Gera ``count`` filhos e os insere in-place na população avaliada.
+
+        Cada filho disputa a vaga de uma vítima (``config.steady_state_victim``):
+        os piores indivíduos ou o perdedor de um torneio inverso. O filho só
+        entra se tiver fitness maior que a vítima, o que preserva o melhor
+        indivíduo e permite atualizar ``_best_row`` sem varrer a população.
+
+        Returns:
+            Número de filhos gerados (avaliados), entrando ou não.
+        """
+        pop = self.population
+        count = max(2, min(count + count % 2, len(pop) + len(pop) % 2))
+        brood = self._brood
+        if brood is None or brood.genes.shape != (count, pop.n_points):
+            brood = self._brood = Population(np.empty((count, pop.n_points), dtype=np.int32), self.points)
+
+        if float(pop.fitness.sum()) > 0:
+            parent_rows = self.select_rows(pop.fitness, count)
+        else:
+            parent_rows = self.rng.integers(len(pop), size=count)
+        brood.genes[:] = self._offspring(pop.take(parent_rows))[:count]
+        self.evaluate(brood, log_cache=False)
+        stages = self.local_search_stages("offspring")
+        if any(stages):
+            self.local_search(brood, range(count), *stages)
+
+        fitness, cost, genes = pop.fitness, pop.cost, pop.genes
+        for k, victim in enumerate(self._victims(count)):
+            child_fitness = brood.fitness[k]
+            if child_fitness <= fitness[victim]:
+                continue
+            genes[victim] = brood.genes[k]
+            fitness[victim], cost[victim] = child_fitness, brood.cost[k]
+            if child_fitness > fitness[self._best_row]:
+                self._best_row = int(victim)
+        return count
+
+    def _victims(self, count: int) -> np.ndarray:
+        """Linhas que dão lugar aos filhos: os ``count`` piores (distintos) ou,
+        em ``"tournament"``, o pior de cada torneio de ``tournament_size``."""
+        fitness = self.population.fitness
+        size = len(fitness)
+        if self.config.steady_state_victim == "tournament":
+            k = min(self.config.tournament_size, size)
+            contenders = self.rng.integers(size, size=(count, k))
+            return contenders[np.arange(count), np.argmin(fitness[contenders], axis=1)]
+        count = min(count, size)
+        return np.argpartition(fitness, count - 1)[:count]
+
+    def restart(self) -> None:
+        """Reinício com injeção de diversidade: nova população (aleatória e
+        semeada, como na inicialização) mantendo ``config.restart_keep`` indivíduos
+        de elite — o melhor global e os melhores da população atual."""
+        keep = max(0, min(self.config.restart_keep, self.config.population_size))
+        elite = np.empty((0, len(self.points)), dtype=np.int32)
+        if keep:
+            self.evaluate(self.population)
+            order = np.argsort(-self.population.fitness, kind="stable")[:keep]
+            elite = self.population.genes[order].copy()
+            if self.best_route is not None:
+                elite[0] = self.population.encode(self.best_route)
+        self.initialize_population()
+        if len(elite):
+            self.population.genes[-len(elite):] = elite
+        self.restarts += 1
+        self._last_improvement = self.current_generation
+        self.logger.info(f"Estagnação: reinício {self.restarts} na geração {self.current_generation} "
+                         f"(elite mantida: {len(elite)})")
+
+    def _termination_reason(self) -> Optional[str]:
+        """Critério de parada atingido após a geração corrente (ou ``None``).
+
+        Atualiza o controle de estagnação: uma melhora conta se o custo cair mais
+        que ``stagnation_epsilon`` (relativo) desde a última melhora. Na
+        estagnação, reinicia enquanto houver ``max_restarts`` disponíveis.
+        """
+        cfg = self.config
+        if cfg.target_cost is not None and self.best_cost <= cfg.target_cost:
+            return "target_cost"
+        if self.best_cost < self._reference_cost * (1.0 - cfg.stagnation_epsilon):
+            self._reference_cost = self.best_cost
+            self._last_improvement = self.current_generation
+        elif (cfg.stagnation_generations > 0
+              and self.current_generation - self._last_improvement >= cfg.stagnation_generations):
+            if self.restarts < cfg.max_restarts:
+                self.restart()
+                return None
+            return "stagnation"
+        return None
+
+    def run(self, max_generations: Optional[int] = None,
+            on_generation: Optional[Callable[["GeneticEngine"], None]] = None,
+            time_limit: Optional[float] = None,
+            should_stop: Optional[Callable[[], bool]] = None) -> SolverResult:
+        """Executa gerações até um critério de parada.
+
+        Para em ``max_generations`` (padrão: ``config.max_generations``), no
+        orçamento de tempo, no custo alvo, na estagnação (após os reinícios
+        configurados) ou por cancelamento; o motivo fica em
+        ``SolverResult.stop_reason``. A busca local também respeita o orçamento.
+
+        Args:
+            max_generations: limite de gerações desta execução.
+            on_generation: callback chamado após cada geração, depois dos
+                critérios de parada (e de um eventual reinício por estagnação).
+            time_limit: limite de tempo (segundos) desta execução; ``None`` usa
+                ``config.time_limit`` (``None`` em ambos = sem limite).
+            should_stop: consultado antes de cada geração; ``True`` interrompe
+                a execução (cancelamento cooperativo).
+        """
+        limit = max_generations if max_generations is not None else self.config.max_generations
+        budget = time_limit if time_limit is not None else self.config.time_limit
+        self._deadline = time.perf_counter() + budget if budget is not None else None
+        self.stop_reason = "max_generations"
+        self.logger.info(
+            f"Iniciando AG: {len(self.points)} pontos, população={self.config.population_size}, gerações={limit}"
+        )
+        try:
+            while self.current_generation < limit:
+                if should_stop is not None and should_stop():
+                    self.logger.info(f"Execução cancelada na geração {self.current_generation}")
+                    self.stop_reason = "cancelled"
+                    break
+                if self._deadline is not None and time.perf_counter() >= self._deadline:
+                    self.logger.info(f"Limite de tempo de {budget:.1f}s atingido")
+                    self.stop_reason = "time_limit"
+                    break
+                self.run_generation()
+                reason = self._termination_reason()
+                if on_generation is not None:
+                    on_generation(self)
+                if reason is not None:
+                    self.stop_reason = reason
+                    break
+        finally:
+            self._deadline = None
+        self.logger.info(
+            f"AG finalizado após {self.current_generation} gerações ({self.stop_reason}) | "
+            f"melhor fitness: {self.best_fitness:.6f}"
+        )
+        return self.result()
+
+    def result(self) -> SolverResult:
+        """Fotografia do melhor resultado até agora."""
+        best = self.best_route
+        return SolverResult(
+            best_route=best.copy() if best is not None else None,
+            best_fitness=self.best_fitness,
+            best_cost=self.best_cost,
+            routes=list(getattr(best, "routes", None) or []),
+            vehicle_usage=dict(getattr(best, "vehicle_usage", None) or {}),
+            fitness_history=list(self.fitness_history),
+            mean_fitness_history=list(self.mean_fitness_history),
+            generations=self.current_generation,
+            elapsed_seconds=self.elapsed_seconds,
+            stop_reason=self.stop_reason,
+            restarts=self.restarts,
+            seed=self.seed_sequence.entropy,
+        )
@@ -0,0 +1,422 @@
+"""
+Resolução em lote pela linha de comando, sem interface gráfica.
+
+Uso::
+
+    python -m src.solve instancia.json -o resultado.json --generations 300
+    python -m src.solve instancias/ -o resultados/ --jobs 4 --time-limit 60
+
+Formato JSON da instância (coordenadas em unidades do mapa; 1 unidade = 0.1 km)::
+
+    {
+      "name": "centro-sp",
+      "depot": {"x": 400, "y": 300},
+      "fleet": [{"name": "Moto", "count": 5, "autonomy": 80, "cost_per_km": 1.0}],
+      "points": [
+        {"x": 120, "y": 80, "product": {"name": "P0", "weight": 500, "length": 20,
+                                         "width": 10, "height": 10, "priority": 0.5}}
+      ]
+    }
+
+Os campos do produto também podem vir direto no ponto. No CSV cada linha é um
+ponto com as colunas ``x, y, name, weight, length, width, height, priority``;
+uma linha com ``kind=depot`` define o depósito. Sem depósito, usa-se o
+centróide dos pontos; sem frota, ``--fleet`` ou ``default_fleet()``.
+
+Com um diretório de entrada, cada ``*.json``/``*.csv`` é resolvido em um
+processo separado (``--jobs``) e o resultado vai para ``<saida>/<nome>.json``.
+"""
+
+import argparse
+import csv
+import dataclasses
+import json
+import logging
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# adiciona 'src' e subpastas para imports relativos (domain/functions)
+src_dir = os.path.dirname(os.path.abspath(__file__))
+for _path in (src_dir, os.path.join(src_dir, "domain"), os.path.join(src_dir, "functions")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from delivery_point import DeliveryPoint
+from product import Product
+from vehicle import VehicleType, default_fleet
+from main.solver_engine import GAConfig, GeneticEngine, SolverResult
+from main.island_model import IslandConfig, IslandModel
+from main.checkpoint import (Checkpoint, CheckpointConfig, CheckpointMismatchError, CheckpointWriteError,
+                             CheckpointWriter)
+
+INSTANCE_SUFFIXES = (".json", ".csv")
+PRODUCT_FIELDS = ("name", "weight", "length", "width", "height", "priority")
+
+
+@dataclass
+class Instance:
+    """Instância carregada de arquivo: pontos (com produtos), depósito e frota."""
+    name: str
+    points: List[DeliveryPoint]
+    depot: DeliveryPoint
+    fleet: List[VehicleType]
+
+
+# ---------------------------
+# Leitura de instâncias
+# ---------------------------
+
+def _make_product(data: Dict, idx: int) -> Product:
+    return Product(
+        name=str(data.get("name") or f"P{idx}"),
+        weight=float(data["weight"]),
+        length=float(data["length"]),
+        width=float(data["width"]),
+        height=float(data["height"]),
+        priority=float(data.get("priority") or 0.0),
+    )
+
+
+def _make_point(data: Dict, idx: int) -> DeliveryPoint:
+    product_data = data.get("product")
+    if product_data is None:
+        product_data = {k: data[k] for k in PRODUCT_FIELDS if data.get(k) not in (None, "")}
+    try:
+        product = _make_product(product_data, idx)
+    except KeyError as e:
+        raise ValueError(f"ponto {idx}: campo de produto ausente {e}") from None
+    except ValueError as e:
+        raise ValueError(f"ponto {idx}: {e}") from None
+    return DeliveryPoint(float(data["x"]), float(data["y"]), product=product)
+
+
+def _centroid(points: List[DeliveryPoint]) -> DeliveryPoint:
+    cx = sum(p.x for p in points) / len(points)
+    cy = sum(p.y for p in points) / len(points)
+    return DeliveryPoint(cx, cy, product=None)
+
+
+def parse_fleet(data: List[Dict]) -> List[VehicleType]:
+    """Converte uma lista de dicts em tipos de veículos."""
+    return [VehicleType(name=str(v["name"]), count=int(v["count"]), autonomy=float(v["autonomy"]),
+                        cost_per_km=float(v.get("cost_per_km", 1.0))) for v in data]
+
+
+def load_instance(path: str, fleet: Optional[List[VehicleType]] = None) -> Instance:
+    """Lê uma instância JSON ou CSV.
+
+    Args:
+        path: caminho do arquivo (``.json`` ou ``.csv``).
+        fleet: frota que substitui a do arquivo (ex.: ``--fleet``).
+
+    Raises:
+        ValueError: formato desconhecido, instância vazia ou produto inválido.
+    """
+    p = Path(path)
+    depot_data = None
+    fleet_data = None
+    name = p.stem
+    if p.suffix.lower() == ".json":
+        data = json.loads(p.read_text(encoding="utf-8"))
+        if isinstance(data, list):
+            data = {"points": data}
+        name = str(data.get("name") or name)
+        rows = data.get("points") or []
+        depot_data = data.get("depot")
+        fleet_data = data.get("fleet")
+    elif p.suffix.lower() == ".csv":
+        with p.open(newline="", encoding="utf-8") as f:
+            rows = []
+            for row in csv.DictReader(f):
+                if (row.get("kind") or "").strip().lower() == "depot":
+                    depot_data = row
+                else:
+                    rows.append(row)
+    else:
+        raise ValueError(f"formato de instância não suportado: {p.suffix}")
+
+    points = [_make_point(row, i) for i, row in enumerate(rows)]
+    if not points:
+        raise ValueError(f"instância sem pontos de entrega: {path}")
+    depot = (DeliveryPoint(float(depot_data["x"]), float(depot_data["y"]), product=None)
+             if depot_data else _centroid(points))
+    if fleet is None:
+        fleet = parse_fleet(fleet_data) if fleet_data else default_fleet()
+    return Instance(name=name, points=points, depot=depot, fleet=list(fleet))
+
+
+# ---------------------------
+# Resolução
+# ---------------------------
+
+def _finite(value: float) -> Optional[float]:
+    return float(value) if math.isfinite(value) else None
+
+
+def result_to_dict(instance: Instance, engine: GeneticEngine, result: SolverResult) -> Dict:
+    """Serializa o resultado em dict JSON (pontos referenciados pelo índice na instância)."""
+    provider = engine.provider
+    cost_per_km = {vt.name: vt.cost_per_km for vt in instance.fleet}
+    order = provider.indices(result.best_route.delivery_points).tolist() if result.best_route else []
+    routes = []
+    for r in result.routes:
+        stops = provider.indices(r.delivery_points)
+        km = float(provider.to_km(provider.roundtrip_length(stops)))
+        routes.append({
+            "vehicle": r.vehicle_type,
+            "stops": stops.tolist(),
+            "distance_km": round(km, 3),
+            "cost": round(km * cost_per_km.get(r.vehicle_type, 1.0), 3),
+        })
+    if routes:
+        total_km = sum(r["distance_km"] for r in routes)
+    elif order:
+        total_km = float(provider.to_km(provider.tour_length(order)))
+    else:
+        total_km = 0.0
+    return {
+        "instance": instance.name,
+        "mode": "vrp" if engine.fleet_mode else "tsp",
+        "n_points": len(instance.points),
+        "generations": result.generations,
+        "stop_reason": result.stop_reason,
+        "restarts": result.restarts,
+        "seed": result.seed,
+        "elapsed_seconds": round(result.elapsed_seconds, 3),
+        "best_fitness": result.best_fitness,
+        "best_cost": _finite(result.best_cost),
+        "total_distance_km": round(total_km, 3),
+        "order": order,
+        "vehicle_usage": result.vehicle_usage,
+        "routes": routes,
+        "fitness_history": result.fitness_history,
+        "mean_fitness_history": result.mean_fitness_history,
+    }
+
+
+def solve_instance(instance: Instance, config: GAConfig, time_limit: Optional[float] = None,
+                   islands: Optional[IslandConfig] = None, checkpoint: Optional[CheckpointConfig] = None) -> Dict:
+    """Executa o AG na instância e devolve o resultado serializável.
+
+    Com ``islands`` (mais de uma ilha), usa o :class:`IslandModel`. Com
+    ``checkpoint``, grava o estado periodicamente (e ao final) e, se
+    ``checkpoint.resume`` e o arquivo existir, continua de onde parou.
+    """
+    if islands is not None and islands.islands > 1:
+        model = IslandModel(instance.points, instance.depot, instance.fleet,
+                            IslandModel.diverse_configs(config, islands.islands, islands.vary_operators), islands)
+        data = result_to_dict(instance, model, model.run(time_limit=time_limit))
+        data["islands"] = []
+        for r in model.reports:
+            c = model.configs[r.index]
+            data["islands"].append({"crossover": c.crossover_method, "selection": c.selection_method,
+                                    "mutation": c.mutation_method, "best_cost": _finite(r.best_cost)})
+        return data
+    with GeneticEngine(instance.points, instance.depot, instance.fleet, config) as engine:
+        if checkpoint is None:
+            return result_to_dict(instance, engine, engine.run(time_limit=time_limit))
+        if checkpoint.resume and os.path.exists(checkpoint.path):
+            Checkpoint.restore(engine, checkpoint.path)
+        with CheckpointWriter.from_config(checkpoint) as writer:
+            result = engine.run(time_limit=time_limit, on_generation=writer)
+            writer.submit(engine)
+        return result_to_dict(instance, engine, result)
+
+
+def _solve_file(path: str, out_path: str, config: GAConfig, time_limit: Optional[float],
+                fleet: Optional[List[VehicleType]], islands: Optional[IslandConfig] = None,
+                checkpoint: Optional[CheckpointConfig] = None) -> Dict:
+    """Tarefa de um processo do lote: lê, resolve e grava uma instância.
+
+    No lote, ``checkpoint.path`` é um diretório com um ``<nome>.npz`` por instância.
+    """
+    instance = load_instance(path, fleet)
+    if checkpoint is not None:
+        checkpoint = dataclasses.replace(checkpoint, path=str(Path(checkpoint.path) / f"{Path(path).stem}.npz"))
+    data = solve_instance(instance, config, time_limit, islands, checkpoint)
+    _write_json(data, out_path)
+    return data
+
+
+def _write_json(data: Dict, out_path: Optional[str]) -> None:
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if out_path is None:
+        print(text)
+        return
+    Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(out_path).write_text(text, encoding="utf-8")
+
+
+def solve_directory(directory: str, out_dir: str, config: GAConfig, time_limit: Optional[float] = None,
+                    fleet: Optional[List[VehicleType]] = None, jobs: Optional[int] = None,
+                    islands: Optional[IslandConfig] = None,
+                    checkpoint: Optional[CheckpointConfig] = None) -> Dict[str, Dict]:
+    """Resolve todas as instâncias de ``directory`` em paralelo (um processo por instância).
+
+    Returns:
+        Mapa ``arquivo -> resultado``; instâncias com erro trazem ``{"error": mensagem}``.
+    """
+    files = sorted(str(p) for p in Path(directory).iterdir() if p.suffix.lower() in INSTANCE_SUFFIXES)
+    outcomes: Dict[str, Dict] = {}
+    if not files:
+        return outcomes
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(_solve_file, f, str(Path(out_dir) / f"{Path(f).stem}.json"), config, time_limit, fleet,
+                        islands, checkpoint): f
+            for f in files
+        }
+        for fut in as_completed(futures):
+            f = futures[fut]
+            try:
+                outcomes[f] = fut.result()
+            except Exception as e:
+                outcomes[f] = {"error": f"{type(e).__name__}: {e}"}
+    return outcomes
+
+
+# ---------------------------
+# CLI
+# ---------------------------
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"deve ser >= 1 (recebido {number})")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="python -m src.solve", description="Resolve instâncias TSP/VRP sem interface")
+    ap.add_argument("input", help="Instância (.json/.csv) ou diretório de instâncias")
+    ap.add_argument("-o", "--output", help="Arquivo (ou diretório, no modo lote) de saída; padrão: stdout / out/solve")
+    ap.add_argument("--generations", type=int, default=GAConfig.max_generations, help="Limite de gerações")
+    ap.add_argument("--time-limit", type=float, help="Limite de tempo por instância (segundos)")
+    ap.add_argument("--stagnation", type=int, default=GAConfig.stagnation_generations,
+                    help="Para após K gerações sem melhora relativa > --epsilon (0 desativa)")
+    ap.add_argument("--epsilon", type=float, default=GAConfig.stagnation_epsilon)
+    ap.add_argument("--target-cost", type=float, help="Para ao atingir custo <= alvo")
+    ap.add_argument("--restarts", type=int, default=GAConfig.max_restarts,
+                    help="Reinícios com injeção de diversidade na estagnação antes de parar")
+    ap.add_argument("--population", type=int, default=GAConfig.population_size)
+    ap.add_argument("--seed", type=int, help="Semente mestre (execução reprodutível; ilhas recebem fluxos derivados)")
+    ap.add_argument("--selection", choices=["roulette", "tournament", "rank", "sus"], default=GAConfig.selection_method)
+    ap.add_argument("--tournament-size", type=_positive_int, default=GAConfig.tournament_size,
+                    help="Competidores por torneio (seleção 'tournament')")
+    ap.add_argument("--crossover", choices=["pmx", "ox1", "cx", "kpoint", "erx"], default=GAConfig.crossover_method)
+    ap.add_argument("--mutation", choices=["swap", "inverse", "shuffle"], default=GAConfig.mutation_method)
+    ap.add_argument("--no-elitism", action="store_true")
+    ap.add_argument("--replacement", choices=["generational", "steady_state"], default=GAConfig.replacement,
+                    help="Substituição geracional ou steady-state (filhos substituem indivíduos in-place)")
+    ap.add_argument("--steady-offspring", type=int, default=GAConfig.steady_state_offspring,
+                    help="Filhos por passo no modo steady_state")
+    ap.add_argument("--victim", choices=["worst", "tournament"], default=GAConfig.steady_state_victim,
+                    help="Quem dá lugar aos filhos no modo steady_state: os piores ou o perdedor de um torneio")
+    ap.add_argument("--local-search", choices=["none", "elite", "offspring"], default=GAConfig.local_search,
+                    help="Busca local 2-opt (memética) aplicada ao melhor indivíduo ou aos filhos")
+    ap.add_argument("--inter-route", choices=["none", "elite", "offspring"], default=GAConfig.inter_route_search,
+                    help="Movimentos entre rotas (relocate/troca/2-opt*) no modo VRP")
+    ap.add_argument("--seed-fraction", type=float, default=GAConfig.seed_fraction,
+                    help="Fração da população inicial gerada por heurísticas (vizinho mais próximo, economias, varredura)")
+    ap.add_argument("--local-search-time", type=float, default=GAConfig.local_search_time,
+                    help="Orçamento da busca local por geração (segundos)")
+    ap.add_argument("--tsp", action="store_true", help="Ignora a frota (TSP puro)")
+    ap.add_argument("--fleet", help="JSON com a frota (lista de veículos), substitui a da instância")
+    ap.add_argument("--islands", type=int, default=1,
+                    help="Populações independentes em processos separados (modelo de ilhas)")
+    ap.add_argument("--migration-interval", type=int, default=IslandConfig.migration_interval,
+                    help="Gerações entre migrações no modelo de ilhas")
+    ap.add_argument("--migrants", type=int, default=IslandConfig.migrants, help="Migrantes por ilha")
+    ap.add_argument("--topology", choices=["ring", "random"], default=IslandConfig.topology)
+    ap.add_argument("--same-operators", action="store_true",
+                    help="Todas as ilhas usam --selection/--crossover/--mutation (padrão: variam por ilha)")
+    ap.add_argument("--checkpoint", help="Arquivo .npz (diretório, no modo lote) para gravar o estado do AG")
+    ap.add_argument("--checkpoint-every", type=int, default=CheckpointConfig.every_generations,
+                    help="Gerações entre checkpoints")
+    ap.add_argument("--checkpoint-seconds", type=float, help="Segundos entre checkpoints (além de --checkpoint-every)")
+    ap.add_argument("--resume", action="store_true", help="Continua do --checkpoint, se existir")
+    ap.add_argument("--workers", type=int, default=0, help="Processos para a fitness de cada instância")
+    ap.add_argument("--jobs", type=int, help="Instâncias resolvidas em paralelo no modo lote")
+    ap.add_argument("-v", "--verbose", action="store_true", help="Mostra o log do AG (stderr)")
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, stream=sys.stderr,
+                        format="%(asctime)s - %(levelname)s - %(name)s - %(message)s")
+
+    config = GAConfig(
+        population_size=args.population,
+        max_generations=args.generations,
+        selection_method=args.selection,
+        tournament_size=args.tournament_size,
+        local_search=args.local_search,
+        local_search_time=args.local_search_time,
+        inter_route_search=args.inter_route,
+        seed_fraction=args.seed_fraction,
+        stagnation_generations=args.stagnation,
+        stagnation_epsilon=args.epsilon,
+        target_cost=args.target_cost,
+        max_restarts=args.restarts,
+        crossover_method=args.crossover,
+        mutation_method=args.mutation,
+        elitism=not args.no_elitism,
+        replacement=args.replacement,
+        steady_state_offspring=args.steady_offspring,
+        steady_state_victim=args.victim,
+        use_fleet=not args.tsp,
+        fitness_workers=args.workers,
+        seed=args.seed,
+    )
+    fleet = parse_fleet(json.loads(Path(args.fleet).read_text(encoding="utf-8"))) if args.fleet else None
+    islands = IslandConfig(islands=args.islands, migration_interval=args.migration_interval,
+                           migrants=args.migrants, topology=args.topology,
+                           vary_operators=not args.same_operators) if args.islands > 1 else None
+    checkpoint = None
+    if args.checkpoint:
+        if islands is not None:
+            print("--checkpoint não é suportado com --islands", file=sys.stderr)
+            return 2
+        checkpoint = CheckpointConfig(args.checkpoint, args.checkpoint_every, args.checkpoint_seconds, args.resume)
+
+    if os.path.isdir(args.input):
+        out_dir = args.output or os.path.join("out", "solve")
+        outcomes = solve_directory(args.input, out_dir, config, args.time_limit, fleet, args.jobs, islands,
+                                   checkpoint)
+        failed = 0
+        for f in sorted(outcomes):
+            data = outcomes[f]
+            if "error" in data:
+                failed += 1
+                print(f"{f}: ERRO {data['error']}")
+            else:
+                print(f"{f}: custo={data['best_cost']} distância={data['total_distance_km']} km "
+                      f"gerações={data['generations']} ({data['stop_reason']}) tempo={data['elapsed_seconds']}s")
+        print(json.dumps({"instances": len(outcomes), "failed": failed, "output": out_dir}, ensure_ascii=False))
+        return 1 if failed else 0
+
+    try:
+        instance = load_instance(args.input, fleet)
+    except (OSError, ValueError) as e:
+        print(f"Erro ao ler instância: {e}", file=sys.stderr)
+        return 2
+    try:
+        data = solve_instance(instance, config, args.time_limit, islands, checkpoint)
+    except CheckpointMismatchError as e:
+        print(f"Erro ao retomar: {e}", file=sys.stderr)
+        return 2
+    except CheckpointWriteError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    _write_json(data, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
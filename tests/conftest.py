@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from delivery_point import DeliveryPoint
+from distance_provider import DistanceProvider
+from product import Product
+
+
+def random_instance(n=25, seed=0, priorities=(0.0, 0.5), products=True):
+    """``n`` pontos em ``[200, 600) x [100, 500)`` e depósito em ``(400, 300)``.
+
+    Cada ponto leva um produto de 100 g e 10x10x10 cm com prioridade sorteada
+    de ``priorities``; com ``products=False`` os pontos não têm produto.
+    """
+    rng = np.random.default_rng(seed)
+    xs, ys = rng.integers(200, 600, n), rng.integers(100, 500, n)
+    drawn = rng.choice(np.asarray(priorities, dtype=float), n)
+    pts = [DeliveryPoint(int(x), int(y),
+                         product=Product(name=f"P{i}", weight=100, length=10, width=10, height=10,
+                                         priority=float(p)) if products else None)
+           for i, (x, y, p) in enumerate(zip(xs, ys, drawn))]
+    return pts, DeliveryPoint(400, 300, product=None)
+
+
+@pytest.fixture
+def make_instance():
+    """Fábrica de instâncias aleatórias: ``make_instance(n, seed, ...) -> (pontos, depósito)``."""
+    return random_instance
+
+
+@pytest.fixture
+def make_provider():
+    """Fábrica de ``DistanceProvider`` sobre :func:`random_instance` (sem produtos);
+    ``depot=False`` omite o depósito."""
+    def build(n=20, seed=0, depot=True):
+        pts, deposito = random_instance(n, seed, products=False)
+        return DistanceProvider(pts, deposito if depot else None)
+    return build
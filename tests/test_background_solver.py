@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+# ensure src, domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+sys.path.insert(0, os.path.join(root, 'src'))
+
+from main.solver_engine import GAConfig, GeneticEngine
+from main.background_solver import BackgroundSolver
+
+
+@pytest.fixture
+def make_engine(make_instance):
+    def build(n=20, pop=16):
+        pts, depot = make_instance(n, seed=3)
+        return GeneticEngine(pts, depot, config=GAConfig(population_size=pop))
+    return build
+
+
+def test_background_solver_publishes_final_snapshot(make_engine):
+    solver = BackgroundSolver(make_engine(), max_generations=6)
+    solver.start()
+    assert solver.join(timeout=30)
+    snap = solver.latest()
+    assert not snap.running and snap.error is None
+    assert snap.generation == 6 and len(snap.fitness_history) == 6
+    assert snap.best_fitness == max(snap.fitness_history)
+    assert snap.best_route is not None and snap.best_route.routes
+
+
+def test_background_solver_cancels_between_generations(make_engine):
+    engine = make_engine()
+    seen = []
+    solver = BackgroundSolver(engine, max_generations=10_000)
+    original = engine.run_generation
+
+    def counting_generation():
+        original()
+        seen.append(engine.current_generation)
+        if len(seen) == 3:
+            solver.cancel()
+
+    engine.run_generation = counting_generation
+    solver.start()
+    assert solver.join(timeout=30)
+    snap = solver.latest()
+    assert not snap.running
+    assert snap.generation == 3
+    # snapshots publicados são imutáveis: o histórico é uma tupla
+    assert isinstance(snap.fitness_history, tuple)
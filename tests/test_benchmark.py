@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+
+# ensure src is importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src'))
+
+import benchmark
+
+
+def test_every_case_runs_on_a_small_instance():
+    seen = []
+    results = benchmark.run_benchmarks(sizes=[12], min_time=0.001, repeats=2, progress=seen.append)
+    assert [r.name for r in results] == list(benchmark.CASES) == [r.name for r in seen]
+    for r in results:
+        assert r.n == 12 and r.ns_per_op > 0 and r.ns_per_op_min <= r.ns_per_op
+        assert r.number >= 1 and r.peak_bytes >= 0 and r.retained_bytes >= 0
+
+
+def test_compare_flags_time_and_memory_regressions():
+    base = [{"name": "a", "n": 10, "ns_per_op": 100.0, "peak_bytes": 10**6},
+            {"name": "b", "n": 10, "ns_per_op": 100.0, "peak_bytes": 100},
+            {"name": "c", "n": 10, "ns_per_op": 100.0, "peak_bytes": 10**6}]
+    current = [{"name": "a", "n": 10, "ns_per_op": 130.0, "peak_bytes": 10**6},
+               {"name": "b", "n": 10, "ns_per_op": 110.0, "peak_bytes": 10**5},
+               {"name": "c", "n": 10, "ns_per_op": 90.0, "peak_bytes": 2 * 10**6},
+               {"name": "a", "n": 100, "ns_per_op": 1e9, "peak_bytes": 0}]
+    rows = benchmark.compare(current, base, threshold=0.2)
+    assert [(r["name"], r["regression"]) for r in rows] == [("a", True), ("b", False), ("c", True)]
+    assert rows[0]["time_ratio"] == 1.3 and rows[2]["peak_ratio"] == 2.0
+
+
+def test_main_writes_json_and_compares_with_baseline(tmp_path, capsys):
+    out = tmp_path / "bench.json"
+    args = ["--sizes", "10", "--only", "^mutation", "--min-time", "0.001", "--repeats", "2"]
+    assert benchmark.main(args + ["-o", str(out)]) == 0
+    data = json.loads(out.read_text())
+    assert {r["name"] for r in data["results"]} == {"mutation.swap", "mutation.inverse", "mutation.shuffle"}
+    assert data["environment"]["seed"] == 0 and data["environment"]["numpy"]
+
+    for r in data["results"]:
+        r["ns_per_op"] /= 100
+    (tmp_path / "base.json").write_text(json.dumps(data))
+    assert benchmark.main(args + ["-o", str(out), "--baseline", str(tmp_path / "base.json")]) == 1
+    assert "3 regressões" in capsys.readouterr().out
+    assert len(json.loads(out.read_text())["comparison"]["cases"]) == 3
@@ -0,0 +1,93 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# ensure src (main), domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from vehicle import VehicleType
+from main.checkpoint import Checkpoint, CheckpointMismatchError, CheckpointWriteError, CheckpointWriter
+from main.solver_engine import GAConfig, GeneticEngine
+
+FLEET = [VehicleType("Moto", 6, 80.0, 1.0), VehicleType("Van", 2, 250.0, 1.4)]
+
+
+@pytest.fixture
+def make_engine(make_instance):
+    def build(seed=0, n=18, **config):
+        pts, depot = make_instance(n, seed)
+        config = GAConfig(population_size=12, crossover_method="ox1", **config)
+        return GeneticEngine(pts, depot, FLEET, config)
+    return build
+
+
+@pytest.mark.parametrize("replacement", ["generational", "steady_state"])
+def test_resume_continues_the_same_run(tmp_path, replacement, make_engine):
+    path = str(tmp_path / "run.npz")
+    engine = make_engine(replacement=replacement)
+    engine.run(max_generations=4)
+    Checkpoint.save(path, Checkpoint.capture(engine))
+    expected = engine.run(max_generations=8)
+
+    resumed = make_engine(replacement=replacement)
+    Checkpoint.restore(resumed, path)
+    assert resumed.current_generation == 4 and resumed.fitness_history == expected.fitness_history[:4]
+    result = resumed.run(max_generations=8)
+    assert result.fitness_history == expected.fitness_history
+    assert result.best_cost == expected.best_cost and result.generations == 8
+    assert np.array_equal(resumed.population.genes, engine.population.genes)
+    assert result.routes and sum(len(r) for r in result.routes) == 18
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_restore_refuses_other_instance(tmp_path, make_engine):
+    path = str(tmp_path / "run.npz")
+    engine = make_engine(seed=0)
+    engine.run(max_generations=1)
+    Checkpoint.save(path, Checkpoint.capture(engine))
+    with pytest.raises(CheckpointMismatchError, match="outra instância"):
+        Checkpoint.restore(make_engine(seed=1), path)
+    with pytest.raises(CheckpointMismatchError, match="população"):
+        Checkpoint.restore(GeneticEngine(engine.points, engine.depot, FLEET, GAConfig(population_size=14)), path)
+
+
+def test_writer_saves_periodically_in_background(tmp_path, make_engine):
+    path = str(tmp_path / "sub" / "run.npz")
+    engine = make_engine()
+    with CheckpointWriter(path, every_generations=3) as writer:
+        engine.run(max_generations=7, on_generation=writer)
+    assert writer.error is None and 1 <= writer.saved <= 2
+    assert int(Checkpoint.load(path)["generation"]) == 6
+
+
+def test_resume_after_stagnation_restart_matches_uninterrupted_run(tmp_path, make_engine):
+    config = dict(stagnation_generations=2, max_restarts=3)
+    restarted = False
+    for stop in range(2, 12):
+        path = str(tmp_path / f"run{stop}.npz")
+        engine = make_engine(**config)
+        with CheckpointWriter(path, every_generations=1) as writer:
+            engine.run(max_generations=stop, on_generation=writer)
+        restarted |= engine.restarts > 0
+        expected = engine.run(max_generations=20)
+
+        resumed = make_engine(**config)
+        Checkpoint.restore(resumed, path)
+        result = resumed.run(max_generations=20)
+        assert result.fitness_history == expected.fitness_history, stop
+        assert result.restarts == expected.restarts and result.stop_reason == expected.stop_reason
+    assert restarted
+
+
+def test_writer_reports_write_failures(tmp_path, make_engine):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    writer = CheckpointWriter(str(blocker / "run.npz"), every_generations=1)
+    writer.submit(make_engine())
+    with pytest.raises(CheckpointWriteError, match="run.npz"):
+        writer.close()
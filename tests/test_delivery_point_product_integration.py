@@ -24,3 +24,23 @@ def test_delivery_point_holds_product_and_distances_work():
     # Route operations still work
     r = Route([p1, p2])
     assert r.distancia_total() == pytest.approx(10.0, rel=1e-6)  # 5 there + 5 back in cycle
+
+
+def test_compute_distance_matrix_modes():
+    import numpy as np
+    pts = [DeliveryPoint(0.0, 0.0, product=None), DeliveryPoint(3.0, 4.0, product=None),
+           DeliveryPoint(6.0, 8.0, product=None)]
+    depot = DeliveryPoint(0.0, 8.0, product=None)
+
+    mat = DeliveryPoint.compute_distance_matrix(pts)
+    assert mat.shape == (3, 3)
+    assert mat[0, 1] == pytest.approx(5.0) and mat[0, 2] == pytest.approx(10.0)
+    assert np.allclose(mat, mat.T) and np.all(np.diag(mat) == 0)
+
+    full = DeliveryPoint.compute_distance_matrix(pts, dtype=np.float32, depot=depot)
+    assert full.dtype == np.float32 and full.shape == (4, 4)
+    assert full[0, 1] == pytest.approx(depot.distancia_pura(pts[0]))
+    assert np.allclose(full[1:, 1:], mat)
+
+    cond = DeliveryPoint.compute_distance_matrix(pts, condensed=True)
+    assert cond.tolist() == pytest.approx([mat[0, 1], mat[0, 2], mat[1, 2]])
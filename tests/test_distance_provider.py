@@ -0,0 +1,74 @@
+import os
+import pickle
+import sys
+
+import numpy as np
+import pytest
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from delivery_point import DeliveryPoint
+from distance_provider import DistanceProvider
+from route import Route
+from fitness_function import FitnessFunction
+
+
+def make_points():
+    coords = [(0, 0), (0, 30), (40, 30), (40, 0), (20, -10)]
+    return [DeliveryPoint(x, y, product=None) for x, y in coords]
+
+
+def reference_roundtrip(points, depot):
+    seq = [depot] + list(points) + [depot]
+    return sum(a.distancia_pura(b) for a, b in zip(seq, seq[1:]))
+
+
+def test_route_distances_match_unbound_computation():
+    pts = make_points()
+    depot = DeliveryPoint(20, 15, product=None)
+    order = [pts[i] for i in (2, 0, 4, 1, 3)]
+    expected_cycle = Route(order).distancia_total()
+    expected_rt = Route(order).distancia_roundtrip(depot)
+
+    provider = DistanceProvider(pts, depot)
+    assert provider.indices(order).tolist() == [2, 0, 4, 1, 3]
+    assert Route(order).distancia_total(provider) == pytest.approx(expected_cycle)
+    assert Route(order).distancia_roundtrip(depot, provider) == pytest.approx(expected_rt)
+    assert expected_rt == pytest.approx(reference_roundtrip(order, depot))
+    assert FitnessFunction._roundtrip_distance(order, depot, provider) == pytest.approx(expected_rt * provider.scale)
+
+
+def test_batched_tour_lengths():
+    pts = make_points()
+    depot = DeliveryPoint(20, 15, product=None)
+    provider = DistanceProvider(pts, depot, dtype=np.float32)
+    perms = np.array([[0, 1, 2, 3, 4], [4, 3, 2, 1, 0], [2, 0, 4, 1, 3]], dtype=np.int32)
+    lengths = provider.tour_length(perms)
+    roundtrips = provider.roundtrip_length(perms)
+    for row, length, rt in zip(perms, lengths, roundtrips):
+        seq = [pts[i] for i in row]
+        assert length == pytest.approx(Route(seq).distancia_total(), rel=1e-5)
+        assert rt == pytest.approx(reference_roundtrip(seq, depot), rel=1e-5)
+
+
+def test_lookup_rejects_points_from_other_instance():
+    pts = make_points()
+    provider = DistanceProvider(pts[:3])
+    extra = DeliveryPoint(1, 1, product=None)
+    assert DistanceProvider.lookup(pts[:3], provider)[0] is provider
+    assert DistanceProvider.lookup(pts[:3] + [extra], provider) == (None, None)
+    assert DistanceProvider.lookup(pts[:3], None) == (None, None)
+
+
+def test_providers_do_not_touch_shared_points():
+    pts = make_points()
+    before = len(pickle.dumps(pts))
+    first = DistanceProvider(pts)
+    second = DistanceProvider(pts[::-1])
+    # o segundo provider não "rouba" os pontos do primeiro
+    assert first.indices(pts).tolist() == list(range(5))
+    assert second.indices(pts).tolist() == [4, 3, 2, 1, 0]
+    assert len(pickle.dumps(pts)) == before and not hasattr(pts[0], "distance_provider")
@@ -0,0 +1,63 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from vehicle import VehicleType
+from fitness_function import FitnessFunction
+from fitness_cache import FitnessCache
+
+
+FLEET = [VehicleType("Moto", 8, 80.0, 1.0), VehicleType("Van", 3, 250.0, 1.4)]
+
+
+def test_duplicates_are_served_from_cache_with_same_results(make_provider):
+    provider = make_provider()
+    rng = np.random.default_rng(1)
+    base = np.array([rng.permutation(20) for _ in range(4)], dtype=np.int32)
+    genes = np.vstack([base, base[[0, 0, 2]]])
+    cache = FitnessCache(maxsize=100)
+
+    expected = FitnessFunction.evaluate_population(genes, provider, FLEET)
+    got = FitnessFunction.evaluate_population(genes, provider, FLEET, cache=cache)
+    assert np.array_equal(expected[0], got[0]) and np.array_equal(expected[1], got[1])
+    assert cache.generation_stats() == {"hits": 3, "misses": 4, "hit_rate": pytest.approx(3 / 7), "size": 4}
+
+    FitnessFunction.evaluate_population(genes, provider, FLEET, cache=cache)
+    assert cache.generation_stats()["misses"] == 0
+
+
+def test_entries_store_split_and_usage(make_provider):
+    provider = make_provider()
+    genes = np.arange(20, dtype=np.int32)[None, :]
+    cache = FitnessCache()
+    fitness, _ = FitnessFunction.evaluate_population(genes, provider, FLEET, cache=cache)
+    entry = cache.get(genes[0])
+    assert entry.fitness == fitness[0]
+    assert entry.bounds[0] == 0 and entry.bounds[-1] == 20
+    routes, usage = FitnessFunction.routes_from_split(provider.points, genes[0], entry.bounds, entry.vehicles, FLEET)
+    assert usage == entry.usage and sum(len(r) for r in routes) == 20
+
+
+def test_cache_is_cleared_when_instance_changes_and_bounded(make_provider):
+    cache = FitnessCache(maxsize=3)
+    genes = np.array([np.roll(np.arange(20), k) for k in range(5)], dtype=np.int32)
+    first = make_provider(seed=0)
+    FitnessFunction.evaluate_population(genes, first, FLEET, cache=cache)
+    assert cache.bound and len(cache) == 3
+    # já associado: as avaliações seguintes não recalculam a impressão digital
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(FitnessCache, "fingerprint", staticmethod(lambda *a: pytest.fail("recalculada")))
+        FitnessFunction.evaluate_population(genes[:2], first, FLEET, cache=cache)
+    other = make_provider(seed=1)
+    _, _, priorities = FitnessFunction.product_arrays(other.points)
+    cache.bind(FitnessCache.fingerprint(other, priorities, FLEET))
+    assert len(cache) == 0
+    FitnessFunction.evaluate_population(genes[:1], other, FLEET, cache=cache)
+    assert len(cache) == 1
@@ -0,0 +1,105 @@
+import os
+import sys
+import random
+from math import inf
+
+import numpy as np
+import pytest
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from delivery_point import DeliveryPoint
+from product import Product
+from vehicle import VehicleType
+from fitness_function import FitnessFunction
+
+
+def make_instance(n, seed):
+    rnd = random.Random(seed)
+    pts = []
+    for i in range(n):
+        prod = Product(name=f"P{i}", weight=100, length=10, width=10, height=10,
+                       priority=rnd.choice([0.0, 0.5, 1.0]))
+        pts.append(DeliveryPoint(rnd.randint(0, 800), rnd.randint(0, 600), product=prod))
+    depot = DeliveryPoint(400, 300, product=None)
+    return pts, depot
+
+
+def naive_split_cost(order, depot, fleet):
+    """Implementação original O(N^3), usada como referência."""
+    N = len(order)
+    best = [inf] * (N + 1)
+    best[0] = 0.0
+    for i in range(N):
+        if best[i] == inf:
+            continue
+        for j in range(i + 1, N + 1):
+            dist = FitnessFunction._roundtrip_distance(order[i:j], depot)
+            costs = [vt.cost_per_km * dist for vt in fleet if dist <= vt.autonomy]
+            if costs and best[i] + min(costs) < best[j]:
+                best[j] = best[i] + min(costs)
+    return best[N]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_split_matches_naive_reference(seed):
+    pts, depot = make_instance(25, seed)
+    fleet = [VehicleType("Moto", 5, 80.0, 1.0), VehicleType("Van", 2, 250.0, 1.4)]
+    edges, legs = FitnessFunction._order_legs(pts, depot)
+    cost, prev, veh = FitnessFunction._split_legs(edges, legs, fleet)
+    assert cost == pytest.approx(naive_split_cost(pts, depot, fleet), rel=1e-9)
+
+
+def test_split_indices_uses_matrix_lookups():
+    pts, depot = make_instance(12, 7)
+    fleet = [VehicleType("Van", 3, 250.0, 1.4)]
+    xy = np.array([(p.x, p.y) for p in pts], dtype=float)
+    mat = np.hypot(*(xy[:, None, :] - xy[None, :, :]).transpose(2, 0, 1)) * 0.1
+    legs = np.hypot(xy[:, 0] - depot.x, xy[:, 1] - depot.y) * 0.1
+    perm = list(range(len(pts)))
+    random.Random(1).shuffle(perm)
+    cost, _, _ = FitnessFunction.split_indices(perm, mat, legs, fleet)
+    assert cost == pytest.approx(naive_split_cost([pts[i] for i in perm], depot, fleet), rel=1e-9)
+
+
+def test_split_infeasible_when_point_out_of_range():
+    far = DeliveryPoint(10_000, 10_000, product=None)
+    depot = DeliveryPoint(0, 0, product=None)
+    fleet = [VehicleType("Moto", 5, 80.0, 1.0)]
+    total, routes, usage, penalty = FitnessFunction._split_with_vehicle_choice([far], depot, fleet)
+    assert total == FitnessFunction.BIG_PENALTY
+    assert routes == [] and usage == {}
+
+
+def test_evaluate_population_matches_per_route_fitness():
+    sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+    from distance_provider import DistanceProvider
+    from route import Route
+
+    pts, depot = make_instance(30, 11)
+    fleet = [VehicleType("Moto", 8, 80.0, 1.0), VehicleType("Van", 3, 250.0, 1.4)]
+    provider = DistanceProvider(pts, depot)
+    rng = np.random.default_rng(0)
+    genes = np.array([rng.permutation(30) for _ in range(8)], dtype=np.int32)
+    genes[0, 5] = genes[0, 6]  # linha inválida cai no caminho via Route
+
+    fitness, costs = FitnessFunction.evaluate_population(genes, provider, fleet)
+    for row, fit in zip(genes, fitness):
+        expected = FitnessFunction.calculate_fitness_with_fleet(Route([pts[i] for i in row]), depot, fleet)[0]
+        assert fit == pytest.approx(expected, rel=1e-9)
+
+    tsp_fitness, _ = FitnessFunction.evaluate_population(genes[1:], provider)
+    for row, fit in zip(genes[1:], tsp_fitness):
+        expected = FitnessFunction.calculate_fitness_with_constraints(Route([pts[i] for i in row]))
+        assert fit == pytest.approx(expected, rel=1e-9)
+
+    # arrays da instância pré-calculados: mesmo resultado, sem recalcular por chamada
+    arrays = FitnessFunction.product_arrays(pts)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(FitnessFunction, "product_arrays", staticmethod(lambda points: pytest.fail("recalculado")))
+        again, _ = FitnessFunction.evaluate_population(genes[1:], provider, fleet, arrays=arrays)
+        tsp_again, _ = FitnessFunction.evaluate_population(genes[1:], provider, arrays=arrays)
+    assert np.array_equal(again, fitness[1:]) and np.array_equal(tsp_again, tsp_fitness)
@@ -0,0 +1,198 @@
+import os
+import sys
+
+import numpy as np
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from index_crossover import IndexCrossover
+
+
+def naive_fill(child, donor):
+    """Referência O(N²) dos operadores originais (filtra com ``not in``)."""
+    genes = [g for g in donor if g not in child]
+    gi = 0
+    for i in range(len(child)):
+        if child[i] is None:
+            child[i] = genes[gi]
+            gi += 1
+    return child
+
+
+def naive_ox1(a, b, start, end):
+    c1, c2 = [None] * len(a), [None] * len(a)
+    c1[start:end] = a[start:end]
+    c2[start:end] = b[start:end]
+    return naive_fill(c1, b), naive_fill(c2, a)
+
+
+def naive_kpoint(a, b, points):
+    c1, c2 = [None] * len(a), [None] * len(a)
+    bounds = [0] + list(points) + [len(a)]
+    for i in range(len(bounds) - 1):
+        if i % 2 == 0:
+            c1[bounds[i]:bounds[i + 1]] = a[bounds[i]:bounds[i + 1]]
+            c2[bounds[i]:bounds[i + 1]] = b[bounds[i]:bounds[i + 1]]
+    return naive_fill(c1, b), naive_fill(c2, a)
+
+
+def random_pairs(m=40, n=25, seed=0):
+    rng = np.random.default_rng(seed)
+    A = np.array([rng.permutation(n) for _ in range(m)], dtype=np.int32)
+    B = np.array([rng.permutation(n) for _ in range(m)], dtype=np.int32)
+    return rng, A, B
+
+
+def test_ox_and_ox1_match_reference():
+    rng, A, B = random_pairs()
+    for a, b in zip(A, B):
+        start, end = sorted(rng.choice(len(a), 2, replace=False))
+        r1, r2 = naive_ox1(a.tolist(), b.tolist(), start, end)
+        c1, c2 = IndexCrossover.ox1(a, b, cuts=(start, end))
+        assert c1.tolist() == r1 and c2.tolist() == r2
+        assert IndexCrossover.order_crossover(a, b, cuts=(start, end)).tolist() == r1
+
+
+def test_kpoint_matches_reference():
+    rng, A, B = random_pairs(seed=1)
+    for k in (1, 2, 3):
+        for a, b in zip(A, B):
+            points = sorted(rng.choice(np.arange(1, len(a)), k, replace=False))
+            r1, r2 = naive_kpoint(a.tolist(), b.tolist(), points)
+            c1, c2 = IndexCrossover.kpoint(a, b, k=k, points=points)
+            assert c1.tolist() == r1 and c2.tolist() == r2
+
+
+def test_batch_variants_match_single_pair():
+    rng, A, B = random_pairs(seed=2)
+    m, n = A.shape
+    cuts = np.sort(np.array([rng.choice(n, 2, replace=False) for _ in range(m)]), axis=1)
+    points = np.sort(np.array([rng.choice(np.arange(1, n), 3, replace=False) for _ in range(m)]), axis=1)
+    O1, O2 = IndexCrossover.ox1_batch(A, B, cuts)
+    K1, K2 = IndexCrossover.kpoint_batch(A, B, k=3, points=points)
+    O = IndexCrossover.order_crossover_batch(A, B, cuts)
+    for r in range(m):
+        s1, s2 = IndexCrossover.ox1(A[r], B[r], cuts[r])
+        assert (O1[r] == s1).all() and (O2[r] == s2).all() and (O[r] == s1).all()
+        k1, k2 = IndexCrossover.kpoint(A[r], B[r], k=3, points=points[r])
+        assert (K1[r] == k1).all() and (K2[r] == k2).all()
+
+
+def test_batch_random_cuts_produce_permutations():
+    rng, A, B = random_pairs(m=64, n=200, seed=3)
+    for C1, C2 in (IndexCrossover.ox1_batch(A, B, rng=rng), IndexCrossover.kpoint_batch(A, B, k=4, rng=rng)):
+        children = np.vstack([C1, C2])
+        assert (np.sort(children, axis=1) == np.arange(200)).all()
+    first, second = IndexCrossover.pair_rows(5)
+    assert first.tolist() == [0, 2, 4] and second.tolist() == [1, 3, 0]
+
+
+def naive_pmx(a, b, start, end):
+    """Referência do PMX por cadeia de mapeamento (dicionários), como o operador original."""
+    def child(base, donor):
+        c = list(base)
+        mapping = {}
+        for i in range(start, end):
+            c[i] = donor[i]
+            mapping[donor[i]] = base[i]
+        for i in range(len(c)):
+            if not (start <= i < end):
+                v = c[i]
+                while v in mapping:
+                    v = mapping[v]
+                c[i] = v
+        return c
+    return child(a, b), child(b, a)
+
+
+def naive_cx(a, b):
+    c1, c2 = [None] * len(a), [None] * len(a)
+    cycle = 0
+    for i in range(len(a)):
+        if c1[i] is not None:
+            continue
+        j = i
+        while c1[j] is None:
+            c1[j], c2[j] = (a[j], b[j]) if cycle % 2 == 0 else (b[j], a[j])
+            j = a.index(b[j])
+        cycle += 1
+    return c1, c2
+
+
+def test_pmx_and_cx_match_reference():
+    rng, A, B = random_pairs(seed=4)
+    for a, b in zip(A, B):
+        start, end = sorted(rng.choice(len(a), 2, replace=False))
+        r1, r2 = naive_pmx(a.tolist(), b.tolist(), start, end)
+        c1, c2 = IndexCrossover.pmx(a, b, cuts=(start, end))
+        assert c1.tolist() == r1 and c2.tolist() == r2
+        r1, r2 = naive_cx(a.tolist(), b.tolist())
+        c1, c2 = IndexCrossover.cycle_crossover(a, b)
+        assert c1.tolist() == r1 and c2.tolist() == r2
+
+
+def test_pmx_and_cx_batches_match_single_pair(monkeypatch):
+    rng, A, B = random_pairs(seed=5)
+    m, n = A.shape
+    cuts = np.sort(np.array([rng.choice(n, 2, replace=False) for _ in range(m)]), axis=1)
+    P1, P2 = IndexCrossover.pmx_batch(A, B, cuts)
+    # caminho vetorizado (lotes grandes) dá o mesmo resultado que o par a par
+    monkeypatch.setattr(IndexCrossover, "PMX_BATCH_MIN_PAIRS", 1)
+    V1, V2 = IndexCrossover.pmx_batch(A, B, cuts)
+    assert np.array_equal(P1, V1) and np.array_equal(P2, V2)
+    X1, X2 = IndexCrossover.cycle_crossover_batch(A, B)
+    for r in range(m):
+        s1, s2 = IndexCrossover.pmx(A[r], B[r], cuts[r])
+        assert (P1[r] == s1).all() and (P2[r] == s2).all()
+        s1, s2 = IndexCrossover.cycle_crossover(A[r], B[r])
+        assert (X1[r] == s1).all() and (X2[r] == s2).all()
+
+
+def test_prioritize_is_stable_descending():
+    priorities = np.array([0.0, 0.5, 0.0, 1.0, 0.5])
+    child = np.array([0, 1, 2, 3, 4])
+    assert IndexCrossover.prioritize(child, priorities).tolist() == [3, 1, 4, 0, 2]
+
+
+def test_erx_edge_table_uses_gene_identities():
+    a = np.array([0, 1, 2, 3, 4])
+    b = np.array([2, 0, 4, 1, 3])
+    table, degree = IndexCrossover._edge_table(a[None, :], b[None, :])
+    for g in range(5):
+        expected = set()
+        for p in (a.tolist(), b.tolist()):
+            i = p.index(g)
+            expected |= {p[i - 1], p[(i + 1) % 5]}
+        row = table[0, g]
+        assert set(row[row >= 0].tolist()) == expected
+        assert degree[0, g] == len(expected)
+
+
+def test_erx_children_are_permutations_and_follow_parent_edges():
+    rng = np.random.default_rng(4)
+    n = 60
+    a = rng.permutation(n)
+    c1, c2 = IndexCrossover.erx(a, a.copy(), rng=rng)
+    for c in (c1, c2):
+        assert c[0] == a[0]
+        assert c.tolist() in (a.tolist(), [a[0]] + a[1:][::-1].tolist())
+
+    for _ in range(20):
+        a, b = rng.permutation(n), rng.permutation(n)
+        edges = {frozenset((int(p[i]), int(p[(i + 1) % n]))) for p in (a, b) for i in range(n)}
+        c1, c2 = IndexCrossover.erx(a, b, rng=rng)
+        for c, start in ((c1, a[0]), (c2, b[0])):
+            assert sorted(c.tolist()) == list(range(n)) and c[0] == start
+            foreign = sum(frozenset((int(c[i]), int(c[i + 1]))) not in edges for i in range(n - 1))
+            assert foreign < n // 4
+
+
+def test_erx_batch_matches_single_pair():
+    rng = np.random.default_rng(5)
+    a, b = rng.permutation(40), rng.permutation(40)
+    C1, C2 = IndexCrossover.erx_batch(a[None, :], b[None, :], rng=np.random.default_rng(9))
+    c1, c2 = IndexCrossover.erx(a, b, rng=np.random.default_rng(9))
+    assert np.array_equal(C1[0], c1) and np.array_equal(C2[0], c2)
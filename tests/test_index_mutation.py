@@ -0,0 +1,67 @@
+import os
+import sys
+
+import numpy as np
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from index_crossover import IndexCrossover
+from index_mutation import IndexMutation
+
+
+def random_genes(m=50, n=30, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng, np.array([rng.permutation(n) for _ in range(m)], dtype=np.int32)
+
+
+def changed_span(before, after):
+    diff = np.flatnonzero(before != after)
+    return (int(diff[0]), int(diff[-1]) + 1) if len(diff) else None
+
+
+def test_swap_exchanges_exactly_two_positions_in_place():
+    rng, genes = random_genes()
+    before = genes.copy()
+    out = IndexMutation.swap(genes, rng)
+    assert out is genes
+    for b, a in zip(before, genes):
+        diff = np.flatnonzero(b != a)
+        assert len(diff) == 2 and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+
+
+def test_inversion_reverses_one_segment():
+    rng, genes = random_genes(seed=1)
+    before = genes.copy()
+    IndexMutation.inversion(genes, rng)
+    for b, a in zip(before, genes):
+        span = changed_span(b, a)
+        if span:
+            start, end = span
+            assert a[start:end].tolist() == b[start:end][::-1].tolist()
+
+
+def test_shuffle_permutes_within_one_segment():
+    rng, genes = random_genes(m=200, seed=2)
+    before = genes.copy()
+    IndexMutation.shuffle(genes, rng)
+    assert (np.sort(genes, axis=1) == np.arange(30)).all()
+    assert (before != genes).any(axis=1).mean() > 0.5
+    for b, a in zip(before, genes):
+        span = changed_span(b, a)
+        if span:
+            start, end = span
+            assert sorted(a[start:end].tolist()) == sorted(b[start:end].tolist())
+
+
+def test_priorities_reorder_after_mutation():
+    priorities = np.zeros(30)
+    priorities[[4, 17]] = (0.5, 1.0)
+    for op in (IndexMutation.swap, IndexMutation.inversion, IndexMutation.shuffle):
+        rng, genes = random_genes(seed=3)
+        mutated = op(genes.copy(), np.random.default_rng(9))
+        prioritized = op(genes, np.random.default_rng(9), priorities)
+        assert (prioritized[:, :2] == [17, 4]).all()
+        assert np.array_equal(prioritized, IndexCrossover.prioritize(mutated, priorities))
@@ -0,0 +1,116 @@
+import os
+import sys
+import time
+from dataclasses import replace
+
+import numpy as np
+
+# ensure src (main), domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from delivery_point import DeliveryPoint
+from main.island_model import Island, IslandConfig, IslandModel, IslandReport
+from main.solver_engine import GAConfig
+
+
+def make_points(n=20, seed=0):
+    rng = np.random.default_rng(seed)
+    return [DeliveryPoint(int(x), int(y), None) for x, y in rng.integers(100, 600, (n, 2))]
+
+
+def report(index, n=20):
+    return IslandReport(index, 0, None, 0.0, float("inf"), np.full((2, n), index, dtype=np.int32))
+
+
+def test_diverse_configs_and_migration_topologies():
+    configs = IslandModel.diverse_configs(GAConfig(population_size=12), 4)
+    assert len({(c.selection_method, c.crossover_method, c.mutation_method) for c in configs}) == 4
+    assert all(c.population_size == 12 for c in configs)
+
+    pts = make_points()
+    ring = IslandModel(pts, configs=configs, island_config=IslandConfig(topology="ring"), seed=0)
+    inbox = ring.route_migrants([report(i) for i in range(4)])
+    assert [int(m[0, 0]) for m in inbox] == [3, 0, 1, 2]
+
+    rand = IslandModel(pts, configs=configs, island_config=IslandConfig(topology="random"), seed=0)
+    inbox = rand.route_migrants([report(i) for i in range(4)])
+    assert sum(len(m) for m in inbox if m is not None) == 8
+    for target, m in enumerate(inbox):
+        assert m is None or target not in m[:, 0]
+
+
+def test_island_immigration_replaces_worst_rows():
+    pts = make_points()
+    island = Island(0, pts, None, [], GAConfig(population_size=8, use_fleet=False), seed=1)
+    pop = island.engine.population
+    island.engine.evaluate(pop)
+    worst = int(np.argmin(pop.fitness))
+    migrant = np.arange(20, dtype=np.int32)[None, :]
+    island.immigrate(migrant)
+    assert np.array_equal(pop.genes[worst], migrant[0])
+
+
+def test_island_model_runs_in_processes_and_serially():
+    pts = make_points(25, seed=2)
+    depot = DeliveryPoint(350, 350, None)
+    base = GAConfig(population_size=12)
+    for parallel in (True, False):
+        model = IslandModel(pts, depot, configs=IslandModel.diverse_configs(base, 3),
+                            island_config=IslandConfig(islands=3, migration_interval=3, migrants=2,
+                                                       parallel=parallel), seed=3)
+        epochs = []
+        result = model.run(max_generations=7, on_epoch=lambda m: epochs.append(m.generation))
+        assert epochs == [3, 6, 7]
+        assert result.generations == 7 and result.stop_reason == "max_generations"
+        assert len(result.fitness_history) == 7
+        assert result.best_fitness == max(r.best_fitness for r in model.reports)
+        assert sorted(id(p) for p in result.best_route) == sorted(id(p) for p in pts)
+
+
+def test_same_seed_gives_same_result_serially_and_in_parallel():
+    pts = make_points(20, seed=4)
+    depot = DeliveryPoint(350, 350, None)
+    results = []
+    for parallel in (True, False, False):
+        model = IslandModel(pts, depot, configs=IslandModel.diverse_configs(GAConfig(population_size=10), 3),
+                            island_config=IslandConfig(islands=3, migration_interval=2, topology="random",
+                                                       parallel=parallel), seed=11)
+        results.append(model.run(max_generations=5))
+    assert results[0].fitness_history == results[1].fitness_history == results[2].fitness_history
+    assert results[0].best_cost == results[1].best_cost and results[0].seed == 11
+    assert [p.x for p in results[0].best_route] == [p.x for p in results[1].best_route]
+
+
+def test_island_model_stops_on_shared_budget_and_target_cost():
+    pts = make_points(30, seed=5)
+    depot = DeliveryPoint(350, 350, None)
+    base = GAConfig(population_size=40)
+    serial = IslandConfig(islands=3, migration_interval=1_000, parallel=False)
+    start = time.perf_counter()
+    result = IslandModel(pts, depot, configs=IslandModel.diverse_configs(base, 3),
+                         island_config=serial, seed=0).run(max_generations=1_000_000, time_limit=0.3)
+    assert result.stop_reason == "time_limit" and time.perf_counter() - start < 0.6
+    assert len(result.fitness_history) == result.generations
+
+    # só a ilha 0 conhece o alvo; as outras seguiriam até max_generations
+    configs = [replace(base, target_cost=1e12)] + IslandModel.diverse_configs(base, 3)[1:]
+    model = IslandModel(pts, depot, configs=configs,
+                        island_config=IslandConfig(islands=3, migration_interval=4, parallel=False), seed=0)
+    result = model.run(max_generations=40)
+    assert result.stop_reason == "target_cost" and result.generations == 4
+
+
+def test_history_has_one_entry_per_generation_when_an_island_stagnates():
+    pts = make_points(20, seed=6)
+    base = GAConfig(population_size=10, use_fleet=False)
+    configs = [replace(base, stagnation_generations=1)] + [base, base]
+    model = IslandModel(pts, configs=configs,
+                        island_config=IslandConfig(islands=3, migration_interval=5, parallel=False), seed=2)
+    result = model.run(max_generations=20)
+    assert model.reports[0].stop_reason == "stagnation"
+    assert result.generations == 20 and len(result.fitness_history) == 20
+    assert len(result.mean_fitness_history) == 20
+    assert all(b >= a for a, b in zip(result.fitness_history, result.fitness_history[1:]))
@@ -0,0 +1,60 @@
+import os
+import sys
+
+import numpy as np
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from local_search import TwoOpt
+
+
+def random_matrix(n, seed):
+    xy = np.random.default_rng(seed).random((n, 2)) * 500
+    return np.sqrt(((xy[:, None, :] - xy[None, :, :]) ** 2).sum(axis=2))
+
+
+def tour_length(matrix, tour):
+    return float(matrix[tour, np.roll(tour, -1)].sum())
+
+
+def best_two_opt_delta(matrix, tour):
+    n = len(tour)
+    best = 0.0
+    for i in range(n - 1):
+        for j in range(i + 2, n if i else n - 1):
+            a, b, c, d = tour[i], tour[i + 1], tour[j], tour[(j + 1) % n]
+            best = min(best, matrix[a, c] + matrix[b, d] - matrix[a, b] - matrix[c, d])
+    return best
+
+
+def test_neighbour_lists_are_sorted_and_exclude_self():
+    m = random_matrix(30, 0)
+    nb = TwoOpt.neighbour_lists(m, 5)
+    assert nb.shape == (30, 5)
+    for i in range(30):
+        assert i not in nb[i]
+        assert np.all(np.diff(m[i, nb[i]]) >= 0)
+        assert m[i, nb[i][-1]] <= np.sort(np.delete(m[i], i))[4] + 1e-12
+
+
+def test_improve_reaches_two_opt_local_optimum():
+    for seed in range(5):
+        m = random_matrix(60, seed)
+        tour = np.random.default_rng(seed).permutation(60).astype(np.int32)
+        new, gain = TwoOpt(m, neighbours=59).improve(tour)
+        assert new.dtype == np.int32 and sorted(new.tolist()) == list(range(60))
+        assert np.isclose(tour_length(m, tour) - tour_length(m, new), gain)
+        assert best_two_opt_delta(m, new) > -1e-7
+
+
+def test_improve_with_short_lists_and_expired_budget():
+    m = random_matrix(200, 7)
+    tour = np.random.default_rng(7).permutation(200)
+    new, gain = TwoOpt(m, neighbours=8).improve(tour)
+    assert gain > 0.5 * tour_length(m, tour)
+    assert np.isclose(tour_length(m, tour) - tour_length(m, new), gain)
+    same, none = TwoOpt(m).improve(tour, deadline=0.0)
+    assert sorted(same.tolist()) == list(range(200)) and np.isclose(tour_length(m, tour) - tour_length(m, same), none)
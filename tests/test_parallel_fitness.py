@@ -0,0 +1,39 @@
+import os
+import sys
+
+import numpy as np
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from distance_provider import DistanceProvider
+from vehicle import VehicleType
+from fitness_function import FitnessFunction
+from parallel_fitness import ParallelFitnessEvaluator
+
+
+def test_parallel_costs_are_bit_identical_to_serial(make_instance):
+    pts, depot = make_instance(40)
+    fleet = [VehicleType("Moto", 8, 80.0, 1.0), VehicleType("Van", 3, 250.0, 1.4)]
+    provider = DistanceProvider(pts, depot)
+    rng = np.random.default_rng(1)
+    genes = np.array([rng.permutation(len(pts)) for _ in range(37)], dtype=np.int32)
+
+    serial_fit, serial_cost = FitnessFunction.evaluate_population(genes, provider, fleet)
+    with ParallelFitnessEvaluator(provider, fleet, workers=2, chunk_size=5) as ev:
+        par_fit, par_cost = FitnessFunction.evaluate_population(genes, provider, fleet, evaluator=ev)
+    assert np.array_equal(serial_fit, par_fit)
+    assert np.array_equal(serial_cost, par_cost)
+
+
+def test_single_worker_runs_in_process(make_instance):
+    pts, depot = make_instance(10)
+    fleet = [VehicleType("Van", 3, 250.0, 1.4)]
+    provider = DistanceProvider(pts, depot)
+    genes = np.arange(10, dtype=np.int32)[None, :]
+    with ParallelFitnessEvaluator(provider, fleet, workers=1) as ev:
+        assert ev._executor is None
+        assert np.array_equal(ev.fleet_costs(genes),
+                              FitnessFunction._fleet_costs(genes, provider, ev.priorities, fleet))
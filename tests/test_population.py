@@ -0,0 +1,44 @@
+import os
+import sys
+
+import numpy as np
+
+# ensure domain is importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+
+from delivery_point import DeliveryPoint
+from population import Population
+from route import Route
+
+
+def make_points(n=8):
+    return [DeliveryPoint(i * 10, (i % 3) * 7, product=None) for i in range(n)]
+
+
+def test_random_population_rows_are_permutations():
+    pts = make_points()
+    pop = Population.random(pts, 20, rng=np.random.default_rng(0))
+    assert pop.genes.shape == (20, 8) and pop.genes.dtype == np.int32
+    assert all(sorted(row) == list(range(8)) for row in pop.genes.tolist())
+    assert pop.fitness.shape == (20,) and np.all(np.isinf(pop.cost))
+
+
+def test_routes_roundtrip_through_index_matrix():
+    pts = make_points()
+    routes = [Route(pts), Route(list(reversed(pts)))]
+    pop = Population.from_routes(routes, pts)
+    assert pop.genes[1].tolist() == list(range(7, -1, -1))
+    assert pop.route(1).delivery_points == routes[1].delivery_points
+
+
+def test_take_copies_rows_and_scores():
+    pts = make_points(4)
+    pop = Population.random(pts, 3, rng=np.random.default_rng(1))
+    pop.fitness[:] = [0.1, 0.5, 0.2]
+    assert pop.best_index() == 1
+    picked = pop.take([1, 1, 0])
+    assert picked.genes[0].tolist() == pop.genes[1].tolist()
+    assert picked.fitness.tolist() == [0.5, 0.5, 0.1]
+    picked.genes[0, 0] = -1
+    assert pop.genes[1, 0] != -1
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# ensure domain, functions and src are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+sys.path.insert(0, os.path.join(root, 'src'))
+
+from vehicle import VehicleType
+from render_model import RenderModel
+from main.solver_engine import GAConfig, GeneticEngine
+
+
+@pytest.fixture
+def make_engine(make_instance):
+    def build(use_fleet=True):
+        pts, depot = make_instance(15, seed=5)
+        fleet = [VehicleType("Moto", 6, 80.0, 1.0), VehicleType("Van", 2, 250.0, 1.4)]
+        return GeneticEngine(pts, depot, fleet, GAConfig(population_size=12, use_fleet=use_fleet))
+    return build
+
+
+def test_render_model_from_engine_generation(make_engine):
+    engine = make_engine()
+    engine.run(max_generations=4)
+    depot = engine.depot
+    model = RenderModel.build(engine.current_generation, engine.best_route, engine.generation_best,
+                              depot, engine.fleet)
+
+    assert model.generation == 4
+    assert len(model.current_tour) == len(engine.points) + 1
+    assert model.current_tour[0] == model.current_tour[-1]
+    assert len(model.layers) == len(engine.best_route.routes)
+    for layer, route in zip(model.layers, engine.best_route.routes):
+        assert layer.polyline[0] == layer.polyline[-1] == (depot.x, depot.y)
+        expected = engine.provider.to_km(engine.provider.roundtrip_length(engine.provider.indices(route.delivery_points)))
+        assert np.isclose(layer.distance_km, expected)
+    assert model.usage == engine.best_route.vehicle_usage
+    cpk = {v.name: v.cost_per_km for v in engine.fleet}
+    assert np.isclose(model.total_cost, sum(l.distance_km * cpk[l.vehicle] for l in model.layers))
+
+
+def test_render_model_tsp_mode_has_no_layers(make_engine):
+    engine = make_engine(use_fleet=False)
+    engine.run(max_generations=2)
+    model = RenderModel.build(engine.current_generation, engine.best_route, engine.generation_best)
+    assert model.layers == () and model.usage == {}
+    assert len(model.current_tour) == len(engine.points) + 1
+    assert RenderModel().current_tour == ()
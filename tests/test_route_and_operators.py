@@ -88,3 +88,18 @@ def test_erx_and_kpoint_and_cx_and_pmx_preserve_points():
     for ch in (k1, k2, cx1, cx2, pmx1, pmx2):
         assert isinstance(ch, Route)
         assert sorted((p.x,p.y) for p in ch.delivery_points) == sorted((p.x,p.y) for p in pts)
+
+
+def test_route_operators_are_reproducible_with_explicit_rng():
+    import random
+    pts = [DeliveryPoint(i, (i * 5) % 7, product=None) for i in range(9)]
+    r1, r2 = Route(pts), Route(list(reversed(pts)))
+    runs = []
+    for _ in range(2):
+        rng = random.Random(42)
+        out = [Crossover.crossover_ordenado_ox1(r1, r2, rng), Crossover.erx_crossover_pair(r1, r2, rng),
+               Crossover.crossover_multiplos_pontos_kpoint(r1, r2, k=2, rng=rng),
+               (Mutation.mutacao_por_embaralhamento(r1, rng), Mutation.mutacao_por_inversao(r2, rng)),
+               (Selection.roulette([r1, r2], [1.0, 2.0], rng), Selection.tournament([r1, r2], [1.0, 2.0], 2, rng))]
+        runs.append([[(p.x, p.y) for p in route.delivery_points] for pair in out for route in pair])
+    assert runs[0] == runs[1]
@@ -0,0 +1,75 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+import seeding
+from seeding import Seeding
+from delivery_point import DeliveryPoint
+
+
+def is_permutation(tour, n):
+    return sorted(np.asarray(tour).tolist()) == list(range(n))
+
+
+def test_nearest_neighbour_kdtree_matches_matrix_fallback(monkeypatch, make_provider):
+    provider = make_provider(40)
+    xy = DeliveryPoint.coordinates(provider.points)
+    tour = Seeding.nearest_neighbour(xy, 5)
+    assert is_permutation(tour, 40) and tour[0] == 5
+    # cada passo vai para o mais próximo ainda livre
+    m = provider.matrix
+    for k in range(39):
+        free = tour[k + 1:]
+        assert m[tour[k], tour[k + 1]] == m[tour[k], free].min()
+    monkeypatch.setattr(seeding, "cKDTree", None)
+    assert np.array_equal(Seeding.nearest_neighbour(xy, 5, provider.matrix), tour)
+
+
+def test_savings_builds_valid_tours_and_beats_random(make_provider):
+    provider = make_provider(40)
+    m, legs = provider.matrix, provider.depot_legs
+    limit = 900.0
+    tour = Seeding.savings(m, legs, limit)
+    assert is_permutation(tour, 40)
+    # com limite infinito todas as rotas se fundem e o tour é bem melhor que um aleatório
+    merged = Seeding.savings(m, legs)
+    random_tour = np.random.default_rng(1).permutation(40)
+    assert provider.roundtrip_length(merged) < 0.6 * provider.roundtrip_length(random_tour)
+    assert is_permutation(Seeding.savings(m, legs, limit, noise=0.1, rng=np.random.default_rng(2)), 40)
+
+
+def test_sweep_orders_by_angle():
+    xy = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+    assert Seeding.sweep(xy, (0.0, 0.0)).tolist() == [0, 1, 2, 3]
+    assert Seeding.sweep(xy, (0.0, 0.0), offset=np.pi).tolist() == [2, 3, 0, 1]
+
+
+def test_seed_population_fraction_and_methods(make_provider):
+    for depot in (True, False):
+        provider = make_provider(40, depot=depot)
+        genes = np.tile(np.arange(40, dtype=np.int32), (10, 1))
+        assert Seeding.seed_population(genes, provider, 0.5, rng=np.random.default_rng(0)) == 5
+        assert all(is_permutation(row, 40) for row in genes)
+        assert np.array_equal(genes[5:], np.tile(np.arange(40), (5, 1)))
+    with pytest.raises(ValueError):
+        Seeding.seed_population(genes, provider, 0.5, methods=("greedy",))
+    with pytest.raises(ValueError):
+        Seeding.seed_population(genes, provider, 0.5, methods=())
+
+
+def test_savings_candidates_are_neighbour_pairs_and_reusable(make_provider):
+    provider = make_provider(n=60, seed=3)
+    m, legs = provider.matrix, provider.depot_legs
+    s, i, j = Seeding.savings_candidates(m, legs, neighbours=5)
+    assert len(s) <= 60 * 5 and (i < j).all() and (s > 0).all()
+    assert len(set(zip(i.tolist(), j.tolist()))) == len(s)
+    assert np.allclose(s, legs[i] + legs[j] - m[i, j])
+    candidates = Seeding.savings_candidates(m, legs)
+    assert np.array_equal(Seeding.savings(m, legs, 900.0, candidates=candidates), Seeding.savings(m, legs, 900.0))
@@ -0,0 +1,68 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from selection_functions import Selection, alias_table, rank_weights
+
+
+WEIGHTS = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+EXPECTED = WEIGHTS / WEIGHTS.sum()
+
+
+def frequencies(picks, n):
+    return np.bincount(picks, minlength=n) / len(picks)
+
+
+def test_alias_table_reproduces_the_distribution():
+    prob, alias = alias_table(WEIGHTS)
+    n = len(WEIGHTS)
+    exact = prob / n
+    np.add.at(exact, alias, (1 - prob) / n)
+    assert np.allclose(exact, EXPECTED)
+
+
+def test_roulette_batch_matches_weights():
+    rng = np.random.default_rng(0)
+    for use_alias in (False, True):
+        picks = Selection.roulette_batch(WEIGHTS, 100_000, rng=rng, use_alias=use_alias)
+        assert picks.shape == (100_000,) and picks.min() >= 1
+        assert np.allclose(frequencies(picks, 5), EXPECTED, atol=0.01)
+
+
+def test_rank_batch_uses_ranks_not_raw_fitness():
+    aptitudes = [5.0, 1000.0, 0.1, 3.0]
+    assert rank_weights(aptitudes).tolist() == [3.0, 4.0, 1.0, 2.0]
+    picks = Selection.rank_batch(aptitudes, 100_000, rng=np.random.default_rng(1))
+    assert np.allclose(frequencies(picks, 4), np.array([3, 4, 1, 2]) / 10, atol=0.01)
+
+
+def test_sus_spreads_picks_by_expected_count():
+    picks = Selection.sus(WEIGHTS, 10, rng=np.random.default_rng(2))
+    counts = np.bincount(picks, minlength=5)
+    # cada indivíduo recebe floor ou ceil de count * p
+    assert np.all(np.abs(counts - 10 * EXPECTED) < 1)
+    zeros = Selection.sus(np.zeros(4), 6, rng=np.random.default_rng(3))
+    assert zeros.shape == (6,) and zeros.max() < 4
+
+
+def test_tournament_batch_pressure_grows_with_size():
+    aptitudes = np.arange(20, dtype=float)
+    rng = np.random.default_rng(4)
+    means = []
+    for k in (1, 3, 8):
+        picks = Selection.tournament_batch(aptitudes, 20_000, tournament_size=k, rng=rng)
+        assert picks.shape == (20_000,) and picks.min() >= 0 and picks.max() < 20
+        means.append(aptitudes[picks].mean())
+    assert means[0] < means[1] < means[2]
+    # k=1 é uniforme; com k competidores o vencedor é o máximo deles
+    assert abs(means[0] - 9.5) < 0.3
+    assert Selection.tournament_batch(aptitudes, 5, tournament_size=200, rng=rng).tolist() == [19] * 5
+    with pytest.raises(ValueError, match="torneio"):
+        Selection.tournament_batch(aptitudes, 5, tournament_size=0, rng=rng)
@@ -0,0 +1,134 @@
+import json
+import os
+import sys
+
+import pytest
+
+# ensure src is importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src'))
+
+import solve
+from main.island_model import IslandConfig, IslandModel
+from main.solver_engine import GAConfig
+
+
+def write_instances(tmp_path):
+    points = [{"x": 200 + 37 * i % 400, "y": 100 + 53 * i % 400,
+               "product": {"name": f"P{i}", "weight": 500, "length": 20, "width": 10, "height": 10,
+                           "priority": 0.5 if i % 4 == 0 else 0.0}} for i in range(12)]
+    (tmp_path / "a.json").write_text(json.dumps({
+        "name": "a", "depot": {"x": 400, "y": 300}, "points": points,
+        "fleet": [{"name": "Moto", "count": 6, "autonomy": 80, "cost_per_km": 1.0}],
+    }))
+    rows = ["kind,x,y,name,weight,length,width,height,priority", "depot,400,300,,,,,,"]
+    rows += [f",{250 + 29 * i % 300},{150 + 41 * i % 300},C{i},300,10,10,10,0" for i in range(10)]
+    (tmp_path / "b.csv").write_text("\n".join(rows) + "\n")
+
+
+def test_load_instance_json_and_csv(tmp_path):
+    write_instances(tmp_path)
+    a = solve.load_instance(str(tmp_path / "a.json"))
+    assert a.name == "a" and len(a.points) == 12 and (a.depot.x, a.depot.y) == (400, 300)
+    assert [v.name for v in a.fleet] == ["Moto"]
+    assert a.points[0].product.priority == 0.5
+
+    b = solve.load_instance(str(tmp_path / "b.csv"))
+    assert b.name == "b" and len(b.points) == 10 and (b.depot.x, b.depot.y) == (400, 300)
+    assert b.points[3].product.name == "C3"
+
+
+def test_load_instance_rejects_invalid_product(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps([{"x": 1, "y": 2, "weight": 99999, "length": 1, "width": 1, "height": 1}]))
+    with pytest.raises(ValueError, match="ponto 0"):
+        solve.load_instance(str(path))
+
+
+def test_solve_instance_output_covers_all_points(tmp_path):
+    write_instances(tmp_path)
+    instance = solve.load_instance(str(tmp_path / "a.json"))
+    data = solve.solve_instance(instance, GAConfig(population_size=12, max_generations=5))
+    assert data["mode"] == "vrp" and data["generations"] == 5
+    assert sorted(data["order"]) == list(range(12))
+    assert sorted(i for r in data["routes"] for i in r["stops"]) == list(range(12))
+    assert sum(data["vehicle_usage"].values()) == len(data["routes"])
+    assert len(data["fitness_history"]) == 5
+    json.dumps(data)
+
+
+def test_main_batch_directory(tmp_path, capsys):
+    inp = tmp_path / "in"
+    inp.mkdir()
+    write_instances(inp)
+    out = tmp_path / "out"
+    rc = solve.main([str(inp), "-o", str(out), "--generations", "3", "--population", "8",
+                     "--jobs", "2"])
+    assert rc == 0
+    assert sorted(p.name for p in out.iterdir()) == ["a.json", "b.json"]
+    assert json.loads((out / "b.json").read_text())["generations"] == 3
+    assert '"failed": 0' in capsys.readouterr().out
+
+
+def test_main_island_mode(tmp_path):
+    write_instances(tmp_path)
+    out = tmp_path / "a_out.json"
+    rc = solve.main([str(tmp_path / "a.json"), "-o", str(out), "--generations", "4", "--population", "8",
+                     "--islands", "2", "--migration-interval", "2"])
+    assert rc == 0
+    data = json.loads(out.read_text())
+    assert data["generations"] == 4 and len(data["islands"]) == 2
+    assert sorted(data["order"]) == list(range(12))
+
+
+def test_main_checkpoint_and_resume(tmp_path):
+    write_instances(tmp_path)
+    ckpt = tmp_path / "a.npz"
+    args = [str(tmp_path / "a.json"), "--population", "8", "--checkpoint", str(ckpt), "--checkpoint-every", "2"]
+    assert solve.main(args + ["-o", str(tmp_path / "first.json"), "--generations", "3"]) == 0
+    assert ckpt.exists()
+
+    out = tmp_path / "second.json"
+    assert solve.main(args + ["-o", str(out), "--generations", "5", "--resume"]) == 0
+    data = json.loads(out.read_text())
+    assert data["generations"] == 5 and len(data["fitness_history"]) == 5
+
+    other = [str(tmp_path / "b.csv"), "--population", "8", "--checkpoint", str(ckpt), "--resume"]
+    assert solve.main(other) == 2
+
+
+def test_main_islands_with_fitness_workers(tmp_path):
+    write_instances(tmp_path)
+    out = tmp_path / "a_out.json"
+    rc = solve.main([str(tmp_path / "a.json"), "-o", str(out), "--generations", "2", "--population", "8",
+                     "--islands", "2", "--workers", "2", "--migration-interval", "1"])
+    assert rc == 0
+    data = json.loads(out.read_text())
+    assert data["generations"] == 2 and len(data["islands"]) == 2
+
+
+def test_main_fails_when_checkpoint_cannot_be_written(tmp_path, capsys):
+    write_instances(tmp_path)
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    rc = solve.main([str(tmp_path / "a.json"), "-o", str(tmp_path / "out.json"), "--generations", "2",
+                     "--population", "8", "--checkpoint", str(blocker / "a.npz")])
+    assert rc == 1 and "checkpoint" in capsys.readouterr().err
+
+
+def test_main_rejects_empty_tournament(tmp_path, capsys):
+    write_instances(tmp_path)
+    with pytest.raises(SystemExit) as exc:
+        solve.main([str(tmp_path / "a.json"), "--selection", "tournament", "--tournament-size", "0"])
+    assert exc.value.code == 2 and "--tournament-size" in capsys.readouterr().err
+
+
+def test_serial_islands_serialize_with_shared_provider(tmp_path):
+    write_instances(tmp_path)
+    instance = solve.load_instance(str(tmp_path / "a.json"))
+    model = IslandModel(instance.points, instance.depot, instance.fleet,
+                        IslandModel.diverse_configs(GAConfig(population_size=8), 2),
+                        IslandConfig(islands=2, migration_interval=2, parallel=False), seed=1)
+    data = solve.result_to_dict(instance, model, model.run(max_generations=4))
+    assert sorted(data["order"]) == list(range(12))
+    assert sorted(i for r in data["routes"] for i in r["stops"]) == list(range(12))
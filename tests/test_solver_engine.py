@@ -0,0 +1,195 @@
+import os
+import random
+import subprocess
+import sys
+
+import numpy as np
+
+# ensure domain, functions and main are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+sys.path.insert(0, os.path.join(root, 'src', 'main'))
+
+from vehicle import VehicleType
+from solver_engine import GAConfig, GeneticEngine
+
+
+def test_engine_runs_headless_vrp(make_instance):
+    pts, depot = make_instance()
+    fleet = [VehicleType("Moto", 6, 80.0, 1.0), VehicleType("Van", 2, 250.0, 1.4)]
+    config = GAConfig(population_size=20, max_generations=8, crossover_method="ox1")
+    with GeneticEngine(pts, depot, fleet, config) as engine:
+        result = engine.run()
+
+    assert result.generations == 8
+    assert len(result.fitness_history) == 8 == len(result.mean_fitness_history)
+    assert result.best_fitness == max(result.fitness_history) > 0
+    assert sorted(id(p) for p in result.best_route) == sorted(id(p) for p in pts)
+    assert result.routes and sum(result.vehicle_usage.values()) == len(result.routes)
+    assert sum(len(r) for r in result.routes) == len(pts)
+    assert np.isfinite(result.best_cost)
+
+
+def test_engine_tsp_mode_without_depot(make_instance):
+    pts, _ = make_instance(n=12)
+    engine = GeneticEngine(pts, config=GAConfig(population_size=10, use_fleet=False))
+    calls = []
+    result = engine.run(max_generations=3, on_generation=lambda e: calls.append(e.current_generation))
+    assert calls == [1, 2, 3]
+    assert result.routes == [] and result.vehicle_usage == {}
+    assert len(engine.population) == 10
+
+
+def test_engine_module_does_not_import_pygame():
+    code = ("import sys; sys.path.insert(0, %r); import solver_engine; "
+            "print('pygame' in sys.modules)") % os.path.join(root, 'src', 'main')
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_local_search_improves_population_rows(make_instance):
+    pts, depot = make_instance(n=40, seed=3)
+    for use_fleet, method, inter_route in ((False, "offspring", False), (True, "elite", False),
+                                           (True, "none", True)):
+        engine = GeneticEngine(pts, depot, config=GAConfig(population_size=10, use_fleet=use_fleet,
+                                                           local_search=method, local_search_time=1.0,
+                                                           inter_route_search="offspring" if inter_route else "none"))
+        engine.evaluate(engine.population)
+        before = engine.population.cost.copy()
+        kept = engine.local_search(engine.population, range(10), two_opt=method != "none", inter_route=inter_route)
+        after = engine.population.cost
+        assert np.all(after <= before) and (kept > 0) == bool(np.any(after < before))
+        for row in engine.population.genes:
+            assert sorted(row.tolist()) == list(range(40))
+        if not use_fleet:
+            assert kept == 10
+        assert engine.run(max_generations=2).generations == 2
+
+
+def test_termination_criteria_and_stop_reason(make_instance):
+    pts, depot = make_instance(n=20, seed=5)
+    base = dict(population_size=10, use_fleet=False)
+
+    result = GeneticEngine(pts, config=GAConfig(max_generations=4, **base)).run()
+    assert result.stop_reason == "max_generations" and result.generations == 4
+
+    result = GeneticEngine(pts, config=GAConfig(max_generations=10_000, time_limit=0.2, **base)).run()
+    assert result.stop_reason == "time_limit" and result.elapsed_seconds < 1.0
+
+    result = GeneticEngine(pts, config=GAConfig(max_generations=500, target_cost=1e12, **base)).run()
+    assert result.stop_reason == "target_cost" and result.generations == 1
+
+    result = GeneticEngine(pts, config=GAConfig(max_generations=100_000, stagnation_generations=5,
+                                                stagnation_epsilon=0.5, **base)).run()
+    assert result.stop_reason == "stagnation" and result.restarts == 0
+
+    engine = GeneticEngine(pts, config=GAConfig(max_generations=100_000, stagnation_generations=3,
+                                                stagnation_epsilon=0.5, max_restarts=2, restart_keep=2, **base))
+    result = engine.run()
+    assert result.stop_reason == "stagnation" and result.restarts == 2
+    assert result.best_fitness == max(result.fitness_history)
+
+    result = engine.run(should_stop=lambda: True)
+    assert result.stop_reason == "cancelled"
+
+
+def test_steady_state_replaces_in_place_and_evaluates_only_offspring(monkeypatch, make_instance):
+    from fitness_function import FitnessFunction
+
+    pts, depot = make_instance(n=20, seed=3)
+    fleet = [VehicleType("Moto", 6, 80.0, 1.0), VehicleType("Van", 2, 250.0, 1.4)]
+    sizes = []
+    evaluate = FitnessFunction.evaluate_population
+
+    def counting(genes, *args, **kwargs):
+        sizes.append(len(genes))
+        return evaluate(genes, *args, **kwargs)
+
+    monkeypatch.setattr(FitnessFunction, "evaluate_population", counting)
+    for victim in ("worst", "tournament"):
+        sizes.clear()
+        config = GAConfig(population_size=16, max_generations=4, crossover_method="ox1", replacement="steady_state",
+                          steady_state_offspring=4, steady_state_victim=victim)
+        engine = GeneticEngine(pts, depot, fleet, config)
+        genes = engine.population.genes
+        result = engine.run()
+
+        pop = engine.population
+        assert pop.genes is genes and result.generations == 4
+        assert sizes[0] == 16 and set(sizes[1:]) == {4} and len(sizes) == 1 + 4 * 4
+        assert result.fitness_history == sorted(result.fitness_history)
+        assert pop.fitness[engine._best_row] == pop.fitness.max() == result.best_fitness
+        fitness, cost = evaluate(pop.genes, engine.provider, fleet)
+        assert np.allclose(fitness, pop.fitness) and np.allclose(cost, pop.cost)
+        for row in pop.genes:
+            assert sorted(row.tolist()) == list(range(20))
+
+
+def test_same_seed_reproduces_the_run(make_instance):
+    pts, depot = make_instance(n=20, seed=6)
+    fleet = [VehicleType("Moto", 6, 80.0, 1.0), VehicleType("Van", 2, 250.0, 1.4)]
+
+    def run(seed, **config):
+        engine = GeneticEngine(pts, depot, fleet, GAConfig(population_size=12, max_generations=5, seed=seed, **config))
+        result = engine.run()
+        return result.fitness_history, result.mean_fitness_history, engine.population.genes.copy(), result.seed
+
+    for config in ({"crossover_method": "erx", "mutation_method": "shuffle", "selection_method": "rank"},
+                   {"crossover_method": "pmx", "selection_method": "tournament", "replacement": "steady_state"},
+                   {"crossover_method": "kpoint", "fitness_workers": 2, "seed_fraction": 0.5}):
+        first, second = run(7, **config), run(7, **config)
+        assert first[:2] == second[:2] and np.array_equal(first[2], second[2]) and first[3] == 7
+        assert not np.array_equal(run(8, **config)[2], first[2])
+    assert run(None)[3] != run(None)[3]
+
+
+def test_generators_use_independent_child_streams():
+    seq = np.random.SeedSequence(3)
+    np_rng, py_rng = GeneticEngine.generators(seq)
+    np_child, _ = np.random.SeedSequence(3).spawn(2)
+    assert np.array_equal(np_rng.integers(1 << 30, size=4), np.random.default_rng(np_child).integers(1 << 30, size=4))
+    # o random.Random não reaproveita as palavras iniciais da sequência mãe
+    parent = random.Random(int.from_bytes(seq.generate_state(4).tobytes(), "little"))
+    assert py_rng.random() != parent.random()
+    assert seq.n_children_spawned == 0
+
+
+def test_offspring_stay_as_gene_rows(monkeypatch, make_instance):
+    from mutation_function import Mutation
+    from population import Population
+
+    def fail(*args, **kwargs):
+        raise AssertionError("operador sobre Route chamado")
+
+    for name in ("mutacao_por_troca", "mutacao_por_inversao", "mutacao_por_embaralhamento"):
+        monkeypatch.setattr(Mutation, name, staticmethod(fail))
+    monkeypatch.setattr(Population, "from_routes", classmethod(fail))
+    monkeypatch.setattr(Population, "encode", fail)
+
+    pts, depot = make_instance(n=20, seed=4)
+    fleet = [VehicleType("Moto", 6, 80.0, 1.0), VehicleType("Van", 2, 250.0, 1.4)]
+    for method in ("swap", "inverse", "shuffle"):
+        for replacement in ("generational", "steady_state"):
+            engine = GeneticEngine(pts, depot, fleet, GAConfig(population_size=11, max_generations=3, seed=1,
+                                                               mutation_method=method, replacement=replacement))
+            engine.run()
+            assert engine.population.genes.shape == (11, 20)
+            assert (np.sort(engine.population.genes, axis=1) == np.arange(20)).all()
+
+
+def test_small_steady_state_steps_use_pairwise_crossover(monkeypatch, make_instance):
+    from index_crossover import IndexCrossover
+
+    def fail(*args, **kwargs):
+        raise AssertionError("versão em lote chamada")
+
+    for name in ("ox1_batch", "kpoint_batch", "cycle_crossover_batch", "pmx_batch", "erx_batch"):
+        monkeypatch.setattr(IndexCrossover, name, staticmethod(fail))
+
+    pts, depot = make_instance(n=20, seed=5)
+    for method in ("ox1", "kpoint", "cx", "pmx", "erx"):
+        engine = GeneticEngine(pts, depot, None, GAConfig(population_size=10, max_generations=2, seed=2,
+                                                          crossover_method=method, replacement="steady_state"))
+        engine.run()
+        assert (np.sort(engine.population.genes, axis=1) == np.arange(20)).all()
@@ -0,0 +1,57 @@
+import os
+import sys
+
+import numpy as np
+
+# ensure domain and functions are importable BEFORE imports
+root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(root, 'src', 'domain'))
+sys.path.insert(0, os.path.join(root, 'src', 'functions'))
+
+from fitness_function import FitnessFunction
+from route import Route
+from vehicle import VehicleType
+from vrp_local_search import InterRouteSearch
+
+FLEET = [VehicleType("Moto", 8, 90.0, 1.0), VehicleType("Van", 3, 250.0, 1.4)]
+
+
+def objective(search, routes, vehicles):
+    usage = [0] * len(FLEET)
+    total = 0.0
+    for r, v in zip(routes, vehicles):
+        length = search._length(r)
+        assert length <= FLEET[v].autonomy + 1e-9
+        total += length * FLEET[v].cost_per_km
+        usage[v] += 1
+    return total + search.OVERUSE_PENALTY * search._overuse(usage)
+
+
+def test_search_gain_matches_objective_and_keeps_customers(make_provider):
+    for seed in range(5):
+        provider, rng = make_provider(50, seed), np.random.default_rng(seed)
+        tour = rng.permutation(50).astype(np.int32)
+        _, splits = FitnessFunction._fleet_costs(tour[None], provider, np.zeros(50), FLEET, with_splits=True)
+        bounds, vehicles = splits[0]
+        search = InterRouteSearch(provider, FLEET)
+        routes = [tour[i:j].tolist() for i, j in zip(bounds, bounds[1:])]
+        new_routes, new_vehicles, gain = search.search(routes, list(vehicles))
+        assert sorted(c for r in new_routes for c in r) == list(range(50))
+        before, after = objective(search, routes, vehicles), objective(search, new_routes, new_vehicles)
+        assert gain > 0 and np.isclose(before - after, gain)
+
+        new_tour, _ = search.improve(tour, bounds, vehicles)
+        assert new_tour.dtype == np.int32
+        assert new_tour.tolist() == [c for r in new_routes for c in r]
+        # o split ótimo da ordem reescrita nunca é pior que as rotas encontradas
+        cost = FitnessFunction._fleet_costs(new_tour[None], provider, np.zeros(50), FLEET)[0]
+        assert cost <= after + 1e-6
+
+
+def test_relocate_merges_routes_to_respect_vehicle_count(make_provider):
+    provider = make_provider(6, 11)
+    fleet = [VehicleType("Van", 1, 1000.0, 1.0)]
+    search = InterRouteSearch(provider, fleet)
+    improved, usage = search.improve_routes([Route(provider.points[:3]), Route(provider.points[3:])])
+    assert usage == {"Van": 1} and len(improved) == 1
+    assert sorted(id(p) for p in improved[0]) == sorted(id(p) for p in provider.points)